@@ -0,0 +1,13 @@
+"""Benchmarks of round trips and latency of core pomcorn operations.
+
+Run them with:
+
+.. code-block:: bash
+
+    python -m benchmarks --output results.json
+
+Operations are measured against generated catalog page in headless Chrome
+(page is served by local server) if it's available, or in static webdriver
+otherwise. Results are written as JSON to compare them across releases.
+
+"""
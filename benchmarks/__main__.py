@@ -0,0 +1,106 @@
+"""Command line interface of benchmarks."""
+
+import argparse
+import json
+import platform
+import sys
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .drivers import chrome_webdriver, init_chrome, static_webdriver
+from .run import OPERATIONS, run_benchmarks
+
+DRIVERS = {
+    "chrome": chrome_webdriver,
+    "static": static_webdriver,
+}
+
+
+def get_pomcorn_version() -> str:
+    """Get version of installed pomcorn."""
+    try:
+        return metadata.version("pomcorn")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def get_driver_name(driver: str) -> str:
+    """Get name of driver to use, `auto` prefers available Chrome."""
+    if driver != "auto":
+        return driver
+    if (webdriver := init_chrome()) is None:
+        return "static"
+    webdriver.quit()
+    return "chrome"
+
+
+def main() -> None:
+    """Run benchmarks and write results as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--driver",
+        choices=("auto", *DRIVERS),
+        default="auto",
+        help="Webdriver to run with, `auto` uses Chrome if it's available.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Numbers of products on catalog page.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Number of measurements of each operation.",
+    )
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=list(OPERATIONS),
+        help="Operations to measure, all by default.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Path to JSON file with results, stdout by default.",
+    )
+    args = parser.parse_args()
+
+    driver = get_driver_name(args.driver)
+    webdriver_manager: AbstractContextManager[tuple[WebDriver, str]] = DRIVERS[
+        driver
+    ](args.sizes)
+    with webdriver_manager as (webdriver, app_root):
+        results = run_benchmarks(
+            webdriver,
+            app_root,
+            sizes=args.sizes,
+            repeats=args.repeats,
+            operations=args.operations,
+        )
+
+    report = json.dumps(
+        {
+            "pomcorn_version": get_pomcorn_version(),
+            "python_version": platform.python_version(),
+            "driver": driver,
+            "created_at": datetime.now(UTC).isoformat(),
+            "results": [result.to_dict() for result in results],
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report)
+    else:
+        sys.stdout.write(f"{report}\n")
+
+
+if __name__ == "__main__":
+    main()
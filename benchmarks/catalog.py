@@ -0,0 +1,65 @@
+"""Catalog page used by benchmarks and its page objects."""
+
+from pomcorn import Component, Element, ListComponent, Page, locators
+
+
+def render_catalog(size: int) -> str:
+    """Render HTML of catalog page with `size` products."""
+    products = "\n".join(
+        f"""
+        <li class="product">
+          <span class="product-title">Product {index}</span>
+          <button type="button">Add to cart</button>
+        </li>
+        """
+        for index in range(size)
+    )
+    return f"""
+    <html>
+      <head><title>Catalog</title></head>
+      <body>
+        <h1 id="title">Catalog of {size} products</h1>
+        <form>
+          <input id="search" name="q">
+          <button id="search-button" type="button">Search</button>
+        </form>
+        <ul id="products">{products}</ul>
+      </body>
+    </html>
+    """
+
+
+class Product(Component["CatalogPage"]):
+    """Product of catalog."""
+
+
+class ProductList(ListComponent[Product, "CatalogPage"]):
+    """List of catalog products."""
+
+    base_locator = locators.IdLocator("products")
+    relative_item_locator = locators.ClassLocator("product")
+
+
+# Locator of all products of catalog
+PRODUCT_LOCATOR = ProductList.base_locator // ProductList.relative_item_locator
+
+
+class CatalogPage(Page):
+    """Page with search form and list of products."""
+
+    APP_ROOT = "http://127.0.0.1/"
+
+    title = Element(locators.IdLocator("title"))
+    search_input = Element(locators.IdLocator("search"))
+    search_button = Element(locators.IdLocator("search-button"))
+
+    def check_page_is_loaded(self) -> bool:
+        """Check that list of products is displayed."""
+        return self.init_element(
+            locator=ProductList.base_locator,
+        ).is_displayed
+
+    @property
+    def products(self) -> ProductList:
+        """Get list of products."""
+        return ProductList(self)
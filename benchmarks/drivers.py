@@ -0,0 +1,95 @@
+"""Webdrivers which benchmarks are run with."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver as selenium_webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .catalog import render_catalog
+
+# Root of URLs of catalog pages in static webdriver
+STATIC_APP_ROOT = "http://catalog.test/"
+
+
+def get_catalog_path(size: int) -> str:
+    """Get relative URL of catalog page with `size` products."""
+    return f"catalog/{size}"
+
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+    """Handler which renders catalog page by its size from URL."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Respond with catalog page."""
+        _, _, size = self.path.rpartition("/")
+        if not size.isdigit():
+            self.send_error(404)
+            return
+        content = render_catalog(int(size)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Don't log requests."""
+
+
+@contextmanager
+def serve_catalog() -> Iterator[str]:
+    """Run local server of catalog pages and return its root URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CatalogRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def init_chrome() -> WebDriver | None:
+    """Start headless Chrome, return `None` if it's not available."""
+    options = selenium_webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    try:
+        return selenium_webdriver.Chrome(options)
+    except WebDriverException:
+        return None
+
+
+@contextmanager
+def chrome_webdriver(sizes: list[int]) -> Iterator[tuple[WebDriver, str]]:
+    """Prepare headless Chrome and root URL of served catalog pages.
+
+    Raises:
+        RuntimeError: If Chrome isn't available.
+
+    """
+    webdriver = init_chrome()
+    if webdriver is None:
+        raise RuntimeError("Chrome isn't available.")
+    try:
+        with serve_catalog() as app_root:
+            yield webdriver, app_root
+    finally:
+        webdriver.quit()
+
+
+@contextmanager
+def static_webdriver(sizes: list[int]) -> Iterator[tuple[WebDriver, str]]:
+    """Prepare static webdriver with catalog pages and their root URL."""
+    from pomcorn.static_driver import StaticWebDriver
+
+    pages = {
+        f"{STATIC_APP_ROOT}{get_catalog_path(size)}": render_catalog(size)
+        for size in sizes
+    }
+    yield StaticWebDriver(pages=pages), STATIC_APP_ROOT
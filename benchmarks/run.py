@@ -0,0 +1,122 @@
+"""Measurement of pomcorn operations."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pomcorn.instrumentation import CommandRecorder
+
+from .catalog import PRODUCT_LOCATOR, CatalogPage
+from .drivers import get_catalog_path
+
+# Operation accepts opened page and number of products, prepares everything
+# what shouldn't be measured and returns callable to measure
+Operation = Callable[[CatalogPage, int], Callable[[], Any]]
+
+OPERATIONS: dict[str, Operation] = {
+    "Page.open": lambda page, size: lambda: CatalogPage.open(
+        page.webdriver,
+        app_root=page.app_root,
+    ),
+    "PomcornElement.click": lambda page, size: page.search_button.click,
+    "PomcornElement.fill": lambda page, size: lambda: page.search_input.fill(
+        "product",
+    ),
+    "PomcornElement.get_text": lambda page, size: page.title.get_text,
+    "WebView.init_elements": lambda page, size: lambda: page.init_elements(
+        locator=PRODUCT_LOCATOR,
+    ),
+    "ListComponent.all": lambda page, size: lambda: page.products.all,
+    "ListComponent.count": lambda page, size: lambda: page.products.count,
+    "ListComponent.get_item_by_text": lambda page, size: lambda: (
+        page.products.get_item_by_text(f"Product {size - 1}")
+    ),
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Result of measurement of operation.
+
+    Attributes:
+        operation: Name of measured operation.
+        size: Number of products on catalog page.
+        commands: Number of WebDriver commands sent by operation.
+        commands_by_name: Number of commands by their names.
+        min_time: Min number of seconds operation took.
+        median_time: Median number of seconds operation took.
+        max_time: Max number of seconds operation took.
+
+    """
+
+    operation: str
+    size: int
+    commands: int
+    commands_by_name: dict[str, int]
+    min_time: float
+    median_time: float
+    max_time: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get result as dict to be written to JSON."""
+        return asdict(self)
+
+
+def measure(
+    webdriver: WebDriver,
+    app_root: str,
+    name: str,
+    size: int,
+    repeats: int,
+) -> BenchmarkResult:
+    """Measure operation on catalog page with `size` products.
+
+    Each repeat opens page again, so operations don't affect each other.
+
+    """
+    durations = []
+    recorder = CommandRecorder(webdriver)
+    for _ in range(repeats):
+        page = CatalogPage.open(
+            webdriver,
+            app_root=f"{app_root}{get_catalog_path(size)}",
+        )
+        operation = OPERATIONS[name](page, size)
+        recorder.reset()
+        with recorder:
+            started_at = time.perf_counter()
+            operation()
+            durations.append(time.perf_counter() - started_at)
+    return BenchmarkResult(
+        operation=name,
+        size=size,
+        commands=recorder.count,
+        commands_by_name={
+            command: stats.count
+            for command, stats in recorder.get_stats_by_command().items()
+        },
+        min_time=min(durations),
+        median_time=statistics.median(durations),
+        max_time=max(durations),
+    )
+
+
+def run_benchmarks(
+    webdriver: WebDriver,
+    app_root: str,
+    sizes: list[int],
+    repeats: int,
+    operations: list[str] | None = None,
+) -> list[BenchmarkResult]:
+    """Measure operations for each size of catalog."""
+    return [
+        measure(webdriver, app_root, name, size, repeats)
+        for name in operations or OPERATIONS
+        for size in sizes
+    ]
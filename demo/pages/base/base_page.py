@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from pomcorn import Page, locators
+from pomcorn import Page, WaitPolicy, locators
 
 if TYPE_CHECKING:
     from demo.pages import IndexPage
@@ -24,21 +24,17 @@ class PyPIPage(Page):
     # specify the base domain of your app here.
     APP_ROOT = "https://pypi.org/"
 
+    # Settings of waits for all pages and their components. It has default
+    # value, so you can delete/specify it.
+    wait_policy = WaitPolicy(timeout=10, poll_frequency=0.01)
+
     def __init__(
         self,
         webdriver: WebDriver,
         *,
         app_root: str | None = None,
-        # Next arguments have default values, so you can delete/specify them.
-        wait_timeout: float = 10,
-        poll_frequency: float = 0.01,
     ):
-        super().__init__(
-            webdriver,
-            app_root=app_root,
-            wait_timeout=wait_timeout,
-            poll_frequency=poll_frequency,
-        )
+        super().__init__(webdriver, app_root=app_root)
 
         # The Logo will be on all the pages of the application so we initialize
         # it in base page class.
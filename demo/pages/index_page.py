@@ -1,26 +1,13 @@
-from selenium.webdriver.remote.webdriver import WebDriver
-
 from demo.pages.base import PyPIPage
 from demo.pages.common import Search
+from pomcorn import WaitPolicy
 
 
 class IndexPage(PyPIPage):
     """Represent the index page."""
 
-    def __init__(
-        self,
-        webdriver: WebDriver,
-        *,
-        app_root: str | None = None,
-        wait_timeout: int = 5,
-        poll_frequency: float = 0.01,
-    ):
-        super().__init__(
-            webdriver,
-            app_root=app_root,
-            wait_timeout=wait_timeout,
-            poll_frequency=poll_frequency,
-        )
+    # Index page loads faster than others, so it waits less
+    wait_policy = WaitPolicy(timeout=5, poll_frequency=0.01)
 
     @property
     def search(self) -> Search:
@@ -2,6 +2,7 @@ from pomcorn.component import Component, ListComponent
 from pomcorn.descriptors import Element
 from pomcorn.element import XPathElement
 from pomcorn.page import Page
+from pomcorn.wait_policy import WaitPolicy
 from pomcorn.web_view import WebView
 
 __all__ = (
@@ -9,6 +10,7 @@ __all__ = (
     "Element",
     "ListComponent",
     "Page",
+    "WaitPolicy",
     "WebView",
     "XPathElement",
 )
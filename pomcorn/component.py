@@ -1,7 +1,11 @@
+import time
 import typing
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from inspect import isclass
 from typing import (
     Any,
+    ClassVar,
     Generic,
     Literal,
     TypeVar,
@@ -10,12 +14,19 @@ from typing import (
     overload,
 )
 
-from . import locators
-from .element import XPathElement
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from . import locators, scripts
+from .element import ScopedElement, XPathElement
+from .extraction import Column, Schema, get_columns
 from .page import Page
+from .polling import ExponentialPolling, PollingStrategy
+from .tracing import traced
 from .web_view import WebView
 
 TPage = TypeVar("TPage", bound=Page)
+TRow = TypeVar("TRow")
 
 
 class _EmptyValue:
@@ -38,15 +49,25 @@ class Component(Generic[TPage], WebView):
 
     Implement wait methods until the component becomes visible or invisible.
 
+    Set `scoped_lookups` attribute to `True` to look for elements initialized
+    by `relative_locator` inside found body of component instead of the
+    whole page. Body is found once and found again only if it becomes stale,
+    so cost of lookups depends on size of component instead of page (it's
+    useful for items of long lists, e.g. ``(//ul//li)[37]//a``).
+
     """
 
     base_locator: locators.XPathLocator
 
+    scoped_lookups: bool = False
+
+    @traced("component", name="init")
     def __init__(
         self,
         page: TPage,
         base_locator: locators.XPathLocator | None = None,
         wait_until_visible: bool = True,
+        scoped_lookups: bool | None = None,
     ):
         """Initialize component.
 
@@ -56,26 +77,51 @@ class Component(Generic[TPage], WebView):
                 browser. Used in relative element initialization methods and
                 visibility waits. You also can specify it as attribute.
             wait_until_visible: Whether to wait for the component to become
-                visible before completing initialization or not.
+                visible before completing initialization or not. Elements
+                are prefetched after waiting if `prefetch_elements` is
+                enabled.
+            scoped_lookups: Whether to look for elements inside found body of
+                component or not. By default, `scoped_lookups` attribute of
+                class is used.
+
+        Component uses wait policy of the page, so it waits with the same
+        settings and shares the same default wait with the page.
 
         """
         super().__init__(
             page.webdriver,
             app_root=page.app_root,
-            wait_timeout=page.wait._timeout,
+            wait_policy=page.wait_policy,
         )
         self.page = page
         self.base_locator = base_locator or self.base_locator
-        self.body = self.init_element(locator=self.base_locator)
+        if scoped_lookups is not None:
+            self.scoped_lookups = scoped_lookups
+        self.body = self.init_element(
+            locator=self.base_locator,
+            cache=self.scoped_lookups,
+        )
 
         if wait_until_visible:
             self.wait_until_visible()
+            if self.prefetch_elements:
+                self.prefetch()
+
+    def mark_dom_changed(self):
+        """Mark that page of component could be changed.
+
+        Elements of component belong to its page, so version of page is
+        changed.
+
+        """
+        self.page.mark_dom_changed()
 
     @overload
     def init_element(
         self,
         *,
         locator: locators.XPathLocator,
+        cache: bool = False,
     ) -> XPathElement: ...
 
     @overload
@@ -83,6 +129,7 @@ class Component(Generic[TPage], WebView):
         self,
         *,
         relative_locator: locators.XPathLocator,
+        cache: bool = False,
     ) -> XPathElement: ...
 
     def init_element(
@@ -90,22 +137,38 @@ class Component(Generic[TPage], WebView):
         *,
         relative_locator: locators.XPathLocator | None = None,
         locator: locators.XPathLocator | None = None,
+        cache: bool = False,
     ) -> XPathElement:
         """Initialize element including base locator.
 
         Use `relative_locator` if you need to include `base_locator`, otherwise
         use `locator`.
 
+        Use `cache` if element should reuse found WebElement in subsequent
+        actions.
+
+        If `scoped_lookups` is enabled, element initialized by
+        `relative_locator` is looked for inside body of component.
+
         Raises:
             ValueError: If both arguments were passed or neither.
 
         """
-        return self.page.init_element(
-            locator=self._prepare_locator(
-                locator=locator,
-                relative_locator=relative_locator,
-            ),
+        locator = self._prepare_locator(
+            locator=locator,
+            relative_locator=relative_locator,
         )
+        if relative_locator and self.scoped_lookups:
+            search_args = relative_locator.get_scoped_search_args()
+            if search_args is not None:
+                return ScopedElement(
+                    web_view=self.page,
+                    locator=locator,
+                    scope=self.body,
+                    search_args=search_args,
+                    cache=cache,
+                )
+        return self.page.init_element(locator=locator, cache=cache)
 
     @overload
     def init_elements(
@@ -174,25 +237,37 @@ class Component(Generic[TPage], WebView):
             return locator
         return self.base_locator // relative_locator
 
-    def wait_until_visible(self, timeout: float | None = None, **kwargs):
+    @traced("wait")
+    def wait_until_visible(
+        self,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+        **kwargs,
+    ):
         """Wait until component becomes visible.
 
         By default, method waits for `self.wait._timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         """
-        self.body.wait_until_visible(timeout)
+        self.body.wait_until_visible(timeout, polling)
 
-    def wait_until_invisible(self, timeout: float | None = None, **kwargs):
+    @traced("wait")
+    def wait_until_invisible(
+        self,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+        **kwargs,
+    ):
         """Wait until component becomes invisible.
 
         By default, method waits for `self.wait._timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         """
-        self.body.wait_until_invisible(timeout)
+        self.body.wait_until_invisible(timeout, polling)
 
 
 # Here type ignore added because we can't specify TPage as generic for
@@ -208,11 +283,22 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
 
     * count
     * all
+    * items (lazy view of items, see ``ListItems``)
+    * filter() and where()
+    * extract() and extract_columns()
+    * stream() (items of infinite-scroll and virtualized lists)
     * get_item_by_text()
 
     Waits for `base_item_locator` property  to be overridden or one of the
     attributes (`item_locator` or `relative_item_locator`) to be specified.
 
+    Set `use_items_snapshot` attribute to `True` to get all items via single
+    script call: items will be bound to found WebElements and won't wait
+    for their visibility (only items that are not visible yet will wait).
+
+    Set `extraction_schema` attribute to declare fields extracted from items
+    by `extract` and `extract_columns` (see ``pomcorn.extraction``).
+
     """
 
     _item_class: type[ListItemType] = EmptyValue
@@ -220,6 +306,10 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
     item_locator: locators.XPathLocator | None = None
     relative_item_locator: locators.XPathLocator | None = None
 
+    use_items_snapshot: bool = False
+
+    extraction_schema: ClassVar[Schema | None] = None
+
     def __class_getitem__(cls, item: tuple[type, ...]) -> Any:
         """Create parameterized versions of generic classes.
 
@@ -245,6 +335,7 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
         page: TPage,
         base_locator: locators.XPathLocator | None = None,
         wait_until_visible: bool = True,
+        scoped_lookups: bool | None = None,
     ) -> None:
         # If `_item_class` was not specified in `__init_subclass__`, this means
         # that `ListComponent` is used as a parameterized type
@@ -255,7 +346,12 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
             first_generic_param = self.__generic_parameters__[0]
             if self.is_valid_item_class(first_generic_param):
                 self._item_class = first_generic_param
-        super().__init__(page, base_locator, wait_until_visible)
+        super().__init__(
+            page,
+            base_locator,
+            wait_until_visible,
+            scoped_lookups,
+        )
 
     def __init_subclass__(cls) -> None:
         """Run logic for getting/overriding item_class attr for subclasses."""
@@ -307,11 +403,40 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
     @property
     def count(self) -> int:
         """Get count of list items."""
-        return len(self._get_elements(self.base_item_locator))
+        return self._count_elements(self.base_item_locator)
+
+    @property
+    def items(self) -> "ListItems[ListItemType]":
+        """Get lazy view of list items.
+
+        Unlike `all`, items aren't initialized until they are accessed, and
+        slices are narrowed in the browser by XPath positions:
+
+        .. code-block:: python
+
+            results.items[0]  # `(//li)[1]`
+            results.items[-1]  # `(//li)[last()]`
+            results.items[10:20]  # `(//li)[position() >= 11 and ...]`
+
+        """
+        return ListItems(self, self.base_item_locator)
 
     @property
     def all(self) -> list[ListItemType]:
+        """Get all items of list.
+
+        If `budget` of wait policy is specified, all waits of items
+        initialization take no more than budget in total.
+
+        """
+        with self.wait_policy.budget_deadline():
+            return self._get_all_items()
+
+    def _get_all_items(self) -> list[ListItemType]:
         """Get all items of list."""
+        if self.use_items_snapshot:
+            return self._get_items_from_snapshot()
+
         # Sometimes `base_item_locator` exists in dom but is not visible
         # and method returns an empty list. That's why we add waiting for this
         if (
@@ -326,6 +451,36 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
             )
         return items
 
+    def _get_items_from_snapshot(self) -> list[ListItemType]:
+        """Get all items of list found via single script call.
+
+        Each item is bound to the found WebElement, so it doesn't look for its
+        body again. Visibility is waited only for items that were not visible
+        at the moment of snapshot.
+
+        As well as without snapshot, if items exist in dom but aren't visible
+        yet, wait until they become visible and take snapshot again, because
+        more items may appear meanwhile.
+
+        """
+        items: list[ListItemType] = []
+        snapshot = self._get_elements_snapshot(self.base_item_locator)
+        if snapshot and not snapshot[0][1]:
+            base_item = self.init_element(locator=self.base_item_locator)
+            base_item.wait_until_visible()
+            snapshot = self._get_elements_snapshot(self.base_item_locator)
+        for index, (web_element, is_visible) in enumerate(snapshot):
+            item = self._item_class(
+                page=self.page,
+                base_locator=self.base_item_locator[index],
+                wait_until_visible=False,
+            )
+            item.body.bind(web_element)
+            if not is_visible:
+                item.wait_until_visible()
+            items.append(item)
+        return items
+
     @classmethod
     def get_list_item_class(cls) -> type[ListItemType] | None:
         """Return class passed in `Generic[ListItemType]`."""
@@ -361,6 +516,210 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
 
         return False
 
+    def filter(
+        self,
+        *,
+        text: str | None = None,
+        exact: bool = False,
+        text_starts_with: str | None = None,
+        attributes: Mapping[str, str | bool] | None = None,
+        has: locators.XPathLocator | None = None,
+        visible: bool | None = None,
+    ) -> "ListItems[ListItemType]":
+        """Get lazy view of items matching conditions.
+
+        Shortcut for ``self.items.filter(...)``, see ``ListItems.filter``.
+
+        .. code-block:: python
+
+            # Example
+            results.filter(
+                has=locators.ClassLocator("name"),
+                text_starts_with="django",
+            )
+
+        """
+        return self.items.filter(
+            text=text,
+            exact=exact,
+            text_starts_with=text_starts_with,
+            attributes=attributes,
+            has=has,
+            visible=visible,
+        )
+
+    def where(
+        self,
+        *conditions: str | locators.XPathLocator,
+    ) -> "ListItems[ListItemType]":
+        """Get lazy view of items matching XPath conditions.
+
+        Shortcut for ``self.items.where(...)``, see ``ListItems.where``.
+
+        """
+        return self.items.where(*conditions)
+
+    def extract_columns(
+        self,
+        schema: Schema | None = None,
+    ) -> dict[str, list[str | None]]:
+        """Extract values of fields of all items via single script call.
+
+        Shortcut for ``self.items.extract_columns(...)``, see
+        ``ListItems.extract_columns``.
+
+        """
+        return self.items.extract_columns(schema)
+
+    @overload
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: None = None,
+    ) -> list[tuple[str | None, ...]]: ...
+
+    @overload
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: Callable[..., TRow],
+    ) -> list[TRow]: ...
+
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: Callable[..., TRow] | None = None,
+    ) -> list[tuple[str | None, ...]] | list[TRow]:
+        """Extract rows of fields of all items via single script call.
+
+        Shortcut for ``self.items.extract(...)``, see ``ListItems.extract``.
+
+        """
+        return self.items.extract(schema, into=into)
+
+    def stream(
+        self,
+        key: Column | locators.XPathLocator | None = None,
+        quiet_period: float = 1,
+        max_keys: int = 10_000,
+    ) -> Iterator[ListItemType]:
+        """Yield items as they appear while list is scrolled.
+
+        It's intended for lists with infinite loading or virtual scrolling,
+        when not all items are present in DOM at once. Items are found with
+        keys via single script call, new items are yielded and then list is
+        scrolled to its last item to load more. Items are compared by keys,
+        so item isn't yielded again if it's re-rendered or still present
+        after scroll. Delays between checks are defined by polling strategy
+        of wait policy, by default they grow exponentially from
+        `poll_frequency` until new items appear.
+
+        Yielded items are bound to found WebElements and don't wait for their
+        visibility. Their elements are looked for inside their bodies, and
+        body is found again by key (not by position, which changes while
+        list is scrolled) if it becomes stale. Generator doesn't keep items,
+        only up to `max_keys` last keys, so memory is bounded regardless of
+        length of list.
+
+        .. code-block:: python
+
+            # Example
+            for post in feed.stream(key=Column(attribute="data-id")):
+                ...
+
+        Args:
+            key: Column whose value identifies item (see
+                ``pomcorn.extraction.Column``), by default text of item is
+                used. Items without key (e.g. placeholders which are not
+                rendered yet) are skipped until key appears.
+            quiet_period: Number of seconds without new items after which
+                the list is considered to be finished.
+            max_keys: Max number of remembered keys of yielded items. Item
+                can be yielded again if its key was forgotten.
+
+        """
+        key_column = get_columns({"key": key or Column()})["key"]
+        script_args = (
+            *scripts.get_script_locator(self.base_item_locator),
+            key_column.get_script_args(),
+        )
+        # Each check scrolls the list, so checks are made more rarely while
+        # there are no new items
+        polling = self.wait_policy.polling or ExponentialPolling(
+            first_delay=self.poll_frequency,
+        )
+        delays = polling.get_delays()
+        # Ordered dict is used as set with the order of insertion
+        seen_keys: OrderedDict[str, None] = OrderedDict()
+        last_item_at = time.monotonic()
+        while True:
+            snapshot = self.webdriver.execute_script(
+                scripts.KEYED_ELEMENTS,
+                *script_args,
+            )
+            has_new_items = False
+            for index, (web_element, item_key) in enumerate(snapshot):
+                if item_key is None or item_key in seen_keys:
+                    continue
+                seen_keys[item_key] = None
+                if len(seen_keys) > max_keys:
+                    seen_keys.popitem(last=False)
+                has_new_items = True
+                yield self._get_streamed_item(
+                    web_element,
+                    index=index,
+                    key_condition=key_column.get_item_condition(item_key),
+                )
+
+            if has_new_items:
+                last_item_at = time.monotonic()
+                delays = polling.get_delays()
+            remaining_time = quiet_period - (time.monotonic() - last_item_at)
+            if remaining_time <= 0:
+                return
+            self._scroll_to_last_item(snapshot)
+            time.sleep(min(next(delays), remaining_time))
+
+    def _get_streamed_item(
+        self,
+        web_element: WebElement,
+        index: int,
+        key_condition: str | None,
+    ) -> ListItemType:
+        """Get item of stream bound to found WebElement.
+
+        Elements of item are looked for inside its body, and body is found
+        again by key if it becomes stale, because position of item changes
+        while virtualized list is scrolled. Position is used only if key
+        can't be checked by XPath.
+
+        """
+        base_locator = self.base_item_locator[
+            index if key_condition is None else key_condition
+        ]
+        item = self._item_class(
+            page=self.page,
+            base_locator=base_locator,
+            wait_until_visible=False,
+            scoped_lookups=True,
+        )
+        item.body.bind(web_element)
+        return item
+
+    def _scroll_to_last_item(self, snapshot: list[list[Any]]) -> None:
+        """Scroll to the last found item to load the next ones."""
+        if not snapshot:
+            self.scroll_to_bottom()
+            return
+        try:
+            self.scroll_to(snapshot[-1][0])
+        except StaleElementReferenceException:
+            # List was re-rendered, next snapshot will find its items
+            self.scroll_to_bottom()
+
     def get_item_by_text(self, text: str, exact: bool = False) -> ListItemType:
         """Get list item by text."""
         locator = self.base_item_locator.contains(
@@ -370,16 +729,325 @@ class ListComponent(Generic[ListItemType, TPage], Component[TPage]):
         return self._item_class(page=self.page, base_locator=locator)
 
     def __repr__(self) -> str:
+        # Items aren't included, so representation doesn't query the browser
         return (
             "ListComponent("
             f"component={self.__class__}, "
             f"item_class={self._item_class}, "
             f"base_item_locator={self.base_item_locator}, "
-            f"count={self.count}, "
-            f"items={self.all}, "
             f"page={self.page}"
             ")"
         )
 
     def __str__(self) -> str:
         return f"{self.all}"
+
+
+# Item isn't hidden by markup: by attribute or inline style of item or its
+# ancestors
+_VISIBLE_CONDITION = (
+    "not(ancestor-or-self::*["
+    '@hidden or contains(translate(@style, " ", ""), "display:none") '
+    'or contains(translate(@style, " ", ""), "visibility:hidden")'
+    "])"
+)
+
+
+class ListItems(Sequence[ListItemType]):
+    """Lazy sequence of items of ``ListComponent``.
+
+    Items are initialized only when they are accessed, so ``items[3]`` costs
+    the same lookups as init of single item regardless of length of list.
+    Slices are views too, they are narrowed by XPath position predicates
+    applied to locator of items.
+
+    `len()` looks for all matching elements in the browser each time it's
+    called. Indexes aren't checked against length of list: item which is
+    out of range fails to become visible on initialization.
+
+    """
+
+    def __init__(
+        self,
+        list_component: ListComponent[ListItemType, Any],
+        locator: locators.XPathLocator,
+    ):
+        """Initialize view of items.
+
+        Args:
+            list_component: List which items are viewed.
+            locator: Locator matching all items of the view.
+
+        """
+        self.list_component = list_component
+        self.locator = locator
+
+    def __len__(self) -> int:
+        """Get count of items matching locator in the browser."""
+        return self.list_component._count_elements(self.locator)
+
+    @overload
+    def __getitem__(self, index: int) -> ListItemType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ListItems[ListItemType]": ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> "ListItems[ListItemType] | ListItemType":
+        """Get item by index or view of items by slice.
+
+        Raises:
+            ValueError: If slice has not positive step.
+
+        """
+        if isinstance(index, slice):
+            return ListItems(self.list_component, self._get_slice(index))
+        return self.list_component._item_class(
+            page=self.list_component.page,
+            base_locator=self.locator[index],
+        )
+
+    def __iter__(self) -> Iterator[ListItemType]:
+        """Iterate over items found at the moment of call."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def filter(
+        self,
+        *,
+        text: str | None = None,
+        exact: bool = False,
+        text_starts_with: str | None = None,
+        attributes: Mapping[str, str | bool] | None = None,
+        has: locators.XPathLocator | None = None,
+        visible: bool | None = None,
+    ) -> "ListItems[ListItemType]":
+        """Get view of items matching all passed conditions.
+
+        Conditions are compiled into XPath predicate of items locator, so
+        items are matched and counted in the browser and only matching ones
+        are initialized.
+
+        Args:
+            text: Text which item should contain.
+            exact: Whether text of item should be equal to `text`, like in
+                ``XPathLocator.contains``.
+            text_starts_with: Text which normalized text of item (without
+                leading and trailing whitespaces) should start with.
+            attributes: Attributes of item: value should be equal to the
+                string, `True` means that attribute is present and `False`
+                that it's absent.
+            has: Child relative locator, item should contain element matching
+                it. Conditions on text of child can be added to locator
+                itself (e.g. ``locator.contains("text")``).
+            visible: Whether item should be visible or not. Visibility is
+                checked by markup only: `hidden` attribute and inline
+                `display: none` or `visibility: hidden` styles of item and its
+                ancestors (styles from stylesheets aren't taken into account).
+
+        Raises:
+            ValueError: If `has` locator can't be evaluated relative to item
+                (e.g. it's union or starts with grouping).
+
+        """
+        escape = locators.XPathLocator._escape_quotes
+        conditions: list[str | locators.XPathLocator] = []
+        if text is not None:
+            conditions.append(
+                f"./text()={escape(text)}"
+                if exact
+                else f"contains(., {escape(text)})",
+            )
+        if text_starts_with is not None:
+            conditions.append(
+                f"starts-with(normalize-space(.), {escape(text_starts_with)})",
+            )
+        for name, value in (attributes or {}).items():
+            if value is True:
+                conditions.append(f"@{name}")
+            elif value is False:
+                conditions.append(f"not(@{name})")
+            else:
+                conditions.append(f"@{name}={escape(value)}")
+        if has is not None:
+            conditions.append(has)
+        if visible is not None:
+            conditions.append(
+                _VISIBLE_CONDITION
+                if visible
+                else f"not({_VISIBLE_CONDITION})",
+            )
+        return self.where(*conditions)
+
+    def where(
+        self,
+        *conditions: str | locators.XPathLocator,
+    ) -> "ListItems[ListItemType]":
+        """Get view of items matching all XPath conditions.
+
+        .. code-block:: python
+
+            # Example
+            results.where(
+                '@data-status="active"',
+                locators.ClassLocator("badge"),
+            )
+
+        Args:
+            *conditions: XPath predicates evaluated for each item (e.g.
+                ``@data-status="active"``) or child relative locators (item
+                should contain element matching locator).
+
+        Raises:
+            ValueError: If child locator can't be evaluated relative to item
+                (e.g. it's union or starts with grouping).
+
+        """
+        if not conditions:
+            return self
+        # Each predicate is wrapped to not mix operators of one condition
+        # with `and` joining conditions, redundant parentheses are dropped
+        # by canonicalization of locator
+        predicates = " and ".join(
+            f"({self._get_predicate(condition)})" for condition in conditions
+        )
+        return ListItems(self.list_component, self.locator[predicates])
+
+    @staticmethod
+    def _get_predicate(condition: str | locators.XPathLocator) -> str:
+        """Get XPath predicate of condition of ``where`` method.
+
+        Raises:
+            ValueError: If child locator can't be evaluated relative to item
+                (e.g. it's union or starts with grouping).
+
+        """
+        if not isinstance(condition, locators.XPathLocator):
+            return condition
+        if not condition or condition.related_query.startswith("("):
+            raise ValueError(
+                f"Locator `{condition}` can't be used as condition, because "
+                "it can't be evaluated relative to list item. Use string "
+                "condition instead, e.g. `.//a or .//b` for union.",
+            )
+        return f".//{condition.related_query}"
+
+    def extract_columns(
+        self,
+        schema: Schema | None = None,
+    ) -> dict[str, list[str | None]]:
+        """Extract values of fields of all items via single script call.
+
+        Args:
+            schema: Mapping of names of fields to columns (see
+                ``pomcorn.extraction``), by default `extraction_schema` of
+                list is used.
+
+        Returns:
+            Mapping of names of fields to their values in all items.
+
+        Raises:
+            ValueError: If schema isn't passed and list has no
+                `extraction_schema` or locator of column can't be evaluated
+                relative to item.
+
+        """
+        schema = schema or self.list_component.extraction_schema
+        if not schema:
+            raise ValueError(
+                "You need to pass `schema` or specify `extraction_schema` "
+                "attribute of list.",
+            )
+        columns = get_columns(schema)
+        values = self.list_component.webdriver.execute_script(
+            scripts.EXTRACT_COLUMNS,
+            *scripts.get_script_locator(self.locator),
+            [column.get_script_args() for column in columns.values()],
+        )
+        return dict(zip(columns, values, strict=True))
+
+    @overload
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: None = None,
+    ) -> list[tuple[str | None, ...]]: ...
+
+    @overload
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: Callable[..., TRow],
+    ) -> list[TRow]: ...
+
+    def extract(
+        self,
+        schema: Schema | None = None,
+        *,
+        into: Callable[..., TRow] | None = None,
+    ) -> list[tuple[str | None, ...]] | list[TRow]:
+        """Extract rows of fields of all items via single script call.
+
+        .. code-block:: python
+
+            # Example
+            rows = results.extract({"name": name_locator}, into=PackageRow)
+
+        Args:
+            schema: Mapping of names of fields to columns, by default
+                `extraction_schema` of list is used.
+            into: Callable which accepts values of fields of item as keyword
+                arguments (e.g. dataclass). By default, rows are tuples of
+                values in order of fields of schema.
+
+        """
+        columns = self.extract_columns(schema)
+        rows = list(zip(*columns.values(), strict=True))
+        if into is None:
+            return rows
+        return [into(**dict(zip(columns, row, strict=True))) for row in rows]
+
+    def _get_slice(self, index: slice) -> locators.XPathLocator:
+        """Get locator of items in slice.
+
+        Raises:
+            ValueError: If slice has not positive step.
+
+        """
+        step = 1 if index.step is None else index.step
+        if step < 1:
+            raise ValueError("Only positive step of slice is supported.")
+
+        conditions = []
+        if index.start:
+            start = self._get_position(index.start)
+            conditions.append(f"position() >= {start}")
+        if index.stop is not None:
+            conditions.append(
+                f"position() < {self._get_position(index.stop)}",
+            )
+        if step > 1:
+            start = self._get_position(index.start or 0)
+            if not start.isdigit():
+                start = f"({start})"
+            conditions.append(f"(position() - {start}) mod {step} = 0")
+        if not conditions:
+            return self.locator
+        return self.locator[" and ".join(conditions)]
+
+    @staticmethod
+    def _get_position(index: int) -> str:
+        """Get XPath position of item by index of Python sequence."""
+        if index >= 0:
+            # Numeration in xpath starts with 1
+            return str(index + 1)
+        if index == -1:
+            return "last()"
+        return f"last() - {abs(index + 1)}"
+
+    def __repr__(self) -> str:
+        return f"ListItems(locator={self.locator})"
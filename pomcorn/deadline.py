@@ -0,0 +1,58 @@
+"""Module with deadline of waits.
+
+Each wait has its own timeout, so nested waits (e.g. page load check which
+initializes components which wait for their elements) can take many
+timeouts in total. Deadline limits total time of all waits inside the block:
+each wait takes no more than the time remaining until the deadline.
+
+Example:
+  # Page load and all waits of its components take no more than 10 seconds
+  with deadline(10):
+      page = MainPage.open(webdriver)
+
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Monotonic time of the nearest deadline of the current context
+_deadline_time: ContextVar[float | None] = ContextVar(
+    "pomcorn_deadline_time",
+    default=None,
+)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Limit total time of all waits inside the block.
+
+    Nested deadline can't extend the outer one: if it's later than the outer
+    deadline, the outer one is used.
+
+    Args:
+        timeout: Number of seconds all waits inside the block can take.
+
+    """
+    deadline_time = time.monotonic() + timeout
+    if (outer_deadline_time := _deadline_time.get()) is not None:
+        deadline_time = min(deadline_time, outer_deadline_time)
+
+    token = _deadline_time.set(deadline_time)
+    try:
+        yield
+    finally:
+        _deadline_time.reset(token)
+
+
+def get_remaining_time() -> float | None:
+    """Get number of seconds remaining until the current deadline.
+
+    Return `None` if there is no deadline and negative number if deadline
+    is passed.
+
+    """
+    if (deadline_time := _deadline_time.get()) is None:
+        return None
+    return deadline_time - time.monotonic()
@@ -27,6 +27,8 @@ class Element:
     def __init__(
         self,
         locator: locators.XPathLocator | None = None,
+        *,
+        cache: bool = False,
     ) -> None: ...
 
     @overload
@@ -34,6 +36,7 @@ class Element:
         self,
         *,
         relative_locator: locators.XPathLocator | None = None,
+        cache: bool = False,
     ) -> None: ...
 
     def __init__(
@@ -41,6 +44,7 @@ class Element:
         locator: locators.XPathLocator | None = None,
         *,
         relative_locator: locators.XPathLocator | None = None,
+        cache: bool = False,
     ) -> None:
         """Initialize descriptor.
 
@@ -51,9 +55,13 @@ class Element:
         ``relative_locator`` is not needed, since element will be searched
         across the entire page, not within some component.
 
+        Use `cache` if element should reuse found WebElement in subsequent
+        actions instead of looking for it each time.
+
         """
         self.locator = locator
         self.relative_locator = relative_locator
+        self.cache = cache
 
     def __set_name__(self, _owner: type, name: str) -> None:
         """Save attribute name for which descriptor is created."""
@@ -91,9 +99,17 @@ class Element:
         if cached_element := cache.get(self.attribute_name):
             return cached_element
 
-        element = instance.init_element(
-            locator=self._prepare_locator(instance),
-        )
+        from pomcorn import Component
+
+        locator = self._prepare_locator(instance)
+        if self.relative_locator and isinstance(instance, Component):
+            # Component can look for element inside its body
+            element = instance.init_element(
+                relative_locator=self.relative_locator,
+                cache=self.cache,
+            )
+        else:
+            element = instance.init_element(locator=locator, cache=self.cache)
         cache[self.attribute_name] = element
 
         return element
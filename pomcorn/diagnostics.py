@@ -0,0 +1,86 @@
+"""Module with diagnostics of failed waits.
+
+Diagnostics (current URL, DOM excerpt and screenshot) require requests to the
+browser, so they are collected only when wait times out.
+
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pomcorn import locators, scripts
+
+
+@dataclass(frozen=True)
+class WaitDiagnostics:
+    """Settings of diagnostics added to message of timed out wait.
+
+    Attributes:
+        include_url: Whether to add current URL of browser or not.
+        dom_excerpt_length: Max number of characters of HTML of waited
+            element (or page body if element isn't found) to add. HTML isn't
+            added if it's `0` (default).
+        screenshots_dir: Directory to save screenshot of the page to. Path to
+            screenshot is added to message. Screenshot isn't saved if it's
+            `None` (default).
+
+    """
+
+    include_url: bool = True
+    dom_excerpt_length: int = 0
+    screenshots_dir: Path | None = None
+
+    def format_message(
+        self,
+        message: str,
+        webdriver: WebDriver,
+        locator: locators.Locator | None = None,
+    ) -> str:
+        """Add diagnostics to message of timed out wait.
+
+        Diagnostics are collected on a best-effort basis: if browser can't
+        provide some of them (e.g. it's closed), they are skipped.
+
+        Args:
+            message: Message of timed out wait.
+            webdriver: Instance of a class for managing the browser.
+            locator: Locator of waited element, if wait is for element.
+
+        """
+        details = [message]
+        if self.include_url:
+            with suppress(WebDriverException):
+                details.append(f"Current URL: `{webdriver.current_url}`.")
+        if self.dom_excerpt_length:
+            with suppress(WebDriverException, ValueError):
+                excerpt = self._get_dom_excerpt(webdriver, locator)
+                details.append(f"DOM excerpt: `{excerpt}`.")
+        if self.screenshots_dir:
+            path = self.screenshots_dir / f"wait-{uuid.uuid4().hex}.png"
+            with suppress(WebDriverException):
+                if webdriver.save_screenshot(str(path)):
+                    details.append(f"Screenshot: `{path}`.")
+        return "\n".join(details)
+
+    def _get_dom_excerpt(
+        self,
+        webdriver: WebDriver,
+        locator: locators.Locator | None,
+    ) -> str:
+        """Get beginning of HTML of element or page body."""
+        by, query = (
+            scripts.get_script_locator(locator) if locator else (None, None)
+        )
+        return webdriver.execute_script(
+            scripts.DOM_EXCERPT,
+            by,
+            query,
+            self.dom_excerpt_length,
+        )
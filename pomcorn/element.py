@@ -1,19 +1,43 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING, Generic
-
-from selenium.common.exceptions import StaleElementReferenceException
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 
 from pomcorn import locators
+from pomcorn.polling import PollingStrategy, is_waiting
+from pomcorn.tracing import traced
 
 if TYPE_CHECKING:
     from pomcorn.web_view import WebView
 
+TResult = TypeVar("TResult")
+
+
+@dataclass(frozen=True)
+class PrefetchedState:
+    """State of element fetched in bulk by ``WebView.prefetch``.
+
+    State is valid until page is changed, i.e. while `dom_version` equals
+    to the one of web view.
+
+    """
+
+    dom_version: int
+    web_element: WebElement | None
+    is_displayed: bool
+    text: str | None
+
 
 class PomcornElement(Generic[locators.TLocator]):
     """The class to represent a simple element (tag) on the page.
@@ -22,23 +46,115 @@ class PomcornElement(Generic[locators.TLocator]):
 
     """
 
-    def __init__(self, web_view: WebView, locator: locators.TLocator):
+    def __init__(
+        self,
+        web_view: WebView,
+        locator: locators.TLocator,
+        cache: bool = False,
+    ):
         """Init page element.
 
         Args:
             web_view: Instance of a webview.
             locator: Instance of a class to locate the element in the browser.
+            cache: Whether to reuse found selenium instance(WebElement) of
+                element in subsequent actions or not (default `False`). If
+                cached instance becomes stale, element will be found again.
 
         """
         self.web_view = web_view
         self.locator = locator
+        self.cache = cache
+        self._web_element: WebElement | None = None
+        self._prefetched: PrefetchedState | None = None
+
+    def bind(self, web_element: WebElement):
+        """Bind element to already found selenium instance(WebElement).
+
+        Bound element doesn't look for itself in the browser and doesn't wait
+        for its visibility in ``get_element``, the passed WebElement is used
+        instead. It's useful when elements were found in bulk (e.g. by
+        ``ListComponent`` via single script call).
+
+        Args:
+            web_element: Selenium instance of element matching `self.locator`.
+
+        """
+        self._web_element = web_element
+
+    def reset_cache(self):
+        """Forget found selenium instance(WebElement) of element.
 
-    def wait_until_visible(self, timeout: float | None = None):
+        The next action will look for the element in the browser again.
+
+        """
+        self._web_element = None
+        self._prefetched = None
+
+    def prefetch(
+        self,
+        web_element: WebElement | None,
+        is_displayed: bool,
+        text: str | None,
+    ):
+        """Remember state of element fetched in bulk.
+
+        Until page is changed (see ``WebView.mark_dom_changed``), passed
+        WebElement is used instead of looking for element, and `is_displayed`,
+        `exists_in_dom` and `get_text` return passed values without requests
+        to the browser, except when they are called to check wait condition.
+
+        Args:
+            web_element: Selenium instance of element matching `self.locator`
+                or `None` if element isn't present.
+            is_displayed: Whether element is visible.
+            text: Visible text of element or `None` if element isn't visible.
+
+        """
+        self._prefetched = PrefetchedState(
+            dom_version=self.web_view.dom_version,
+            web_element=web_element,
+            is_displayed=is_displayed,
+            text=text,
+        )
+
+    def _get_prefetched(self) -> PrefetchedState | None:
+        """Get prefetched state of element if page wasn't changed since.
+
+        Prefetched state is never used to check wait conditions, because they
+        are polled until page changes by itself.
+
+        """
+        if (
+            self._prefetched is None
+            or is_waiting()
+            or self._prefetched.dom_version != self.web_view.dom_version
+        ):
+            return None
+        return self._prefetched
+
+    def _get_prefetched_element(
+        self,
+        only_visible: bool = True,
+    ) -> WebElement | None:
+        """Get prefetched WebElement if it can be used for action."""
+        prefetched = self._get_prefetched()
+        if prefetched is None or (
+            only_visible and not prefetched.is_displayed
+        ):
+            return None
+        return prefetched.web_element
+
+    def wait_until_visible(
+        self,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+    ):
         """Wait until element becomes visible.
 
         By default, method waits for `self.web_view.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.web_view.wait_timeout` seconds
@@ -48,17 +164,19 @@ class PomcornElement(Generic[locators.TLocator]):
         self.web_view.wait_until_locator_visible(
             locator=self.locator,
             timeout=timeout,
+            polling=polling,
         )
 
     def wait_until_invisible(
         self,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ):
         """Wait until element becomes invisible.
 
         By default, method waits for `self.web_view.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.web_view.wait_timeout` seconds
@@ -68,17 +186,19 @@ class PomcornElement(Generic[locators.TLocator]):
         self.web_view.wait_until_locator_invisible(
             locator=self.locator,
             timeout=timeout,
+            polling=polling,
         )
 
     def wait_until_clickable(
         self,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ):
         """Wait until element becomes clickable.
 
         By default, method waits for `self.web_view.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.web_view.wait_timeout` seconds
@@ -88,18 +208,20 @@ class PomcornElement(Generic[locators.TLocator]):
         self.web_view.wait_until_clickable(
             locator=self.locator,
             timeout=timeout,
+            polling=polling,
         )
 
     def wait_until_text_is_in_element(
         self,
         text: str,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ):
         """Wait until text is present in element.
 
         By default, method waits for `self.web_view.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.web_view.wait_timeout` seconds
@@ -110,14 +232,19 @@ class PomcornElement(Generic[locators.TLocator]):
             text=text,
             locator=self.locator,
             timeout=timeout,
+            polling=polling,
         )
 
-    def wait_until_not_exists_in_dom(self, timeout: float | None = None):
+    def wait_until_not_exists_in_dom(
+        self,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+    ):
         """Wait until element ceases to exist in DOM.
 
         By default, method waits for `self.web_view.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.web_view.wait_timeout` seconds
@@ -127,6 +254,7 @@ class PomcornElement(Generic[locators.TLocator]):
         self.web_view.wait_until_not_exists_in_dom(
             element=self.locator,
             timeout=timeout,
+            polling=polling,
         )
 
     def get_element(self, only_visible: bool = True) -> WebElement:
@@ -136,27 +264,119 @@ class PomcornElement(Generic[locators.TLocator]):
             only_visible: Flag for viewing visible elements. If this is `True`
                 (default), then this method will only get visible elements,
                 otherwise all the elements (including not visible) will be
-                counted.
+                counted. Ignored if element is bound to WebElement.
 
         """
+        if self._web_element is not None:
+            return self._web_element
+
+        web_element = self._get_prefetched_element(
+            only_visible=only_visible,
+        ) or self._find_web_element(only_visible=only_visible)
+        if self.cache:
+            self._web_element = web_element
+        return web_element
+
+    def _find_web_element(self, only_visible: bool = True) -> WebElement:
+        """Look for selenium instance(WebElement) of element in browser."""
         return self.web_view._get_element(
             locator=self.locator,
             only_visible=only_visible,
         )
 
+    def _find_web_elements(self) -> list[WebElement]:
+        """Look for all WebElements matching locator of element in browser."""
+        return self.web_view._get_elements(locator=self.locator)
+
+    def _has_web_elements(self) -> bool:
+        """Check in browser whether any element matches locator."""
+        return self.web_view._has_elements(locator=self.locator)
+
+    def _get_clickable_element(self) -> WebElement:
+        """Get selenium instance(WebElement) of element once it's clickable.
+
+        Clickability of cached, bound or prefetched WebElement is checked
+        without looking for element again.
+
+        """
+        web_element = self.web_view.wait_until_clickable(
+            locator=self.locator,
+            web_element=self._web_element or self._get_prefetched_element(),
+        )
+        if self.cache:
+            self._web_element = web_element
+        return web_element
+
+    def _perform(
+        self,
+        action: Callable[[WebElement], TResult],
+        only_visible: bool = True,
+        wait_until_clickable: bool = False,
+        changes_dom: bool = False,
+    ) -> TResult:
+        """Perform action on selenium instance(WebElement) of element.
+
+        If element is cached, bound or prefetched and its WebElement became
+        stale, find element again and repeat action once.
+
+        Args:
+            action: Callable which accepts WebElement of the element.
+            only_visible: Flag for viewing visible elements. If this is `True`
+                (default), then this method will only get visible elements.
+            wait_until_clickable: Wait until WebElement is clickable before
+                performing action, or not (default `False`).
+            changes_dom: Whether action can change page (e.g. click), so
+                prefetched state of elements becomes outdated.
+
+        """
+
+        def get_element() -> WebElement:
+            if wait_until_clickable:
+                return self._get_clickable_element()
+            return self.get_element(only_visible=only_visible)
+
+        is_reused = self._is_reused()
+        try:
+            return action(get_element())
+        except StaleElementReferenceException:
+            if not is_reused:
+                raise
+            self.reset_cache()
+            return action(get_element())
+        finally:
+            if changes_dom:
+                self.web_view.mark_dom_changed()
+
+    def _is_reused(self) -> bool:
+        """Check whether action will get earlier found WebElement.
+
+        Earlier found (cached, bound or prefetched) WebElement can become
+        stale, so action on it is repeated once on newly found WebElement.
+
+        """
+        return (
+            self._web_element is not None or self._get_prefetched() is not None
+        )
+
     @property
+    @traced("action")
     def exists_in_dom(self) -> bool:
         """Check if element is present in html, can be not visible."""
-        return len(self.web_view._get_elements(locator=self.locator)) != 0
+        if (prefetched := self._get_prefetched()) is not None:
+            return prefetched.web_element is not None
+        return self._has_web_elements()
 
     @property
+    @traced("action")
     def is_displayed(self) -> bool:
         """Check if element is displayed.
 
         If element is not present in the html, return `False`.
 
         """
-        elements = self.web_view._get_elements(locator=self.locator)
+        if (prefetched := self._get_prefetched()) is not None:
+            return prefetched.is_displayed
+        elements = self._find_web_elements()
         if not elements:
             return False
 
@@ -167,23 +387,26 @@ class PomcornElement(Generic[locators.TLocator]):
             return False
 
     @property
+    @traced("action")
     def is_enabled(self) -> bool:
         """Check if element is enabled.
 
         It is primarily used with buttons.
 
         """
-        return self.get_element().is_enabled()
+        return self._perform(lambda element: element.is_enabled())
 
     @property
+    @traced("action")
     def is_selected(self) -> bool:
         """Check if element is selected.
 
         It is predominantly used with radio buttons, dropdowns and checkboxes.
 
         """
-        return self.get_element().is_selected()
+        return self._perform(lambda element: element.is_selected())
 
+    @traced("action")
     def fill(
         self,
         text: str,
@@ -205,6 +428,7 @@ class PomcornElement(Generic[locators.TLocator]):
             self.clear(only_visible=only_visible)
         self.send_keys(str(text), only_visible=only_visible)
 
+    @traced("action")
     def clear(self, only_visible: bool = True):
         """Clear element (input) and it's value.
 
@@ -222,6 +446,7 @@ class PomcornElement(Generic[locators.TLocator]):
         self.send_keys(cmd_ctrl + "a", only_visible=only_visible)
         self.send_keys(Keys.BACK_SPACE, only_visible=only_visible)
 
+    @traced("action")
     def send_keys(self, keys: str, only_visible: bool = True):
         """Send keys to element.
 
@@ -236,8 +461,13 @@ class PomcornElement(Generic[locators.TLocator]):
                 counted.
 
         """
-        self.get_element(only_visible=only_visible).send_keys(*keys)
+        self._perform(
+            lambda element: element.send_keys(*keys),
+            only_visible=only_visible,
+            changes_dom=True,
+        )
 
+    @traced("action")
     def get_text(self, only_visible: bool = True) -> str:
         """Get text from element.
 
@@ -248,8 +478,15 @@ class PomcornElement(Generic[locators.TLocator]):
                 counted.
 
         """
-        return self.get_element(only_visible=only_visible).text
+        prefetched = self._get_prefetched()
+        if prefetched is not None and prefetched.text is not None:
+            return prefetched.text
+        return self._perform(
+            lambda element: element.text,
+            only_visible=only_visible,
+        )
 
+    @traced("action")
     def get_attribute(
         self,
         attribute_name: str,
@@ -268,12 +505,14 @@ class PomcornElement(Generic[locators.TLocator]):
 
         """
         return (
-            self.get_element(only_visible=only_visible).get_attribute(
-                name=attribute_name,
+            self._perform(
+                lambda element: element.get_attribute(name=attribute_name),
+                only_visible=only_visible,
             )
             or ""
         )
 
+    @traced("action")
     def set_attribute(
         self,
         attribute_name: str,
@@ -291,13 +530,16 @@ class PomcornElement(Generic[locators.TLocator]):
                 counted.
 
         """
-        element = self.get_element(only_visible=only_visible)
-        self.web_view.execute_javascript(
-            f"arguments[0].setAttribute('{attribute_name}',arguments[1])",
-            element,
-            value,
+        self._perform(
+            lambda element: self.web_view.execute_javascript(
+                f"arguments[0].setAttribute('{attribute_name}',arguments[1])",
+                element,
+                value,
+            ),
+            only_visible=only_visible,
         )
 
+    @traced("action")
     def get_value(self, only_visible: bool = True):
         """Get value of `value` attribute from element.
 
@@ -313,6 +555,7 @@ class PomcornElement(Generic[locators.TLocator]):
             only_visible=only_visible,
         )
 
+    @traced("action")
     def select(self, value: str, only_visible: bool = True):
         """Perform select on element.
 
@@ -322,8 +565,13 @@ class PomcornElement(Generic[locators.TLocator]):
                 (default), then this method will only get visible elements.
 
         """
-        Select(self.get_element(only_visible)).select_by_visible_text(value)
+        self._perform(
+            lambda element: Select(element).select_by_visible_text(value),
+            only_visible=only_visible,
+            changes_dom=True,
+        )
 
+    @traced("action")
     def click(
         self,
         only_visible: bool = True,
@@ -345,13 +593,24 @@ class PomcornElement(Generic[locators.TLocator]):
         If the element is in viewport but overlapped, set center_element
         to True to scroll until element is in the center of the screen.
 
+        Element is looked for only once: clickability is checked and scroll is
+        performed on the same WebElement which is clicked then.
+
         """
-        if wait_until_clickable:
-            self.wait_until_clickable()
-        if center_element:
-            self.scroll_to(only_visible=only_visible)
-        self.get_element(only_visible=only_visible).click()
 
+        def click(element: WebElement) -> None:
+            if center_element:
+                self.web_view.scroll_to(element)
+            element.click()
+
+        self._perform(
+            click,
+            only_visible=only_visible,
+            wait_until_clickable=wait_until_clickable,
+            changes_dom=True,
+        )
+
+    @traced("action")
     def drag_and_drop(
         self,
         target: PomcornElement[locators.TLocator],
@@ -365,11 +624,18 @@ class PomcornElement(Generic[locators.TLocator]):
                 (default), then this method will only get visible elements.
 
         """
-        self.web_view.drag_and_drop(
-            source=self.get_element(only_visible=only_visible),
-            target=target.get_element(only_visible=only_visible),
+        self._perform(
+            lambda source: target._perform(
+                lambda target_element: self.web_view.drag_and_drop(
+                    source=source,
+                    target=target_element,
+                ),
+                only_visible=only_visible,
+            ),
+            only_visible=only_visible,
         )
 
+    @traced("action")
     def scroll_to(self, only_visible: bool = True):
         """Scroll page until element is visible.
 
@@ -378,8 +644,9 @@ class PomcornElement(Generic[locators.TLocator]):
                 (default), then this method will only get visible elements.
 
         """
-        self.web_view.scroll_to(self.get_element(only_visible=only_visible))
+        self._perform(self.web_view.scroll_to, only_visible=only_visible)
 
+    @traced("action")
     def hover_to(self, only_visible: bool = True):
         """Hover cursor to element.
 
@@ -388,11 +655,15 @@ class PomcornElement(Generic[locators.TLocator]):
                 (default), then this method will only get visible elements.
 
         """
-        action = ActionChains(self.web_view.webdriver).move_to_element(
-            to_element=self.get_element(only_visible=only_visible),
+        self._perform(
+            lambda element: ActionChains(self.web_view.webdriver)
+            .move_to_element(to_element=element)
+            .perform(),
+            only_visible=only_visible,
+            changes_dom=True,
         )
-        action.perform()
 
+    @traced("action")
     def get_value_of_css_property(
         self,
         property_name: str,
@@ -406,8 +677,11 @@ class PomcornElement(Generic[locators.TLocator]):
                 (default), then this method will only get visible elements.
 
         """
-        return self.get_element(only_visible).value_of_css_property(
-            property_name=property_name,
+        return self._perform(
+            lambda element: element.value_of_css_property(
+                property_name=property_name,
+            ),
+            only_visible=only_visible,
         )
 
     def add_debug_mark(self):
@@ -429,3 +703,127 @@ class PomcornElement(Generic[locators.TLocator]):
 
 
 XPathElement = PomcornElement[locators.XPathLocator]
+
+
+class ScopedElement(XPathElement):
+    """Element which is looked for inside found element of its scope.
+
+    ``PomcornElement`` looks for itself by full locator from the root of the
+    document, so browser evaluates the whole chain of locators of parent
+    components on each lookup. Scoped element looks for itself inside
+    WebElement of `scope` (e.g. body of component) by relative query, so
+    cost of lookup depends on size of scope instead of page. If WebElement of
+    scope becomes stale, scope is found again.
+
+    Full `locator` is still used in messages of waits and by explicit waits
+    (e.g. `wait_until_invisible`).
+
+    """
+
+    def __init__(
+        self,
+        web_view: WebView,
+        locator: locators.XPathLocator,
+        scope: XPathElement,
+        search_args: tuple[str, str],
+        cache: bool = False,
+    ):
+        """Init scoped element.
+
+        Args:
+            web_view: Instance of a webview.
+            locator: Full locator of element, which includes locator of
+                scope.
+            scope: Element to look for element inside. It should cache its
+                WebElement, otherwise scope is looked for on each lookup.
+            search_args: Strategy and query to look for element inside
+                WebElement of scope (see
+                ``XPathLocator.get_scoped_search_args``).
+            cache: Whether to reuse found selenium instance(WebElement) of
+                element in subsequent actions or not (default `False`).
+
+        """
+        super().__init__(web_view=web_view, locator=locator, cache=cache)
+        self.scope = scope
+        self.search_args = search_args
+
+    def _find_web_element(self, only_visible: bool = True) -> WebElement:
+        """Look for WebElement inside scope, waiting for its visibility."""
+        if not only_visible:
+            return self._find_in_scope(
+                lambda root: root.find_element(*self.search_args),
+            )
+        wait = self.web_view.get_wait()
+        return self.web_view._wait_until(
+            wait,
+            method=lambda _: self._find_visible_web_element(),
+            message=(
+                f"Unable to locate {self.locator} in {wait._timeout} seconds!"
+            ),
+            locator=self.locator,
+        )
+
+    def _find_web_elements(self) -> list[WebElement]:
+        """Look for all WebElements matching locator inside scope."""
+        try:
+            return self._find_in_scope(
+                lambda root: root.find_elements(*self.search_args),
+            )
+        except NoSuchElementException:
+            # There are no matching elements if scope itself is absent
+            return []
+
+    def _has_web_elements(self) -> bool:
+        """Check in browser whether any element matches locator in scope."""
+        try:
+            return self._find_in_scope(
+                lambda root: self.web_view._has_elements(
+                    locator=locators.Locator(*self.search_args),
+                    root=root,
+                ),
+            )
+        except NoSuchElementException:
+            return False
+
+    def _is_reused(self) -> bool:
+        """Check whether action will get earlier found WebElement.
+
+        WebElement is always found inside earlier found WebElement of scope,
+        so it can become stale along with scope, e.g. while waiting for its
+        clickability.
+
+        """
+        return True
+
+    def _get_clickable_element(self) -> WebElement:
+        """Get WebElement found inside scope once it's clickable."""
+        web_element = self.web_view.wait_until_clickable(
+            locator=self.locator,
+            web_element=self._web_element or self.get_element(),
+        )
+        if self.cache:
+            self._web_element = web_element
+        return web_element
+
+    def _find_visible_web_element(self) -> WebElement | bool:
+        """Get WebElement found inside scope if it's visible."""
+        try:
+            web_element = self._find_in_scope(
+                lambda root: root.find_element(*self.search_args),
+            )
+            return web_element if web_element.is_displayed() else False
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    def _find_in_scope(self, find: Callable[[WebElement], TResult]) -> TResult:
+        """Look for element inside WebElement of scope.
+
+        If WebElement of scope became stale (e.g. component was rendered
+        again), scope is found again and lookup is repeated once.
+
+        """
+        try:
+            return find(self.scope.get_element(only_visible=False))
+        except StaleElementReferenceException:
+            self.scope.reset_cache()
+            return find(self.scope.get_element(only_visible=False))
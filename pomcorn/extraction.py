@@ -0,0 +1,107 @@
+"""Module with schemas of bulk extraction of data from list items.
+
+Schema maps names of fields to columns: relative locators of elements inside
+list item and what to extract from them (text or attribute). Values of all
+columns of all items are extracted via single script call, so extraction of
+1000 rows with 5 fields takes one request to the browser instead of 10000.
+
+Example:
+  @dataclass
+  class PackageRow:
+      name: str | None
+      version: str | None
+      url: str | None
+
+  schema = {
+      "name": locators.ClassLocator("package-snippet__name"),
+      "version": locators.ClassLocator("package-snippet__version"),
+      "url": Column(attribute="href"),
+  }
+  rows = results.extract(schema, into=PackageRow)
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TypeAlias
+
+from pomcorn import locators
+
+
+@dataclass(frozen=True)
+class Column:
+    """Description of field extracted from each list item.
+
+    Attributes:
+        locator: Locator of element relative to item (like `relative_locator`
+            of components), by default value is extracted from item itself.
+        attribute: Name of attribute to extract, by default visible text of
+            element is extracted.
+
+    Value of column is `None` if element isn't found in item or it doesn't
+    have the attribute.
+
+    """
+
+    locator: locators.XPathLocator | None = None
+    attribute: str | None = None
+
+    def get_script_args(self) -> list[str | None]:
+        """Get `[by, query, attribute]` of column for extraction script.
+
+        Raises:
+            ValueError: If locator can't be evaluated relative to item (e.g.
+                it starts with grouping).
+
+        """
+        if self.locator is None:
+            return [None, None, self.attribute]
+        search_args = self.locator.get_scoped_search_args()
+        if search_args is None:
+            raise ValueError(
+                f"Locator `{self.locator}` can't be used for extraction, "
+                "because it can't be evaluated relative to list item.",
+            )
+        return [*search_args, self.attribute]
+
+    def get_item_condition(self, value: str) -> str | None:
+        """Get XPath condition on list item whose column has the value.
+
+        Text is compared with whitespace-normalized text of element, so
+        condition is built only for single-line text.
+
+        Returns:
+            Condition (without brackets) or `None` if value can't be checked
+            by XPath, e.g. locator starts with grouping or text spans several
+            lines.
+
+        """
+        quoted_value = locators.XPathLocator._escape_quotes(value)
+        if self.attribute:
+            condition = f"@{self.attribute}={quoted_value}"
+        elif "\n" not in value:
+            condition = f"normalize-space(.)={quoted_value}"
+        else:
+            return None
+        if self.locator is None:
+            return condition
+        if not self.locator or self.locator.related_query.startswith("("):
+            return None
+        return f".//{self.locator.related_query}[{condition}]"
+
+
+# Mapping of names of fields to columns, locators are shortcuts for columns
+# with text of elements
+Schema: TypeAlias = Mapping[str, Column | locators.XPathLocator]
+
+
+def get_columns(schema: Schema) -> dict[str, Column]:
+    """Get columns of schema with locators replaced by columns."""
+    return {
+        name: (
+            column if isinstance(column, Column) else Column(locator=column)
+        )
+        for name, column in schema.items()
+    }
@@ -0,0 +1,368 @@
+"""Module with instrumentation of commands sent to the browser.
+
+Each action of page object (e.g. click or wait) is made of one or more
+WebDriver commands, and each command is a round trip to the browser.
+``CommandRecorder`` records all commands sent by webdriver, so it's possible
+to find page objects which send too many of them.
+
+Example:
+  with CommandRecorder(page.webdriver) as recorder:
+      page.search(query="pomcorn")
+
+  assert recorder.count < 20
+  recorder.export_json("commands.json")
+
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Self
+
+import selenium
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from . import scripts
+from .element import PomcornElement
+from .polling import is_waiting
+from .web_view import WebView
+
+# Frames of pomcorn itself are skipped when looking for caller of command
+_PACKAGE_DIR = str(Path(__file__).parent)
+
+# Frames of pomcorn and selenium, which are between page objects and sent
+# command, so they don't stop search of caller
+_LIBRARY_DIRS = (_PACKAGE_DIR, str(Path(selenium.__file__).parent))
+
+# Commands which look for elements by `using` and `value` params
+_FIND_COMMANDS = (
+    "findElement",
+    "findElements",
+    "findChildElement",
+    "findChildElements",
+)
+
+# Commands which run scripts passed in `script` param
+_SCRIPT_COMMANDS = (
+    Command.W3C_EXECUTE_SCRIPT,
+    Command.W3C_EXECUTE_SCRIPT_ASYNC,
+)
+
+# Max length of script kept in record of command
+_SCRIPT_EXCERPT_LENGTH = 80
+
+# Names of pomcorn scripts by their code. Scripts share helpers at their
+# beginning, so they are told apart by the whole code instead of excerpt.
+_SCRIPT_NAMES = {
+    code: f"scripts.{name}"
+    for name, code in vars(scripts).items()
+    if name.isupper() and not name.startswith("_") and isinstance(code, str)
+}
+
+# Strategies of locators passed to pomcorn scripts as `by, query` arguments
+_SCRIPT_STRATEGIES = (By.XPATH, By.CSS_SELECTOR)
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    """Information about command sent to the browser.
+
+    Attributes:
+        command: Name of WebDriver command (e.g. ``findElement``).
+        locator: Query of locator for commands which look for elements, or
+            queries of locators passed to script separated by ``", "``.
+        caller: Name of class of page or component which sent the command.
+        duration: Number of seconds the command took.
+        in_wait: Whether the command was sent to check wait condition.
+        script: Name of pomcorn script (e.g. ``scripts.FILL_FORM``) or
+            beginning of other script for commands which run scripts.
+        started_at: Value of ``time.perf_counter`` when command was sent.
+
+    """
+
+    command: str
+    locator: str | None
+    caller: str | None
+    duration: float
+    in_wait: bool
+    script: str | None = None
+    started_at: float = 0
+
+
+@dataclass
+class CommandStats:
+    """Aggregated statistics of commands.
+
+    Attributes:
+        count: Number of commands.
+        duration: Total number of seconds the commands took.
+        in_wait: Number of commands sent to check wait conditions.
+
+    """
+
+    count: int = 0
+    duration: float = 0
+    in_wait: int = 0
+
+    def add(self, record: CommandRecord):
+        """Add command to statistics."""
+        self.count += 1
+        self.duration += record.duration
+        self.in_wait += record.in_wait
+
+
+class CommandRecorder:
+    """Recorder of commands sent to the browser by webdriver.
+
+    Recorder replaces `execute` method of webdriver instance, so it records
+    all commands: sent by pomcorn, by selenium helpers (e.g. ``ActionChains``)
+    and by test code itself. Recording is stopped on exit from the block or
+    by `stop` method. Many recorders of the same webdriver can be active at
+    once and stopped in any order.
+
+    """
+
+    def __init__(self, webdriver: WebDriver):
+        """Init recorder.
+
+        Args:
+            webdriver: Instance of a class for managing the browser.
+
+        """
+        self.webdriver = webdriver
+        self.records: list[CommandRecord] = []
+        self._execute: _RecordingExecute | None = None
+
+    @property
+    def count(self) -> int:
+        """Get number of recorded commands."""
+        return len(self.records)
+
+    @property
+    def duration(self) -> float:
+        """Get total number of seconds recorded commands took."""
+        return sum(record.duration for record in self.records)
+
+    def start(self):
+        """Start recording commands of webdriver."""
+        if self._execute is not None:
+            return
+        execute = vars(self.webdriver).get("execute")
+        if not isinstance(execute, _RecordingExecute):
+            execute = _RecordingExecute(self.webdriver)
+            # Replace method of the instance only, other webdrivers aren't
+            # changed
+            self.webdriver.execute = execute  # type: ignore[assignment,method-assign]
+        execute.recorders.append(self)
+        self._execute = execute
+
+    def stop(self):
+        """Stop recording commands of webdriver."""
+        if self._execute is None:
+            return
+        self._execute.recorders.remove(self)
+        # Keep recording of other recorders started for the same webdriver
+        if not self._execute.recorders:
+            self._execute.uninstall()
+        self._execute = None
+
+    def reset(self):
+        """Forget all recorded commands."""
+        self.records.clear()
+
+    def get_stats_by_command(self) -> dict[str, CommandStats]:
+        """Get statistics of recorded commands grouped by command name."""
+        return self._group(lambda record: record.command)
+
+    def get_stats_by_caller(self) -> dict[str, CommandStats]:
+        """Get statistics of recorded commands grouped by caller.
+
+        Commands sent not by pages or components are grouped under
+        ``None`` key name.
+
+        """
+        return self._group(lambda record: str(record.caller))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get recorded commands and their statistics as dict."""
+        return {
+            "count": self.count,
+            "duration": self.duration,
+            "by_command": {
+                name: asdict(stats)
+                for name, stats in self.get_stats_by_command().items()
+            },
+            "by_caller": {
+                name: asdict(stats)
+                for name, stats in self.get_stats_by_caller().items()
+            },
+            "records": [asdict(record) for record in self.records],
+        }
+
+    def export_json(self, path: str | Path):
+        """Save recorded commands and their statistics to JSON file."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def _group(
+        self,
+        get_key: Callable[[CommandRecord], str],
+    ) -> dict[str, CommandStats]:
+        """Get statistics of recorded commands grouped by key."""
+        groups: dict[str, CommandStats] = {}
+        for record in self.records:
+            groups.setdefault(get_key(record), CommandStats()).add(record)
+        return groups
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"CommandRecorder(count={self.count}, duration={self.duration})"
+
+
+class _RecordingExecute:
+    """Replacement of `execute` method of webdriver which records commands.
+
+    Single replacement is installed for webdriver, and each command is added
+    to all recorders started for it.
+
+    """
+
+    def __init__(self, webdriver: WebDriver):
+        self.webdriver = webdriver
+        self.execute = webdriver.execute
+        # `execute` set on webdriver instance before recording
+        self.instance_execute = vars(webdriver).get("execute")
+        self.recorders: list[CommandRecorder] = []
+
+    def __call__(
+        self,
+        driver_command: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return self.execute(driver_command, params)
+        finally:
+            duration = time.perf_counter() - started_at
+            if self.recorders:
+                record = self._get_record(
+                    driver_command,
+                    params,
+                    started_at=started_at,
+                    duration=duration,
+                )
+                for recorder in self.recorders:
+                    recorder.records.append(record)
+
+    def uninstall(self) -> None:
+        """Restore `execute` method of webdriver replaced by this one."""
+        if vars(self.webdriver).get("execute") is not self:
+            # Method was replaced again by someone else
+            return
+        if self.instance_execute is None:
+            del self.webdriver.execute
+        else:
+            self.webdriver.execute = self.instance_execute  # type: ignore[method-assign]
+
+    def _get_record(
+        self,
+        command: str,
+        params: dict[str, Any] | None,
+        started_at: float,
+        duration: float,
+    ) -> CommandRecord:
+        """Get record of sent command."""
+        locator = script = None
+        if command in _FIND_COMMANDS and params:
+            locator = params.get("value")
+        if command in _SCRIPT_COMMANDS and params:
+            script = _get_script_name(params.get("script", ""))
+            locator = ", ".join(_get_script_queries(params.get("args", [])))
+            locator = locator or None
+        return CommandRecord(
+            command=command,
+            locator=locator,
+            caller=self._get_caller(),
+            duration=duration,
+            in_wait=is_waiting(),
+            script=script,
+            started_at=started_at,
+        )
+
+    def _get_caller(self) -> str | None:
+        """Get name of class of page or component which sent the command.
+
+        It's the nearest page or component in stack whose method is defined
+        outside of pomcorn, so commands sent by base methods (e.g. waits of
+        ``WebView``) are attributed to page object which called them. If
+        there is no such method, the nearest page or component (or view of
+        element) in stack is used.
+
+        Search stops at the first frame of code which uses page objects (e.g.
+        test), so whole stack isn't inspected for each command.
+
+        """
+        caller = None
+        frame = inspect.currentframe()
+        while frame is not None:
+            view = frame.f_locals.get("self")
+            if isinstance(view, PomcornElement):
+                view = view.web_view
+            file_name = frame.f_code.co_filename
+            if isinstance(view, WebView):
+                if not file_name.startswith(_PACKAGE_DIR):
+                    return view.__class__.__qualname__
+                caller = caller or view.__class__.__qualname__
+            elif (
+                not file_name.startswith(_LIBRARY_DIRS)
+                and view is not self.webdriver
+            ):
+                return caller
+            frame = frame.f_back
+        return caller
+
+
+def _get_script_name(script: str) -> str:
+    """Get name of pomcorn script or beginning of other script.
+
+    Whitespaces of other script are collapsed.
+
+    """
+    if script in _SCRIPT_NAMES:
+        return _SCRIPT_NAMES[script]
+    script = " ".join(script.split())
+    if len(script) <= _SCRIPT_EXCERPT_LENGTH:
+        return script
+    return f"{script[:_SCRIPT_EXCERPT_LENGTH]}..."
+
+
+def _get_script_queries(args: list[Any]) -> list[str]:
+    """Get queries of locators passed to script as `by, query` arguments.
+
+    Locators can be passed as separate arguments or as lists (e.g. locators
+    of all fields of ``scripts.FILL_FORM``).
+
+    """
+    queries = []
+    for index, arg in enumerate(args):
+        if isinstance(arg, list | tuple):
+            queries.extend(_get_script_queries(list(arg)))
+        elif (
+            arg in _SCRIPT_STRATEGIES
+            and index + 1 < len(args)
+            and isinstance(args[index + 1], str)
+        ):
+            queries.append(args[index + 1])
+    return queries
@@ -13,14 +13,33 @@ Example:
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterator
-from typing import Literal, TypeVar
+from typing import Any, Literal, TypeVar
 
 from selenium.webdriver.common.by import By
 
+from .xpath_optimizer import optimize_xpath
+from .xpath_to_css import xpath_to_css
+
+# Max number of results of locators composition kept for reuse
+COMPOSITION_CACHE_SIZE = 8192
+
 
 class Locator:
-    """Base locator for looking for elements in page."""
+    """Base locator for looking for elements in page.
+
+    Locators are immutable: their attributes can't be changed after
+    initialization. Locators which look for elements by the same strategy and
+    query are equal, so they can be used as keys of dicts (e.g. of caches)
+    and shared between page objects.
+
+    """
+
+    __slots__ = ("by", "query")
+
+    by: str
+    query: str
 
     _ALLOWED_LOCATORS = (
         By.ID,
@@ -43,8 +62,8 @@ class Locator:
         """
         if by not in self._ALLOWED_LOCATORS:
             raise ValueError(f"No valid `by` found -> `{by}`")
-        self.by = by
-        self.query: str = query
+        object.__setattr__(self, "by", by)
+        object.__setattr__(self, "query", query)
 
     def __iter__(self) -> Iterator[str]:
         """Unpack locator.
@@ -56,6 +75,39 @@ class Locator:
         """
         return iter((self.by, self.query))
 
+    def get_search_args(self) -> tuple[str, str]:
+        """Get strategy and query to look for elements in the whole page.
+
+        They can differ from `by` and `query` if there is equivalent query
+        which is evaluated by browser faster.
+
+        """
+        return self.by, self.query
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"Locator is immutable, `{name}` can't be changed.",
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"Locator is immutable, `{name}` can't be deleted.",
+        )
+
+    def __setstate__(self, state: tuple[None, dict[str, Any]]) -> None:
+        """Restore attributes of copied or unpickled locator."""
+        _, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Locator):
+            return NotImplemented
+        return self.get_search_args() == other.get_search_args()
+
+    def __hash__(self) -> int:
+        return hash(self.get_search_args())
+
     def __repr__(self) -> str:
         return f"Locator<By `{self.by}`: Query `{self.query}`>"
 
@@ -108,8 +160,26 @@ class XPathLocator(Locator):
     All custom locators that inherit `XPathLocator` should be independent and
     start with `//`.
 
+    Query is simplified to equivalent canonical one (see ``optimize_xpath``)
+    in `canonical_query` attribute. If it's expressible in CSS (e.g. it
+    consists of tag names and conditions on attributes, see
+    ``xpath_to_css``), locator carries equivalent CSS selector in `css`
+    attribute, and elements are looked for by it, because browsers evaluate
+    CSS selectors faster than XPath. Otherwise, elements are looked for by
+    canonical query. Both are computed on first access and cached, so
+    locators which are only composed into other ones stay cheap.
+
+    Results of composition are cached by queries of operands and operator,
+    so building the same relative locators again (e.g. in each instance of
+    component) returns already created locators.
+
     """
 
+    __slots__ = ("_compiled", "related_query")
+
+    _compiled: tuple[str, str | None]
+    related_query: str
+
     # We move it to constant to fix flake-8 warning B005:
     # https://pypi.org/project/flake8-bugbear/#:~:text=B005
     divider = "//"
@@ -121,9 +191,53 @@ class XPathLocator(Locator):
             query: Query for the XPath locator strategy.
 
         """
-        self.related_query = query.lstrip(self.divider)
+        object.__setattr__(self, "related_query", query.lstrip(self.divider))
         super().__init__(by=By.XPATH, query=query)
 
+    @property
+    def canonical_query(self) -> str:
+        """Get simplified query equivalent to query."""
+        return self._compile()[0]
+
+    @property
+    def css(self) -> str | None:
+        """Get CSS selector equivalent to query if it's expressible in CSS."""
+        return self._compile()[1]
+
+    def _compile(self) -> tuple[str, str | None]:
+        """Get canonical query and CSS selector, computing them once."""
+        try:
+            return self._compiled
+        except AttributeError:
+            canonical_query = optimize_xpath(self.query)
+            compiled = (canonical_query, xpath_to_css(canonical_query))
+            object.__setattr__(self, "_compiled", compiled)
+            return compiled
+
+    def get_search_args(self) -> tuple[str, str]:
+        """Get CSS selector or canonical query equivalent to query."""
+        canonical_query, css = self._compile()
+        if css is not None:
+            return By.CSS_SELECTOR, css
+        return By.XPATH, canonical_query
+
+    def get_scoped_search_args(self) -> tuple[str, str] | None:
+        """Get strategy and query to look for elements inside an element.
+
+        Query is treated as relative to the element, like in composition
+        ``base_locator // self``, e.g. ``//a`` is looked for as ``.//a``.
+
+        Returns:
+            Strategy and query or `None` if query starts with grouping (e.g.
+            union or index), which can't be evaluated relative to element.
+
+        """
+        if not self or self.related_query.startswith("("):
+            return None
+        if self.css is not None:
+            return By.CSS_SELECTOR, f":scope {self.css}"
+        return By.XPATH, optimize_xpath(f".//{self.related_query}")
+
     def __truediv__(self, other: XPathLocator | str) -> XPathLocator:
         """Override `/` operator to implement following XPath locators.
 
@@ -155,7 +269,7 @@ class XPathLocator(Locator):
             span | div // img == XPathLocator("(//span | //div//img)")
 
         """
-        return XPathLocator(query=f"({self.query} | {other.query})")
+        return _compose(self.query, "|", other.query)
 
     def __getitem__(self, value: int | str | XPathLocator) -> XPathLocator:
         """Allow to set xpath expressions or index into the locator query.
@@ -176,10 +290,13 @@ class XPathLocator(Locator):
             div_locator[child_locator] --> `//div[//label[contains(., 'Star']]`
 
         """
-        query = f"({self.query})"
-
         if isinstance(value, XPathLocator):
             value = value.query
+        return _compose(self.query, "[]", value)
+
+    def _select(self, value: int | str) -> XPathLocator:
+        """Get locator with condition or index applied to query."""
+        query = f"({self.query})"
 
         if isinstance(value, str):
             return XPathLocator(f"{query}[{value}]")
@@ -241,7 +358,7 @@ class XPathLocator(Locator):
 
     def extend_query(self, extra_query: str) -> XPathLocator:
         """Return new XPathLocator with extended query."""
-        return XPathLocator(query=self.query + extra_query)
+        return _compose(self.query, "+", extra_query)
 
     def contains(self, text: str, exact: bool = False) -> XPathLocator:
         """Return new XPathLocator with search on contained text.
@@ -281,6 +398,22 @@ class XPathLocator(Locator):
             ValueError: If parent and child locators queries are empty.
 
         """
+        other = XPathLocator(other) if isinstance(other, str) else other
+
+        if self and other:
+            return _compose(self.query, separator, other.query)
+
+        if not (self or other):
+            raise ValueError(
+                f"Both of locators have empty query. The "
+                f"`{self._join(other, separator).query}` is not a valid "
+                "locator.",
+            )
+
+        return self if self else other
+
+    def _join(self, other: XPathLocator, separator: str) -> XPathLocator:
+        """Get locator with query of other locator joined by separator."""
         related_query = self.related_query
         if not related_query.startswith("("):
             # Parent query can be bracketed, in which case we don't need to use
@@ -290,19 +423,29 @@ class XPathLocator(Locator):
             #   //(//li)[3] -> invalid
             related_query = f"//{self.related_query}"
 
-        other = XPathLocator(other) if isinstance(other, str) else other
-
-        locator = XPathLocator(
+        return XPathLocator(
             query=f"{related_query}{separator}{other.related_query}",
         )
 
-        if self and other:
-            return locator
 
-        if not (self or other):
-            raise ValueError(
-                f"Both of locators have empty query. The `{locator.query}` is "
-                "not a valid locator.",
-            )
+@functools.lru_cache(maxsize=COMPOSITION_CACHE_SIZE)
+def _compose(query: str, operator: str, operand: str | int) -> XPathLocator:
+    """Get result of composition of locator with operand.
 
-        return self if self else other
+    Results are cached, it's safe because locators are immutable.
+
+    Args:
+        query: Query of locator.
+        operator: One of `/`, `//` (join), `|` (union), `[]` (condition or
+            index) and `+` (extension of query).
+        operand: Query of other locator, condition, index or extra query.
+
+    """
+    locator = XPathLocator(query)
+    if operator in ("/", "//"):
+        return locator._join(XPathLocator(str(operand)), operator)
+    if operator == "|":
+        return XPathLocator(query=f"({query} | {operand})")
+    if operator == "[]":
+        return locator._select(operand)
+    return XPathLocator(query=f"{query}{operand}")
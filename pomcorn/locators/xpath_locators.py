@@ -4,6 +4,8 @@ from .base_locators import XPathLocator
 class TagNameLocator(XPathLocator):
     """Locator to look for elements with tag by Xpath."""
 
+    __slots__ = ()
+
     def __init__(self, tag: str):
         """Init XPathLocator.
 
@@ -17,6 +19,8 @@ class TagNameLocator(XPathLocator):
 class PropertyLocator(XPathLocator):
     """Locator to look for elements with property by XPath."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         prop: str,
@@ -50,6 +54,8 @@ class DataTestIdLocator(PropertyLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: str,
@@ -83,6 +89,8 @@ class IdLocator(PropertyLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         value: str,
@@ -112,6 +120,8 @@ class NameLocator(PropertyLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str, container: str = "*"):
         """Init XPathLocator.
 
@@ -132,6 +142,8 @@ class NameLocator(PropertyLocator):
 class ElementWithTextLocator(XPathLocator):
     """Locator to look for elements with text by XPath."""
 
+    __slots__ = ()
+
     def __init__(self, text: str, element: str = "*", exact: bool = False):
         """Init XPathLocator.
 
@@ -158,6 +170,8 @@ class ClassLocator(PropertyLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         class_name: str,
@@ -191,6 +205,8 @@ class ButtonWithTextLocator(ElementWithTextLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, text: str, exact: bool = False):
         """Init XPathLocator.
 
@@ -220,6 +236,8 @@ class InputInLabelLocator(XPathLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, label: str):
         """Init XPathLocator."""
         super().__init__(
@@ -244,6 +262,8 @@ class InputByLabelLocator(XPathLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, label: str):
         """Init XPathLocator."""
         super().__init__(
@@ -263,6 +283,8 @@ class TextAreaByLabelLocator(XPathLocator):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, label: str):
         """Init XPathLocator."""
         super().__init__(
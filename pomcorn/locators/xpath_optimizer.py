@@ -0,0 +1,391 @@
+"""Module with canonicalization and simplification of XPath queries.
+
+Composition of locators piles up redundant grouping and steps, e.g.
+``((//ul//li))//.//a`` from nested components. ``optimize_xpath`` rewrites
+query to equivalent canonical one (``//ul//li//a``), which is evaluated by
+browser faster and can be used as stable key of caches.
+
+Rewrites are applied only if they don't change matched elements and their
+order:
+
+* needless grouping is dropped: ``(//div)//a`` -> ``//div//a``, and
+  non-positional conditions are moved into step:
+  ``(//div)[@id="x"]`` -> ``//div[@id="x"]`` (grouping before positional
+  conditions like ``(//li)[1]`` is kept), and parentheses around whole
+  condition or operand of ``and`` are dropped:
+  ``[(@a) and (@b="x")]`` -> ``[@a and @b="x"]``
+* duplicate descendant axes are collapsed: ``//.//``, ``/./`` and
+  ``/descendant-or-self::node()/`` steps
+* tag name known from condition is pushed into ``*`` step:
+  ``//*[self::button][@type="submit"]`` -> ``//button[@type="submit"]``
+* always true conditions are dropped: ``[contains(@class, "")]``
+* whitespaces and quotes of strings are normalized:
+  ``( //a|//b )[@x = 'y']`` -> ``(//a | //b)[@x="y"]``
+
+Queries which can't be tokenized are returned as is.
+
+"""
+
+import functools
+import re
+
+_TOKEN = re.compile(
+    r"""\s*(
+        "[^"]*" | '[^']*'
+        | \d+(?:\.\d*)? | \.\d+
+        | // | / | :: | \.\. | \. | != | <= | >= | [()\[\]@,|=<>*+$-]
+        | [A-Za-z_][\w.-]*(?::[A-Za-z_][\w.-]*)?
+    )""",
+    re.VERBOSE,
+)
+
+# Operators written as names, they are separated by spaces
+_WORD_OPERATORS = ("and", "or", "div", "mod")
+
+# Tokens after which name is operator, not name test or function
+_OPERAND_ENDS = ("]", ")", ".", "..", "*")
+
+# Tokens after which parenthesis starts group, not call of function
+_GROUP_STARTS = (None, "(", "[", ",", "|")
+
+# Functions whose results in condition don't depend on position of node
+# (they return boolean, string or node-set, but not number)
+_NON_POSITIONAL_FUNCTIONS = (
+    "boolean",
+    "contains",
+    "false",
+    "lang",
+    "local-name",
+    "name",
+    "normalize-space",
+    "not",
+    "starts-with",
+    "string",
+    "text",
+    "true",
+)
+
+# Conditions which are true for any node, they are dropped
+_ALWAYS_TRUE_FUNCTIONS = ("contains", "starts-with")
+
+_DESCENDANT_OR_SELF = ["descendant-or-self", "::", "node", "(", ")"]
+
+
+@functools.lru_cache(maxsize=4096)
+def optimize_xpath(query: str) -> str:
+    """Get canonical query equivalent to XPath query.
+
+    Args:
+        query: XPath query to optimize.
+
+    Returns:
+        Simplified query with normalized whitespaces and quotes or original
+        query if it can't be tokenized.
+
+    """
+    tokens = _tokenize(query)
+    if tokens is None or tokens.count("(") != tokens.count(")"):
+        return query
+    previous_tokens: list[str] = []
+    try:
+        while tokens != previous_tokens:
+            previous_tokens = tokens
+            tokens = _drop_always_true_conditions(tokens)
+            tokens = _push_tag_names(tokens)
+            tokens = _collapse_descendant_steps(tokens)
+            tokens = _drop_grouping(tokens)
+    except ValueError:
+        # Brackets aren't balanced, query is invalid
+        return query
+    return _join(tokens)
+
+
+def _tokenize(query: str) -> list[str] | None:
+    """Split query to tokens, strings are converted to double quotes."""
+    tokens = []
+    position = 0
+    query = query.rstrip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            return None
+        part = match.group(1)
+        if part[0] == "'" and '"' not in part:
+            part = f'"{part[1:-1]}"'
+        tokens.append(part)
+        position = match.end()
+    return tokens
+
+
+def _is_name(part: str) -> bool:
+    """Check whether token is name (of tag, attribute, function, etc)."""
+    return part[0].isalpha() or part[0] == "_"
+
+
+def _is_operand(part: str) -> bool:
+    """Check whether token can end an operand of operator."""
+    return (
+        part in _OPERAND_ENDS
+        or _is_name(part)
+        or part[0] in "\"'"
+        or part[0].isdigit()
+    )
+
+
+def _is_word_operator(tokens: list[str], index: int) -> bool:
+    """Check whether name token is operator (e.g. `and`), not name test."""
+    return (
+        tokens[index] in _WORD_OPERATORS
+        and index > 0
+        and _is_operand(tokens[index - 1])
+        and tokens[index - 1] not in _WORD_OPERATORS
+    )
+
+
+def _find_closing(tokens: list[str], index: int) -> int:
+    """Get index of bracket closing the one at passed index."""
+    opening = tokens[index]
+    closing = ")" if opening == "(" else "]"
+    depth = 0
+    for position in range(index, len(tokens)):
+        if tokens[position] == opening:
+            depth += 1
+        elif tokens[position] == closing:
+            depth -= 1
+            if depth == 0:
+                return position
+    raise ValueError("Brackets of query aren't balanced.")
+
+
+def _has_top_level(tokens: list[str], part: str) -> bool:
+    """Check whether token is present outside of any brackets."""
+    depth = 0
+    for current in tokens:
+        if current in ("(", "["):
+            depth += 1
+        elif current in (")", "]"):
+            depth -= 1
+        elif depth == 0 and current == part:
+            return True
+    return False
+
+
+def _is_positional(condition: list[str]) -> bool:
+    """Check whether result of condition can depend on position of node.
+
+    Check is conservative: only conditions which are surely boolean or
+    node-sets are treated as non-positional.
+
+    """
+    if "position" in condition or "last" in condition:
+        return True
+    if any(
+        _has_top_level(condition, operator)
+        for operator in ("=", "!=", "<", ">", "<=", ">=", "and", "or")
+    ):
+        return False
+    if any(
+        _has_top_level(condition, operator)
+        for operator in ("+", "-", "div", "mod")
+    ):
+        return True
+    first = condition[0]
+    if first in ("@", ".", "..", "/", "//"):
+        return False
+    if _is_name(first):
+        is_call = len(condition) > 1 and condition[1] == "("
+        return is_call and first not in _NON_POSITIONAL_FUNCTIONS
+    return True
+
+
+def _drop_always_true_conditions(tokens: list[str]) -> list[str]:
+    """Drop conditions like `[contains(@class, "")]`."""
+    result: list[str] = []
+    index = 0
+    while index < len(tokens):
+        window = tokens[index : index + 9]
+        if (
+            len(window) == 9
+            and window[0] == "["
+            and window[1] in _ALWAYS_TRUE_FUNCTIONS
+            and window[2:4] == ["(", "@"]
+            and _is_name(window[4])
+            and window[5] == ","
+            and window[6] in ('""', "''")
+            and window[7:] == [")", "]"]
+        ):
+            index += 9
+            continue
+        result.append(tokens[index])
+        index += 1
+    return result
+
+
+def _push_tag_names(tokens: list[str]) -> list[str]:
+    """Replace `*[self::tag]` step with `tag` step."""
+    result: list[str] = []
+    index = 0
+    while index < len(tokens):
+        window = tokens[index : index + 6]
+        if (
+            len(window) == 6
+            and window[0] == "*"
+            and index > 0
+            and tokens[index - 1] in ("/", "//")
+            and window[1:4] == ["[", "self", "::"]
+            and _is_name(window[4])
+            and window[5] == "]"
+        ):
+            result.append(window[4])
+            index += 6
+            continue
+        result.append(tokens[index])
+        index += 1
+    return result
+
+
+def _collapse_descendant_steps(tokens: list[str]) -> list[str]:
+    """Collapse `//.//`, `/./` and `/descendant-or-self::node()/` steps."""
+    result: list[str] = []
+    index = 0
+    while index < len(tokens):
+        part = tokens[index]
+        if part in ("/", "//") and result and result[-1] in ("/", "//"):
+            # Previous step was dropped: `/./` -> `/`, `/.//` -> `//`
+            if part == "//":
+                result[-1] = "//"
+            index += 1
+            continue
+        if (
+            part == "."
+            and index > 0
+            and tokens[index - 1] in ("/", "//")
+            and index + 1 < len(tokens)
+            and tokens[index + 1] in ("/", "//")
+        ):
+            index += 1
+            continue
+        step = tokens[index : index + len(_DESCENDANT_OR_SELF)]
+        if (
+            step == _DESCENDANT_OR_SELF
+            and result
+            and result[-1] in ("/", "//")
+            and index + len(step) < len(tokens)
+            and tokens[index + len(step)] in ("/", "//")
+        ):
+            result[-1] = "//"
+            # Separator after the step is dropped as duplicate
+            index += len(step) + 1
+            continue
+        result.append(part)
+        index += 1
+    return result
+
+
+def _drop_grouping(tokens: list[str]) -> list[str]:
+    """Drop parentheses which don't change result of query."""
+    for index, part in enumerate(tokens):
+        previous = tokens[index - 1] if index else None
+        is_and_operand = previous == "and" and _is_word_operator(
+            tokens,
+            index - 1,
+        )
+        if part != "(" or (
+            previous not in _GROUP_STARTS and not is_and_operand
+        ):
+            continue
+        closing = _find_closing(tokens, index)
+        inner = tokens[index + 1 : closing]
+        following = tokens[closing + 1 : closing + 2]
+        if not inner:
+            continue
+        if _is_condition_operand(tokens, index, closing):
+            # `[(@a) and (@b or @c)]` -> `[@a and (@b or @c)]`
+            return [*tokens[:index], *inner, *tokens[closing + 1 :]]
+        if is_and_operand:
+            continue
+        is_group = (
+            inner[0] == "(" and _find_closing(inner, 0) == len(inner) - 1
+        )
+        if is_group:
+            # `((//a | //b))` -> `(//a | //b)`
+            return [*tokens[:index], *inner, *tokens[closing + 1 :]]
+        if inner[0] not in ("/", "//") or _has_top_level(inner, "|"):
+            continue
+        if not following or following[0] in ("/", "//", "|", ")", "]", ","):
+            return [*tokens[:index], *inner, *tokens[closing + 1 :]]
+        if (
+            following[0] == "["
+            and _is_name_test_end(inner)
+            and _are_non_positional(tokens, closing + 1)
+        ):
+            # `(//div)[@id="x"]` -> `//div[@id="x"]`
+            return [*tokens[:index], *inner, *tokens[closing + 1 :]]
+    return tokens
+
+
+def _is_condition_operand(
+    tokens: list[str],
+    opening: int,
+    closing: int,
+) -> bool:
+    """Check whether parentheses wrap whole condition or operand of `and`.
+
+    Such parentheses can be dropped, except for operand of `and` containing
+    `or`, which has lower precedence.
+
+    """
+    previous = tokens[opening - 1] if opening else None
+    following = tokens[closing + 1] if closing + 1 < len(tokens) else None
+    if previous == "[" and following == "]":
+        return True
+    inner = tokens[opening + 1 : closing]
+    return (
+        previous in ("[", "and")
+        and following in ("]", "and")
+        and not _has_top_level(inner, "or")
+    )
+
+
+def _is_name_test_end(tokens: list[str]) -> bool:
+    """Check whether path ends with name test or condition of step."""
+    last = tokens[-1]
+    return last in ("*", "]") or (_is_name(last) and tokens[-2] != "@")
+
+
+def _are_non_positional(tokens: list[str], index: int) -> bool:
+    """Check that no condition of chain starting at index is positional."""
+    while index < len(tokens) and tokens[index] == "[":
+        closing = _find_closing(tokens, index)
+        condition = tokens[index + 1 : closing]
+        if not condition or _is_positional(condition):
+            return False
+        index = closing + 1
+    return True
+
+
+def _join(tokens: list[str]) -> str:
+    """Join tokens to canonical query."""
+    parts: list[str] = []
+    for index, part in enumerate(tokens):
+        previous = tokens[index - 1] if index else ""
+        is_operator = part in ("|", "+", "-") or _is_word_operator(
+            tokens,
+            index,
+        )
+        was_operator = previous in ("|", "+", "-") or (
+            index > 0 and _is_word_operator(tokens, index - 1)
+        )
+        if parts and (
+            is_operator
+            or was_operator
+            or previous == ","
+            or (
+                _is_operand(previous)
+                and _is_name(part)
+                and previous not in _OPERAND_ENDS
+            )
+        ):
+            parts.append(" ")
+        parts.append(part)
+    return "".join(parts)
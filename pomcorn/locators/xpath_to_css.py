@@ -0,0 +1,196 @@
+"""Module with compilation of simple XPath queries to CSS selectors.
+
+Browsers evaluate CSS selectors natively via ``querySelectorAll``, which is
+faster than evaluation of XPath on large pages. Queries of built-in locators
+and their compositions usually use only the subset of XPath which has
+equivalent CSS selector:
+
+* ``//tag`` and ``//*`` steps joined by ``/`` or ``//``
+* ``[@attr]``, ``[@attr="value"]``, ``[contains(@attr, "value")]`` and
+  ``[starts-with(@attr, "value")]`` predicates joined by ``and``
+* unions of such paths, including grouped ones (``(//a | //b)//img``)
+
+Example:
+  xpath_to_css('//ul[@id="menu"]/li[contains(@class, "item")]')
+  # 'ul[id="menu"] > li[class*="item"]'
+
+Other queries (e.g. with text predicates, indexes or axes) aren't compiled.
+
+"""
+
+import functools
+import re
+
+# Names of tags and attributes which can be used in CSS without escaping
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+
+# Functions of predicates and corresponding CSS attribute operators
+_FUNCTION_OPERATORS = {"contains": "*=", "starts-with": "^="}
+
+
+class _UnsupportedQueryError(Exception):
+    """Error raised if query can't be compiled to CSS selector."""
+
+
+@functools.lru_cache(maxsize=4096)
+def xpath_to_css(query: str) -> str | None:
+    """Compile XPath query to equivalent CSS selector.
+
+    Args:
+        query: XPath query to compile.
+
+    Returns:
+        CSS selector matching the same elements in the same document order
+        or `None` if query can't be expressed in CSS.
+
+    """
+    try:
+        return ", ".join(_Parser(query).parse())
+    except _UnsupportedQueryError:
+        return None
+
+
+class _Parser:
+    """Recursive descent parser of supported subset of XPath.
+
+    Path is parsed to list of alternative CSS selectors, so paths following
+    union are applied to each alternative.
+
+    """
+
+    def __init__(self, query: str):
+        self.query = query
+        self.position = 0
+
+    def parse(self) -> list[str]:
+        """Parse the whole query."""
+        selectors = self._parse_path()
+        self._skip_spaces()
+        if self.position != len(self.query):
+            raise _UnsupportedQueryError
+        return selectors
+
+    def _parse_path(self) -> list[str]:
+        """Parse path, which can start with group of union."""
+        self._skip_spaces()
+        if self._consume("("):
+            selectors = self._parse_union()
+            if not self._consume(")"):
+                raise _UnsupportedQueryError
+            conditions = self._parse_predicates()
+            selectors = [selector + conditions for selector in selectors]
+        elif self.query.startswith("//", self.position):
+            self.position += 2
+            selectors = [self._parse_step()]
+        else:
+            # Absolute path `/html` and relative paths aren't supported
+            raise _UnsupportedQueryError
+
+        while self._consume("/"):
+            combinator = " " if self._consume("/") else " > "
+            step = self._parse_step()
+            selectors = [
+                selector + combinator + step for selector in selectors
+            ]
+        return selectors
+
+    def _parse_union(self) -> list[str]:
+        """Parse paths joined by `|`."""
+        selectors = self._parse_path()
+        self._skip_spaces()
+        while self._consume("|"):
+            selectors += self._parse_path()
+            self._skip_spaces()
+        return selectors
+
+    def _parse_step(self) -> str:
+        """Parse name test of step with its predicates."""
+        if self._consume("*"):
+            tag = ""
+        else:
+            tag = self._parse_name()
+            # Axes (`following-sibling::`) and node tests (`text()`)
+            if self.query.startswith((":", "("), self.position):
+                raise _UnsupportedQueryError
+        conditions = self._parse_predicates()
+        return tag + conditions or "*"
+
+    def _parse_predicates(self) -> str:
+        """Parse predicates of step to CSS attribute selectors."""
+        conditions = ""
+        while self._consume("["):
+            conditions += self._parse_condition()
+            self._skip_spaces()
+            while self._consume("and"):
+                conditions += self._parse_condition()
+                self._skip_spaces()
+            if not self._consume("]"):
+                raise _UnsupportedQueryError
+        return conditions
+
+    def _parse_condition(self) -> str:
+        """Parse single condition on attribute."""
+        self._skip_spaces()
+        if self._consume("@"):
+            attribute = self._parse_name()
+            self._skip_spaces()
+            if not self._consume("="):
+                return f"[{attribute}]"
+            return f"[{attribute}={self._parse_string()}]"
+
+        function = self._parse_name()
+        if function not in _FUNCTION_OPERATORS or not self._consume("("):
+            raise _UnsupportedQueryError
+        self._skip_spaces()
+        if not self._consume("@"):
+            # Conditions on text (`contains(., "text")`) can't be expressed
+            raise _UnsupportedQueryError
+        attribute = self._parse_name()
+        self._skip_spaces()
+        if not self._consume(","):
+            raise _UnsupportedQueryError
+        value = self._parse_string()
+        self._skip_spaces()
+        if not self._consume(")"):
+            raise _UnsupportedQueryError
+        if value == '""':
+            # Any string (even value of missing attribute) contains empty
+            # string, while in CSS such condition matches nothing
+            return ""
+        return f"[{attribute}{_FUNCTION_OPERATORS[function]}{value}]"
+
+    def _parse_name(self) -> str:
+        """Parse name of tag, attribute or function."""
+        match = _NAME.match(self.query, self.position)
+        if match is None:
+            raise _UnsupportedQueryError
+        self.position = match.end()
+        return match.group()
+
+    def _parse_string(self) -> str:
+        """Parse XPath string literal to CSS string."""
+        self._skip_spaces()
+        quote = self.query[self.position : self.position + 1]
+        if quote not in ("'", '"'):
+            raise _UnsupportedQueryError
+        end = self.query.find(quote, self.position + 1)
+        if end == -1:
+            raise _UnsupportedQueryError
+        value = self.query[self.position + 1 : end]
+        if "\n" in value:
+            raise _UnsupportedQueryError
+        self.position = end + 1
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{value}"'
+
+    def _consume(self, token: str) -> bool:
+        """Move to the next token if query continues with passed one."""
+        if not self.query.startswith(token, self.position):
+            return False
+        self.position += len(token)
+        return True
+
+    def _skip_spaces(self) -> None:
+        """Move to the next non space character of query."""
+        while self.query[self.position : self.position + 1].isspace():
+            self.position += 1
@@ -2,6 +2,10 @@ from typing import Self
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from . import tracing
+from .polling import PollingStrategy
+from .tracing import traced
+from .wait_policy import WaitPolicy
 from .web_view import WebView
 
 
@@ -15,26 +19,37 @@ class Page(WebView):
 
     APP_ROOT: str
 
+    @traced("page", name="init")
     def __init__(
         self,
         webdriver: WebDriver,
         *,
         app_root: str | None = None,
-        wait_timeout: float = 5.0,
-        poll_frequency: float = 0.01,
+        wait_timeout: float | None = None,
+        poll_frequency: float | None = None,
+        wait_in_browser: bool | None = None,
+        wait_policy: WaitPolicy | None = None,
     ):
         """Initialize page.
 
-        Call `wait_until_loaded` method after initialization.
+        Call `wait_until_loaded` method after initialization and prefetch
+        elements if `prefetch_elements` is enabled.
 
         Args:
             webdriver: Instance of a class for managing the browser.
             app_root: The URL of base page, by default the value of `APP_ROOT`
                 attribute is used.
-            wait_timeout: Number of seconds before timing out.
+            wait_timeout: Number of seconds before timing out. By default,
+                the value of `wait_policy` attribute is used (5 seconds).
             poll_frequency: Time between checks of `wait` condition, lower
                 interval - faster checks. This allows to improve overall tests
-                speed.
+                speed. By default, the value of `wait_policy` attribute is
+                used (0.01 seconds).
+            wait_in_browser: Whether to check element wait conditions inside
+                the browser or not. By default, the value of `wait_policy`
+                attribute is used (`False`). See ``WebView`` for details.
+            wait_policy: Settings of waits shared with all page components,
+                by default the value of `wait_policy` attribute is used.
 
         """
         super().__init__(
@@ -42,8 +57,12 @@ class Page(WebView):
             app_root=app_root or self.APP_ROOT,
             wait_timeout=wait_timeout,
             poll_frequency=poll_frequency,
+            wait_in_browser=wait_in_browser,
+            wait_policy=wait_policy,
         )
         self.wait_until_loaded()
+        if self.prefetch_elements:
+            self.prefetch()
 
     def check_page_is_loaded(self) -> bool:
         """Return result of check that the page is loaded.
@@ -64,22 +83,28 @@ class Page(WebView):
     ) -> Self:
         """Open page and initialize page object.
 
+        If `budget` of wait policy is specified, all waits of page
+        initialization take no more than budget in total.
+
         Args:
             webdriver: Instance of a WebDriver class for managing the browser.
             app_root: The URL of page, by default the value of `APP_ROOT`
                 attribute is used.
 
         """
-        webdriver.get(url=f"{app_root or cls.APP_ROOT}")
-        # hack to not specify app_root in each page init method
-        kwargs = {}
-        if app_root:
-            kwargs = {"app_root": app_root}
-
-        # Mypy raise error on unpacking `kwargs`:
-        # "Page" has incompatible type "**dict[str, str]"; expected "int"
-        # "Page" has incompatible type "**dict[str, str]"; expected "float"
-        return cls(webdriver, **kwargs)  # type: ignore
+        url = f"{app_root or cls.APP_ROOT}"
+        with tracing.span(f"{cls.__name__}.open", "page", url=url):
+            webdriver.get(url=url)
+            # hack to not specify app_root in each page init method
+            kwargs = {}
+            if app_root:
+                kwargs = {"app_root": app_root}
+
+            # Mypy raise error on unpacking `kwargs`:
+            # "Page" has incompatible type "**dict[str, str]"; expected "int"
+            # "Page" has incompatible type "**dict[str, str]"; expected "float"
+            with cls.wait_policy.budget_deadline():
+                return cls(webdriver, **kwargs)  # type: ignore
 
     @classmethod
     def open_from_url(
@@ -94,6 +119,9 @@ class Page(WebView):
 
         Add `path` to `app_root` in browser URL.
 
+        If `budget` of wait policy is specified, all waits of page
+        initialization take no more than budget in total.
+
         Args:
             webdriver: Instance of a WebDriver class for managing the browser.
             app_root: The URL of page, by default the value of `APP_ROOT`
@@ -110,22 +138,37 @@ class Page(WebView):
         # We don't use `page.navigate_relative` here because we need to
         # navigate to relative url before page is initialized, since otherwise
         # `wait_until_loaded` method in page `__init__` method might fail.
-        webdriver.get(
-            url=cls._get_full_relative_url(app_root or cls.APP_ROOT, path),
-        )
+        url = cls._get_full_relative_url(app_root or cls.APP_ROOT, path)
+        with tracing.span(f"{cls.__name__}.open", "page", url=url):
+            webdriver.get(url=url)
 
-        page = cls(webdriver, **kwargs)
+            wait_policy = kwargs.get("wait_policy") or cls.wait_policy
+            with wait_policy.budget_deadline():
+                page = cls(webdriver, **kwargs)
         return page
 
     def refresh(self) -> None:
-        """Refresh web page and wait until it is loaded."""
+        """Refresh web page and wait until it is loaded.
+
+        Elements are prefetched again if `prefetch_elements` is enabled.
+
+        """
         self.webdriver.refresh()
+        self.mark_dom_changed()
         self.wait_until_loaded()
+        if self.prefetch_elements:
+            self.prefetch()
 
-    def wait_until_loaded(self, timeout: float | None = None) -> None:
+    @traced("wait")
+    def wait_until_loaded(
+        self,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+    ) -> None:
         """Wait until page is loaded."""
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
             method=lambda _: self.check_page_is_loaded(),
             message=(
                 f"Page `{self.__class__}` didn't loaded in "
@@ -141,6 +184,7 @@ class Page(WebView):
 
         """
         self.webdriver.get(url)
+        self.mark_dom_changed()
 
     def navigate_relative(self, relative_url: str = "/") -> None:
         """Navigate to URL relative to application root.
@@ -152,6 +196,7 @@ class Page(WebView):
         self.webdriver.get(
             self._get_full_relative_url(self.app_root, relative_url),
         )
+        self.mark_dom_changed()
 
     def click_on_page(self) -> None:
         """Click on (1, 1) coordinates of page (left upper corner).
@@ -167,6 +212,7 @@ class Page(WebView):
         action = ActionBuilder(self.webdriver)
         action.pointer_action.move_to_location(1, 1).click()
         action.perform()
+        self.mark_dom_changed()
 
     @staticmethod
     def _get_full_relative_url(app_root: str, relative_url: str) -> str:
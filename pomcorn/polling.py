@@ -0,0 +1,361 @@
+"""Module with strategies of polling wait conditions.
+
+``WebDriverWait`` checks condition with fixed interval, which is a trade-off:
+small interval floods remote drivers with commands, while large interval
+wastes time after condition is met. Strategies allow to check condition often
+right after the start of the wait and more rarely later.
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Literal, TypeAlias, TypeVar
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+T = TypeVar("T")
+
+# Message of timed out wait or callable which builds it. Callable is called
+# only on timeout, so message can include info requested from the browser.
+WaitMessage: TypeAlias = str | Callable[[], str]
+
+# Whether code of the current context is executed to check wait condition
+_is_waiting: ContextVar[bool] = ContextVar("pomcorn_is_waiting", default=False)
+
+
+@contextmanager
+def waiting() -> Iterator[None]:
+    """Mark code inside the block as check of wait condition.
+
+    Used by ``pomcorn.instrumentation`` to tell commands made by waits from
+    the other ones.
+
+    """
+    token = _is_waiting.set(True)
+    try:
+        yield
+    finally:
+        _is_waiting.reset(token)
+
+
+def is_waiting() -> bool:
+    """Check whether code is executed to check wait condition."""
+    return _is_waiting.get()
+
+
+class PollingStrategy:
+    """Base class of strategy which defines delays between condition checks."""
+
+    def get_delays(self) -> Iterator[float]:
+        """Get delays in seconds between checks of a single wait."""
+        raise NotImplementedError
+
+
+class FixedPolling(PollingStrategy):
+    """Strategy to check condition with fixed interval.
+
+    The same as the default behavior of ``WebDriverWait``.
+
+    """
+
+    def __init__(self, interval: float):
+        """Init strategy.
+
+        Args:
+            interval: Number of seconds between checks.
+
+        """
+        self.interval = interval
+
+    def get_delays(self) -> Iterator[float]:
+        """Get delays in seconds between checks of a single wait."""
+        while True:
+            yield self.interval
+
+    def __repr__(self) -> str:
+        return f"FixedPolling(interval={self.interval})"
+
+
+class ExponentialPolling(PollingStrategy):
+    """Strategy to check condition with exponentially growing interval.
+
+    The first check is done right after the start of the wait, the second one
+    after `first_delay`, and then the delay is multiplied by `factor` until it
+    reaches `max_delay`. Each delay is randomly changed by `jitter` share, so
+    waits of parallel tests don't load remote driver at the same moments.
+
+    """
+
+    def __init__(
+        self,
+        first_delay: float = 0.01,
+        factor: float = 2,
+        max_delay: float = 0.5,
+        jitter: float = 0.1,
+    ):
+        """Init strategy.
+
+        Args:
+            first_delay: Number of seconds between the first and the second
+                checks.
+            factor: Multiplier of delay for each next check.
+            max_delay: Max number of seconds between checks.
+            jitter: Max share of delay by which it's randomly increased or
+                decreased. For example, `0.1` means +-10%.
+
+        """
+        self.first_delay = first_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def get_delays(self) -> Iterator[float]:
+        """Get delays in seconds between checks of a single wait."""
+        delay = self.first_delay
+        while True:
+            # Random isn't used for security purposes here
+            spread = random.uniform(-self.jitter, self.jitter)  # noqa: S311
+            yield delay * (1 + spread)
+            delay = min(delay * self.factor, self.max_delay)
+
+    def __repr__(self) -> str:
+        return (
+            f"ExponentialPolling(first_delay={self.first_delay}, "
+            f"factor={self.factor}, max_delay={self.max_delay}, "
+            f"jitter={self.jitter})"
+        )
+
+
+@dataclass(frozen=True)
+class WaitRecord:
+    """Information about finished wait.
+
+    Attributes:
+        polls: Number of condition checks.
+        duration: Number of seconds the wait took.
+        is_successful: Whether the condition was met or wait timed out.
+        is_nested: Whether the wait was made to check condition of another
+            wait, so its duration is part of duration of outer wait.
+
+    """
+
+    polls: int
+    duration: float
+    is_successful: bool
+    is_nested: bool = False
+
+
+class WaitStats:
+    """Storage of statistics of finished waits.
+
+    Duration of waits nested in conditions of other waits isn't added to
+    total `duration`, because it's already counted in duration of the
+    outermost wait.
+
+    Allows to measure load of waits on the driver, e.g. per test:
+
+    .. code-block:: python
+
+        page.wait_policy.stats.reset()
+        ...
+        assert page.wait_policy.stats.polls < 100
+
+    """
+
+    def __init__(self, max_records: int = 1000):
+        """Init storage.
+
+        Args:
+            max_records: Number of the latest waits to keep records of.
+
+        """
+        self.records: deque[WaitRecord] = deque(maxlen=max_records)
+        self.waits = 0
+        self.polls = 0
+        self.duration = 0.0
+
+    def add(self, record: WaitRecord):
+        """Add record of finished wait."""
+        self.records.append(record)
+        self.waits += 1
+        self.polls += record.polls
+        if not record.is_nested:
+            self.duration += record.duration
+
+    def reset(self):
+        """Forget all recorded waits."""
+        self.records.clear()
+        self.waits = 0
+        self.polls = 0
+        self.duration = 0.0
+
+    def __repr__(self) -> str:
+        return f"WaitStats(waits={self.waits}, polls={self.polls})"
+
+
+# Storages collecting statistics of all waits of the current context
+_collected_stats: ContextVar[tuple[WaitStats, ...]] = ContextVar(
+    "pomcorn_collected_stats",
+    default=(),
+)
+
+
+@contextmanager
+def collect_wait_stats() -> Iterator[WaitStats]:
+    """Collect statistics of all waits finished inside the block.
+
+    Unlike ``WaitPolicy.stats``, statistics include waits of all policies,
+    e.g. to measure waits of a test.
+
+    """
+    stats = WaitStats()
+    token = _collected_stats.set((*_collected_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _collected_stats.reset(token)
+
+
+class PomcornWait(WebDriverWait[WebDriver]):
+    """`WebDriverWait` which checks condition according to polling strategy.
+
+    Also counts checks of each wait and reports them to `stats`. Wait can be
+    shared by many page objects and used by nested waits (e.g. inside
+    condition of another wait), so count of checks isn't stored in wait.
+
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: float,
+        poll_frequency: float = 0,
+        ignored_exceptions: Any = None,
+        polling: PollingStrategy | None = None,
+        stats: WaitStats | None = None,
+    ):
+        """Init wait.
+
+        Args:
+            driver: Instance of a class for managing the browser.
+            timeout: Number of seconds before timing out.
+            poll_frequency: Time between checks of condition. Used only if
+                `polling` isn't passed.
+            ignored_exceptions: Iterable structure of exception classes
+                ignored during checks.
+            polling: Strategy which defines delays between checks.
+            stats: Storage to report finished waits to.
+
+        """
+        super().__init__(
+            driver=driver,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions,
+        )
+        self.polling = polling or FixedPolling(self._poll)
+        self.stats = stats
+
+    def until(
+        self,
+        method: Callable[[WebDriver], Literal[False] | T],
+        message: WaitMessage = "",
+    ) -> T:
+        """Wait until the method returns a value that is not False."""
+        return self._poll_until(method, message, is_met=bool)
+
+    def until_not(
+        self,
+        method: Callable[[WebDriver], T],
+        message: WaitMessage = "",
+    ) -> T | Literal[True]:
+        """Wait until the method returns a value that is False."""
+        return self._poll_until(
+            method,
+            message,
+            is_met=lambda value: not value,
+            is_met_on_ignored_exception=True,
+        )
+
+    def _poll_until(
+        self,
+        method: Callable[[WebDriver], Any],
+        message: WaitMessage,
+        is_met: Callable[[Any], bool],
+        is_met_on_ignored_exception: bool = False,
+    ) -> Any:
+        """Check condition according to polling strategy until it's met.
+
+        Args:
+            method: Callable which accepts driver and returns value to check.
+            message: Message of exception if condition isn't met in time or
+                callable which builds it.
+            is_met: Callable which accepts value returned by `method` and
+                returns whether condition is met.
+            is_met_on_ignored_exception: Whether condition is met if `method`
+                raises one of ignored exceptions.
+
+        """
+        screen = None
+        stacktrace = None
+        delays = self.polling.get_delays()
+
+        polls = 0
+        started_at = time.monotonic()
+        end_time = started_at + self._timeout
+        while True:
+            polls += 1
+            try:
+                with waiting():
+                    value = method(self._driver)
+                if is_met(value):
+                    self._report(started_at, polls, is_successful=True)
+                    return value
+            except self._ignored_exceptions as exc:
+                if is_met_on_ignored_exception:
+                    self._report(started_at, polls, is_successful=True)
+                    return True
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining_time = end_time - time.monotonic()
+            if remaining_time < 0:
+                break
+            # Don't sleep after timeout to check condition for the last time
+            time.sleep(min(next(delays), remaining_time))
+
+        self._report(started_at, polls, is_successful=False)
+        if callable(message):
+            message = message()
+        raise TimeoutException(message, screen, stacktrace)
+
+    def _report(
+        self,
+        started_at: float,
+        polls: int,
+        is_successful: bool,
+    ) -> None:
+        """Report finished wait to stats and collected stats.
+
+        Wait is nested if it's reported while condition of another wait is
+        checked.
+
+        """
+        record = WaitRecord(
+            polls=polls,
+            duration=time.monotonic() - started_at,
+            is_successful=is_successful,
+            is_nested=is_waiting(),
+        )
+        if self.stats is not None:
+            self.stats.add(record)
+        for stats in _collected_stats.get():
+            stats.add(record)
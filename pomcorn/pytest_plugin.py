@@ -0,0 +1,123 @@
+"""Pytest plugin to limit WebDriver commands and waits of tests.
+
+Plugin is registered automatically when pomcorn is installed. Mark test with
+``pomcorn_budget`` to fail it if it sends more WebDriver commands or spends
+more time in waits than expected (including setup of fixtures requested after
+``webdriver`` one, e.g. opening of page):
+
+.. code-block:: python
+
+    @pytest.mark.pomcorn_budget(commands=50, wait_seconds=3)
+    def test_search(index_page: IndexPage):
+        index_page.search("pomcorn")
+
+Commands are recorded from ``webdriver`` fixture. Use
+``pomcorn_webdriver_fixture`` ini option to specify another fixture name.
+Use ``pomcorn_commands`` fixture to make assertions on recorded commands.
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import pytest
+
+from .instrumentation import CommandRecorder
+from .polling import WaitStats, collect_wait_stats
+
+BUDGET_MARKER = "pomcorn_budget"
+
+# Number of callers with the most commands listed in failure message
+_TOP_CALLERS_COUNT = 5
+
+
+@dataclass(frozen=True)
+class BudgetUsage:
+    """Commands and waits recorded during test."""
+
+    commands: CommandRecorder
+    waits: WaitStats
+
+
+_usage_key = pytest.StashKey[BudgetUsage]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add ini option with name of webdriver fixture."""
+    parser.addini(
+        "pomcorn_webdriver_fixture",
+        help="Name of fixture of webdriver to record commands of.",
+        default="webdriver",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register budget marker."""
+    config.addinivalue_line(
+        "markers",
+        f"{BUDGET_MARKER}(commands=None, wait_seconds=None): fail test if it "
+        "sends more WebDriver commands or spends more seconds in waits.",
+    )
+
+
+@pytest.fixture
+def pomcorn_commands(
+    request: pytest.FixtureRequest,
+) -> Iterator[CommandRecorder]:
+    """Record WebDriver commands and waits of test."""
+    webdriver = request.getfixturevalue(
+        request.config.getini("pomcorn_webdriver_fixture"),
+    )
+    with (
+        CommandRecorder(webdriver) as recorder,
+        collect_wait_stats() as wait_stats,
+    ):
+        request.node.stash[_usage_key] = BudgetUsage(recorder, wait_stats)
+        yield recorder
+
+
+@pytest.fixture(autouse=True)
+def _pomcorn_budget(request: pytest.FixtureRequest) -> None:
+    """Start recording of marked test before other fixtures."""
+    if request.node.get_closest_marker(BUDGET_MARKER):
+        request.getfixturevalue("pomcorn_commands")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item: pytest.Item) -> None:
+    """Fail test which exceeded its budget.
+
+    It's called after the test passes, so failure is reported as failure of
+    test itself.
+
+    """
+    marker = item.get_closest_marker(BUDGET_MARKER)
+    usage = item.stash.get(_usage_key, None)
+    if marker is None or usage is None:
+        return
+
+    errors = []
+    commands_budget = marker.kwargs.get("commands")
+    if commands_budget is not None and usage.commands.count > commands_budget:
+        top_callers = sorted(
+            usage.commands.get_stats_by_caller().items(),
+            key=lambda item: item[1].count,
+            reverse=True,
+        )[:_TOP_CALLERS_COUNT]
+        callers = ", ".join(
+            f"{caller} ({stats.count})" for caller, stats in top_callers
+        )
+        errors.append(
+            f"Test sent {usage.commands.count} WebDriver commands, budget is "
+            f"{commands_budget}. Commands by callers: {callers}.",
+        )
+    wait_budget = marker.kwargs.get("wait_seconds")
+    if wait_budget is not None and usage.waits.duration > wait_budget:
+        errors.append(
+            f"Test spent {usage.waits.duration:.2f} seconds in "
+            f"{usage.waits.waits} waits, budget is {wait_budget} seconds.",
+        )
+    if errors:
+        pytest.fail("\n".join(errors), pytrace=False)
@@ -0,0 +1,304 @@
+"""Module with recording and replay of WebDriver commands.
+
+``CommandsRecording`` records every command sent by webdriver with its
+response. Saved recording can be replayed by ``ReplayWebDriver`` without
+browser, so the same scenario can be rerun quickly and deterministically,
+e.g. to check that changes of page objects don't change sent commands.
+
+Example:
+  with CommandsRecording(webdriver) as recording:
+      MainPage.open(webdriver).products.all
+  recording.save("main_page.json.gz")
+
+  replay_webdriver = ReplayWebDriver("main_page.json.gz")
+  MainPage.open(replay_webdriver).products.all
+
+Recording is saved as JSON (compressed by gzip if path ends with ``.gz``).
+Scripts are saved once and referred by index from commands.
+
+"""
+
+from __future__ import annotations
+
+import copy
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Self, cast
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from . import scripts
+
+# Version of format of saved recording
+_FORMAT_VERSION = 1
+
+# Indexes of arguments of scripts which depend on time of run, so they are
+# not compared in strict mode. E.g. timeout of in-browser wait is limited by
+# time remaining until deadline.
+_TIME_DEPENDENT_SCRIPT_ARGS: dict[str, tuple[int, ...]] = {
+    scripts.WAIT_FOR_CONDITION: (5,),
+}
+
+
+class ReplayError(Exception):
+    """Error raised if command can't be replayed from recording."""
+
+
+class CommandsRecording:
+    """Recording of commands sent by webdriver and their responses.
+
+    Recording replaces connection of webdriver instance while it's active, so
+    all commands are recorded: sent by pomcorn, by selenium helpers and by
+    test code itself.
+
+    """
+
+    def __init__(self, webdriver: WebDriver | None = None):
+        """Init recording.
+
+        Args:
+            webdriver: Instance of a class for managing the browser. Can be
+                omitted to only load and replay saved recording.
+
+        """
+        self.webdriver = webdriver
+        # Each command is `[command, params, response]`
+        self.commands: list[list[Any]] = []
+        self.scripts: list[str] = []
+        self._connection: RemoteConnection | None = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Load recording saved by `save` method."""
+        path = Path(path)
+        content = (
+            gzip.decompress(path.read_bytes()).decode()
+            if path.suffix == ".gz"
+            else path.read_text()
+        )
+        data = json.loads(content)
+        if data.get("version") != _FORMAT_VERSION:
+            raise ReplayError(
+                f"Recording `{path}` has unsupported format version.",
+            )
+        recording = cls()
+        recording.scripts = data["scripts"]
+        recording.commands = data["commands"]
+        return recording
+
+    def start(self):
+        """Start recording commands of webdriver."""
+        if self._connection is not None or self.webdriver is None:
+            return
+        self._connection = cast(
+            RemoteConnection,
+            self.webdriver.command_executor,
+        )
+        self.webdriver.command_executor = cast(RemoteConnection, self)
+
+    def stop(self):
+        """Stop recording commands of webdriver."""
+        if self._connection is None or self.webdriver is None:
+            return
+        self.webdriver.command_executor = self._connection
+        self._connection = None
+
+    def execute(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Send command via original connection and record it."""
+        if self._connection is None:
+            raise ReplayError("Recording isn't started.")
+        response = self._connection.execute(command, params)
+        # Webdriver replaces values of response with `WebElement` instances
+        self.commands.append(
+            [command, self.pack_params(params), copy.deepcopy(response)],
+        )
+        return response
+
+    def pack_params(
+        self,
+        params: dict[str, Any] | None,
+        add_scripts: bool = True,
+    ) -> dict[str, Any]:
+        """Prepare params of command to be saved or compared with saved ones.
+
+        Session id is removed, because it's different in each session, and
+        script is replaced with its index in `self.scripts`.
+
+        Args:
+            params: Params of command.
+            add_scripts: Whether to add script to `self.scripts` if it's not
+                there yet. If it's `False`, unknown script is kept as is.
+
+        """
+        params = {
+            key: value
+            for key, value in (params or {}).items()
+            if key != "sessionId"
+        }
+        script = params.get("script")
+        if script is not None:
+            if add_scripts and script not in self.scripts:
+                self.scripts.append(script)
+            if script in self.scripts:
+                params["script"] = self.scripts.index(script)
+        return params
+
+    def save(self, path: str | Path):
+        """Save recording to JSON file (compressed if path ends with `.gz`)."""
+        path = Path(path)
+        content = json.dumps(
+            {
+                "version": _FORMAT_VERSION,
+                "scripts": self.scripts,
+                "commands": self.commands,
+            },
+            separators=(",", ":"),
+        )
+        if path.suffix == ".gz":
+            path.write_bytes(gzip.compress(content.encode()))
+        else:
+            path.write_text(content)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"CommandsRecording(commands={len(self.commands)})"
+
+
+class ReplayConnection:
+    """Connection which returns recorded responses instead of browser.
+
+    Commands should be sent in the same order as they were recorded. It's
+    used by ``ReplayWebDriver`` instead of ``RemoteConnection``.
+
+    """
+
+    def __init__(self, recording: CommandsRecording, strict: bool = True):
+        """Init connection.
+
+        Args:
+            recording: Recording to replay.
+            strict: Whether to check that params of commands are the same as
+                recorded or check only names of commands.
+
+        """
+        self.recording = recording
+        self.strict = strict
+        self.position = 0
+
+    def rewind(self):
+        """Start replaying from the first recorded command."""
+        self.position = 0
+
+    def execute(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Return recorded response of command.
+
+        Raises:
+            ReplayError: If command is different from recorded one or all
+                recorded commands are already replayed.
+
+        """
+        # Session is usually started before recording
+        if command == Command.NEW_SESSION:
+            return {
+                "value": {
+                    "sessionId": "replay",
+                    "capabilities": {"browserName": "replay"},
+                },
+            }
+        if self.position >= len(self.recording.commands):
+            raise ReplayError(
+                f"Command `{command}` is sent after all recorded commands.",
+            )
+        recorded_command, recorded_params, response = self.recording.commands[
+            self.position
+        ]
+        if command != recorded_command or (
+            self.strict
+            and self._get_comparable_params(
+                self.recording.pack_params(params, add_scripts=False),
+            )
+            != self._get_comparable_params(recorded_params)
+        ):
+            raise ReplayError(
+                f"Command #{self.position} `{command}` with params "
+                f"`{params}` differs from recorded `{recorded_command}` "
+                f"with params `{recorded_params}`.",
+            )
+        self.position += 1
+        # Webdriver replaces values of response with `WebElement` instances
+        return copy.deepcopy(response)
+
+    def _get_comparable_params(
+        self,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Get packed params of command without time dependent arguments.
+
+        Arguments of script listed in `_TIME_DEPENDENT_SCRIPT_ARGS` are
+        replaced with `None`, so the same scenario run under deadline matches
+        recorded one.
+
+        """
+        script = params.get("script")
+        if isinstance(script, int):
+            script = self.recording.scripts[script]
+        if not isinstance(script, str) or "args" not in params:
+            return params
+        ignored_args = _TIME_DEPENDENT_SCRIPT_ARGS.get(script, ())
+        if not ignored_args:
+            return params
+        args = [
+            None if index in ignored_args else arg
+            for index, arg in enumerate(params["args"])
+        ]
+        return {**params, "args": args}
+
+
+class ReplayWebDriver(WebDriver):
+    """WebDriver which replays recorded commands without browser."""
+
+    def __init__(
+        self,
+        recording: CommandsRecording | str | Path,
+        strict: bool = True,
+    ):
+        """Init webdriver.
+
+        Args:
+            recording: Recording or path to saved recording to replay.
+            strict: Whether to check that params of commands are the same as
+                recorded or check only names of commands.
+
+        """
+        if not isinstance(recording, CommandsRecording):
+            recording = CommandsRecording.load(recording)
+        self.connection = ReplayConnection(recording, strict=strict)
+        super().__init__(
+            command_executor=cast(RemoteConnection, self.connection),
+            options=ArgOptions(),
+            # Values of `send_keys` shouldn't be checked as local files
+            file_detector=UselessFileDetector(),
+        )
+
+    def rewind(self):
+        """Start replaying from the first recorded command."""
+        self.connection.rewind()
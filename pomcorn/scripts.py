@@ -0,0 +1,343 @@
+"""Module with JavaScript snippets executed by pomcorn in the browser.
+
+Scripts are stored as constants, so each of them is sent to the browser as is
+and can be recognized by identity (for example, by fake drivers in tests).
+
+Scripts that look for elements accept locator as two first arguments: the
+strategy (``xpath`` or ``css selector``) and the query. Use
+``get_script_locator`` to prepare them from ``Locator`` instance.
+
+"""
+
+import pkgutil
+
+from selenium.webdriver.common.by import By
+
+from pomcorn.locators.base_locators import Locator
+
+# Selenium's `isDisplayed` atom, which `WebElement.is_displayed` runs. It's
+# reused, so elements found in the browser are visible by the same rules as in
+# waits through WebDriver (e.g. zero-size element with visible children or
+# overflowing content is displayed).
+_IS_DISPLAYED = pkgutil.get_data(
+    "selenium.webdriver.remote",
+    "isDisplayed.js",
+).decode("utf8")  # type: ignore[union-attr]
+
+# Helpers shared by scripts below. They are prepended to scripts instead of
+# being installed into the page, so scripts are independent of page state.
+_HELPERS = (
+    f"const isDisplayed = {_IS_DISPLAYED};\n"
+    + """
+const findAll = (by, query, root = document) => {
+    if (by === "xpath") {
+        const found = document.evaluate(
+            query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null,
+        );
+        return Array.from(
+            {length: found.snapshotLength},
+            (_, index) => found.snapshotItem(index),
+        );
+    }
+    return Array.from(root.querySelectorAll(query));
+};
+const findFirst = (by, query, root = document) => {
+    if (by === "xpath") {
+        return document.evaluate(
+            query, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+        ).singleNodeValue;
+    }
+    return root.querySelector(query);
+};
+const isVisible = (element) => isDisplayed(element);
+// The same text as `WebElement.text` returns: visible text with whitespace
+// collapsed in each line and without empty lines
+const getVisibleText = (element) => {
+    if (!isVisible(element)) {
+        return "";
+    }
+    return element.innerText
+        .split("\\n")
+        .map((line) => line.replace(/\\s+/g, " ").trim())
+        .filter((line) => line)
+        .join("\\n");
+};
+const getColumnValue = (item, [by, query, attribute]) => {
+    const element = by ? findFirst(by, query, item) : item;
+    if (!element) {
+        return null;
+    }
+    return attribute ? element.getAttribute(attribute) : (
+        getVisibleText(element)
+    );
+};
+"""
+)
+
+# Return `[element, is_visible]` pair for each element matching locator.
+ELEMENTS_SNAPSHOT = (
+    _HELPERS
+    + """
+return findAll(arguments[0], arguments[1]).map(
+    (element) => [element, isVisible(element)],
+);
+"""
+)
+
+# Return number of elements matching locator without transferring them.
+# Arguments are `by` and `query` of locator and element to look inside (or
+# `null` to look in the whole document).
+COUNT_ELEMENTS = (
+    _HELPERS
+    + """
+const [by, query, root] = arguments;
+if (by === "xpath") {
+    return document.evaluate(
+        `count(${query})`, root || document, null, XPathResult.NUMBER_TYPE,
+        null,
+    ).numberValue;
+}
+return (root || document).querySelectorAll(query).length;
+"""
+)
+
+# Return whether at least one element matches locator, search stops at the
+# first match. Arguments are the same as of `COUNT_ELEMENTS`.
+HAS_ELEMENTS = (
+    _HELPERS
+    + """
+const [by, query, root] = arguments;
+return findFirst(by, query, root || document) !== null;
+"""
+)
+
+# Extract values of columns from all elements matching locator of items.
+# Arguments are `by` and `query` of items locator and list of columns
+# `[by, query, attribute]`: locator relative to item (or `null` to extract
+# value from item itself) and attribute name (or `null` to extract text as
+# `WebElement.text` returns it, e.g. empty for hidden element). Return list of
+# values of each column, value is `null` if element or attribute is absent.
+EXTRACT_COLUMNS = (
+    _HELPERS
+    + """
+const [by, query, columns] = arguments;
+const items = findAll(by, query);
+return columns.map(
+    (column) => items.map((item) => getColumnValue(item, column)),
+);
+"""
+)
+
+# Return `[element, key]` pair for each element matching locator. Arguments
+# are `by` and `query` of locator and column of key (see `EXTRACT_COLUMNS`).
+KEYED_ELEMENTS = (
+    _HELPERS
+    + """
+const [by, query, keyColumn] = arguments;
+return findAll(by, query).map(
+    (element) => [element, getColumnValue(element, keyColumn)],
+);
+"""
+)
+
+# Return `[element, is_visible, text]` for the first element matching each
+# locator of list of `[by, query]` locators passed as the first argument.
+# Element is `null` if it's not found, text is `null` if element isn't visible
+# (WebDriver returns only visible text of elements).
+PREFETCH_ELEMENTS = (
+    _HELPERS
+    + """
+return arguments[0].map(([by, query]) => {
+    const element = findFirst(by, query);
+    if (!element) {
+        return [null, false, null];
+    }
+    const isElementVisible = isVisible(element);
+    return [
+        element,
+        isElementVisible,
+        isElementVisible ? getVisibleText(element) : null,
+    ];
+});
+"""
+)
+
+# Set values of form fields and dispatch `input` and `change` events, as
+# browser does when user types. Arguments are list of `[by, query]` locators,
+# list of values and flag whether only visible fields should be filled.
+# Return status for each field: `filled`, `not_found`, `not_visible` or
+# `not_editable` (field can't be filled by setting value).
+FILL_FORM = (
+    _HELPERS
+    + """
+const editableInputTypes = [
+    "", "text", "search", "email", "url", "tel", "password", "number",
+    "date", "datetime-local", "month", "week", "time", "color",
+];
+const isEditable = (element) => {
+    if (element.disabled || element.readOnly) {
+        return false;
+    }
+    if (element instanceof HTMLTextAreaElement) {
+        return true;
+    }
+    return (
+        element instanceof HTMLInputElement
+        && editableInputTypes.includes(
+            (element.getAttribute("type") || "").toLowerCase(),
+        )
+    );
+};
+const [fieldsLocators, values, onlyVisible] = arguments;
+return fieldsLocators.map(([by, query], index) => {
+    const element = findFirst(by, query);
+    if (!element) {
+        return "not_found";
+    }
+    if (onlyVisible && !isVisible(element)) {
+        return "not_visible";
+    }
+    if (!isEditable(element)) {
+        return "not_editable";
+    }
+    // Use native setter, so frameworks which track `value` property (e.g.
+    // React) notice the change. It's taken from the built-in class because
+    // prototypes of subclasses (e.g. customized built-in elements) don't
+    // define it.
+    const elementClass = (
+        element instanceof HTMLTextAreaElement
+            ? HTMLTextAreaElement
+            : HTMLInputElement
+    );
+    const {set} = Object.getOwnPropertyDescriptor(
+        elementClass.prototype, "value",
+    );
+    set.call(element, values[index]);
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+    return "filled";
+});
+"""
+)
+
+# Wait in the browser until condition is met for element matching locator.
+# Arguments are condition name (`visible`, `invisible`, `clickable`, `text` or
+# `absent`), `by` and `query` of locator, already found element (or `null`),
+# text for `text` condition and timeout in milliseconds. Condition is checked
+# on each DOM mutation and each animation frame (to notice changes of layout),
+# so wait returns within a frame after condition is met.
+# Return `[true, element]` if condition is met (element is `null` for
+# conditions which don't need it) or `[false, null]` after timeout.
+WAIT_FOR_CONDITION = (
+    _HELPERS
+    + """
+const [condition, by, query, foundElement, text, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const getElement = () => foundElement || findFirst(by, query);
+const getText = (element) => element.innerText ?? element.textContent;
+const conditions = {
+    visible: () => {
+        const element = getElement();
+        return element && isVisible(element) ? [true, element] : null;
+    },
+    invisible: () => {
+        const element = getElement();
+        return !element || !isVisible(element) ? [true, null] : null;
+    },
+    clickable: () => {
+        const element = getElement();
+        return (
+            element && isVisible(element) && !element.disabled
+                ? [true, element]
+                : null
+        );
+    },
+    text: () => {
+        const element = getElement();
+        const hasText = element && getText(element).includes(text);
+        return hasText ? [true, null] : null;
+    },
+    absent: () => (getElement() ? null : [true, null]),
+};
+
+let isFinished = false;
+let frame = null;
+const observer = new MutationObserver(() => check());
+const timer = setTimeout(() => finish([false, null]), timeout);
+const finish = (result) => {
+    isFinished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    cancelAnimationFrame(frame);
+    done(result);
+};
+const check = () => {
+    if (isFinished) {
+        return;
+    }
+    const result = conditions[condition]();
+    if (result) {
+        finish(result);
+    }
+};
+const checkOnFrame = () => {
+    check();
+    if (!isFinished) {
+        frame = requestAnimationFrame(checkOnFrame);
+    }
+};
+observer.observe(document, {
+    attributes: true, characterData: true, childList: true, subtree: true,
+});
+checkOnFrame();
+"""
+)
+
+# Return beginning of HTML of the first element matching locator (or page body
+# if locator is `null` or element isn't found). Arguments are `by` and `query`
+# of locator and max length of HTML.
+DOM_EXCERPT = (
+    _HELPERS
+    + """
+const [by, query, maxLength] = arguments;
+const element = (by && findFirst(by, query)) || document.body;
+return element.outerHTML.slice(0, maxLength);
+"""
+)
+
+# Scroll to the center of element passed as the first argument.
+# behavior="instant" - to scroll without animation
+# block="center" - vertical scrolling up to center
+# inline="center"- horizontal scrolling up to center
+SCROLL_TO_CENTER = (
+    "arguments[0].scrollIntoView("
+    "{behavior: 'instant', block: 'center', inline: 'center'}"
+    ");"
+)
+
+# Selenium converts these strategies to CSS selectors the same way
+_CSS_TEMPLATES = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+
+def get_script_locator(locator: Locator) -> tuple[str, str]:
+    """Get strategy and query of locator supported by pomcorn scripts.
+
+    Raises:
+        ValueError: If locator strategy can't be evaluated by scripts (e.g.
+            search by link text).
+
+    """
+    by, query = locator.get_search_args()
+    if by == By.XPATH:
+        return By.XPATH, query
+    if by not in _CSS_TEMPLATES:
+        raise ValueError(
+            f"Locator with `{by}` strategy can't be used in scripts.",
+        )
+    return By.CSS_SELECTOR, _CSS_TEMPLATES[by].format(query)
@@ -0,0 +1,831 @@
+"""Module with webdriver which works with saved HTML without browser.
+
+``StaticWebDriver`` is a real selenium ``WebDriver`` whose commands are
+executed in-process against HTML parsed by ``lxml`` instead of being sent to
+a browser. It allows to check page objects (locators, components and lists)
+against saved pages in milliseconds.
+
+Example:
+  webdriver = StaticWebDriver(
+      pages={"https://pypi.org/": Path("index.html").read_text()},
+  )
+  page = IndexPage.open(webdriver)
+  assert page.navbar.login_link.is_displayed
+
+Static document has no styles, layout and JavaScript, so:
+
+* element is considered hidden only if it or its ancestor is hidden by
+  markup: ``hidden`` attribute, inline ``display: none`` or
+  ``visibility: hidden`` style, ``<input type="hidden">`` or non-rendered
+  tags (e.g. ``<script>``);
+* text of elements is whitespace-normalized;
+* only scripts of pomcorn (see ``pomcorn.scripts``) and selenium's helpers
+  (e.g. ``is_displayed``) are evaluated. Other scripts return ``None``
+  unless handler is registered via ``StaticWebDriver.register_script``;
+* waits inside the browser finish immediately, because document doesn't
+  change by itself.
+
+CSS selectors require ``cssselect`` package. Install ``pomcorn[static]``
+extra to get all dependencies.
+
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, cast
+from urllib.parse import urljoin
+
+from lxml import etree, html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from . import scripts
+
+# Key of element reference in WebDriver protocol
+_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Tags which browsers don't render
+_HIDDEN_TAGS = frozenset(
+    (
+        "head",
+        "link",
+        "meta",
+        "noscript",
+        "script",
+        "style",
+        "template",
+        "title",
+    ),
+)
+
+# Tags rendered as blocks, their text is separated by line breaks
+_BLOCK_TAGS = frozenset(
+    (
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "body",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "tr",
+        "ul",
+    ),
+)
+
+# Tags of table cells, their text is separated by spaces
+_CELL_TAGS = frozenset(("td", "th"))
+
+# Attributes for which `get_attribute` returns "true" or `None`
+_BOOLEAN_ATTRIBUTES = frozenset(
+    (
+        "checked",
+        "disabled",
+        "hidden",
+        "multiple",
+        "readonly",
+        "required",
+        "selected",
+    ),
+)
+
+# Input types which can't be typed into
+_NOT_EDITABLE_INPUT_TYPES = frozenset(
+    (
+        "button",
+        "checkbox",
+        "file",
+        "hidden",
+        "image",
+        "radio",
+        "range",
+        "reset",
+        "submit",
+    ),
+)
+
+# Selenium marks its helper scripts with comments at the beginning
+_IS_DISPLAYED_MARK = "/* isDisplayed */"
+_GET_ATTRIBUTE_MARK = "/* getAttribute */"
+
+ScriptHandler = Callable[..., Any]
+
+
+class StaticCommandError(Exception):
+    """Error of command which is returned to webdriver as error response.
+
+    Selenium converts response to exception by `error` code (e.g.
+    ``no such element`` is converted to ``NoSuchElementException``).
+
+    """
+
+    def __init__(self, error: str, message: str):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+class StaticConnection:
+    """Connection which executes WebDriver commands against static HTML.
+
+    It's used by ``StaticWebDriver`` instead of ``RemoteConnection``.
+
+    """
+
+    def __init__(self, pages: Mapping[str, str]):
+        """Init connection.
+
+        Args:
+            pages: HTML of pages by their URL. Only these URLs can be opened.
+
+        """
+        self.pages = dict(pages)
+        self.scripts: dict[str, ScriptHandler] = {
+            scripts.ELEMENTS_SNAPSHOT: self._get_elements_snapshot,
+            scripts.PREFETCH_ELEMENTS: self._prefetch_elements,
+            scripts.COUNT_ELEMENTS: lambda by, query, root=None: len(
+                self._find_all(by, query, root),
+            ),
+            scripts.HAS_ELEMENTS: lambda by, query, root=None: bool(
+                self._find_all(by, query, root),
+            ),
+            scripts.EXTRACT_COLUMNS: self._extract_columns,
+            scripts.KEYED_ELEMENTS: lambda by, query, key_column: [
+                [item, self._get_column_value(item, key_column)]
+                for item in self._find_all(by, query)
+            ],
+            scripts.FILL_FORM: self._fill_form,
+            scripts.WAIT_FOR_CONDITION: self._wait_for_condition,
+            scripts.DOM_EXCERPT: self._get_dom_excerpt,
+            scripts.SCROLL_TO_CENTER: lambda element: None,
+        }
+        self.url = "about:blank"
+        self.document: Any = html.document_fromstring("<html></html>")
+        self._history: list[str] = []
+        self._history_index = -1
+        self._elements: dict[str, Any] = {}
+        self._element_ids: dict[Any, str] = {}
+        # Fields whose text is selected by `Ctrl+A`
+        self._selected_elements: set[Any] = set()
+        self._documents_counter = itertools.count()
+        self._document_id = next(self._documents_counter)
+        self._commands: dict[str, Callable[[dict[str, Any]], Any]] = {
+            Command.NEW_SESSION: self._new_session,
+            Command.QUIT: lambda params: None,
+            Command.CLOSE: lambda params: None,
+            Command.GET: self._get,
+            Command.REFRESH: lambda params: self._load(self.url),
+            Command.GO_BACK: lambda params: self._go(-1),
+            Command.GO_FORWARD: lambda params: self._go(1),
+            Command.GET_CURRENT_URL: lambda params: self.url,
+            Command.GET_TITLE: self._get_title,
+            Command.GET_PAGE_SOURCE: lambda params: html.tostring(
+                self.document,
+                encoding="unicode",
+            ),
+            Command.FIND_ELEMENT: self._find_element,
+            Command.FIND_ELEMENTS: self._find_elements,
+            Command.FIND_CHILD_ELEMENT: self._find_element,
+            Command.FIND_CHILD_ELEMENTS: self._find_elements,
+            Command.W3C_EXECUTE_SCRIPT: self._execute_script,
+            Command.W3C_EXECUTE_SCRIPT_ASYNC: self._execute_script,
+            Command.GET_ELEMENT_TEXT: self._get_element_text,
+            Command.GET_ELEMENT_TAG_NAME: lambda params: (
+                self._get_element(params).tag
+            ),
+            Command.GET_ELEMENT_ATTRIBUTE: lambda params: (
+                self._get_element(params).get(params["name"])
+            ),
+            Command.GET_ELEMENT_PROPERTY: self._get_element_property,
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: (
+                self._get_element_css_property
+            ),
+            Command.GET_ELEMENT_RECT: lambda params: {
+                "x": 0,
+                "y": 0,
+                "width": 0,
+                "height": 0,
+            },
+            Command.IS_ELEMENT_ENABLED: lambda params: (
+                "disabled" not in self._get_element(params).attrib
+            ),
+            Command.IS_ELEMENT_SELECTED: lambda params: (
+                self._is_selected(self._get_element(params))
+            ),
+            Command.CLICK_ELEMENT: self._click_element,
+            Command.CLEAR_ELEMENT: lambda params: self._set_value(
+                self._get_editable_element(params),
+                "",
+            ),
+            Command.SEND_KEYS_TO_ELEMENT: self._send_keys_to_element,
+            Command.SWITCH_TO_FRAME: self._switch_to_frame,
+            Command.SWITCH_TO_PARENT_FRAME: lambda params: None,
+            Command.W3C_ACTIONS: lambda params: None,
+            Command.W3C_CLEAR_ACTIONS: lambda params: None,
+            Command.SET_TIMEOUTS: lambda params: None,
+            Command.SET_WINDOW_RECT: lambda params: None,
+            Command.W3C_MAXIMIZE_WINDOW: lambda params: None,
+            Command.GET_ALL_COOKIES: lambda params: [],
+            Command.DELETE_ALL_COOKIES: lambda params: None,
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda params: "static",
+            Command.W3C_GET_WINDOW_HANDLES: lambda params: ["static"],
+        }
+
+    def execute(
+        self,
+        command: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Execute command and return response of WebDriver protocol."""
+        if command not in self._commands:
+            return self._get_error_response(
+                "unknown command",
+                f"Command `{command}` isn't supported by static webdriver.",
+            )
+        try:
+            value = self._commands[command](params or {})
+        except StaticCommandError as error:
+            return self._get_error_response(error.error, error.message)
+        return {"value": self._wrap(value)}
+
+    def load(self, page_html: str, url: str = "about:blank"):
+        """Register HTML of page by URL and open it."""
+        self.pages[url] = page_html
+        self._get({"url": url})
+
+    def _new_session(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Start new session."""
+        return {
+            "sessionId": "static",
+            "capabilities": {"browserName": "static"},
+        }
+
+    def _get(self, params: dict[str, Any]) -> None:
+        """Open page by URL and add it to history."""
+        self._load(params["url"])
+        del self._history[self._history_index + 1 :]
+        self._history.append(self.url)
+        self._history_index = len(self._history) - 1
+
+    def _go(self, step: int) -> None:
+        """Open previous or next page from history."""
+        index = self._history_index + step
+        if 0 <= index < len(self._history):
+            self._history_index = index
+            self._load(self._history[index])
+
+    def _load(self, url: str) -> None:
+        """Parse HTML of page, so all found elements become stale."""
+        if url not in self.pages:
+            raise StaticCommandError(
+                "unknown error",
+                f"Page `{url}` isn't registered in static webdriver.",
+            )
+        self.url = url
+        self.document = html.document_fromstring(self.pages[url])
+        self._elements.clear()
+        self._element_ids.clear()
+        self._selected_elements.clear()
+        self._document_id = next(self._documents_counter)
+
+    def _get_title(self, params: dict[str, Any]) -> str:
+        """Get title of current page."""
+        return " ".join((self.document.findtext(".//title") or "").split())
+
+    def _switch_to_frame(self, params: dict[str, Any]) -> None:
+        """Switch to default content, frames aren't loaded."""
+        if params.get("id") is not None:
+            raise StaticCommandError(
+                "no such frame",
+                "Frames aren't supported by static webdriver.",
+            )
+
+    def _find_element(self, params: dict[str, Any]) -> Any:
+        """Find the first element matching locator."""
+        found = self._find_elements(params)
+        if not found:
+            raise StaticCommandError(
+                "no such element",
+                f"Unable to locate element: {params['value']}",
+            )
+        return found[0]
+
+    def _find_elements(self, params: dict[str, Any]) -> list[Any]:
+        """Find all elements matching locator."""
+        root = self._get_element(params) if "id" in params else None
+        return self._find_all(params["using"], params["value"], root)
+
+    def _find_all(
+        self,
+        by: str,
+        query: str,
+        root: Any = None,
+    ) -> list[Any]:
+        """Find all elements matching locator inside root."""
+        root = self.document if root is None else root
+        if by == By.XPATH:
+            try:
+                found = root.xpath(query)
+            except etree.XPathError as error:
+                raise StaticCommandError(
+                    "invalid selector",
+                    f"Invalid XPath `{query}`: {error}",
+                ) from error
+            if not isinstance(found, list):
+                raise StaticCommandError(
+                    "invalid selector",
+                    f"XPath `{query}` doesn't select elements.",
+                )
+            return [item for item in found if isinstance(item, etree._Element)]
+        if by == By.CSS_SELECTOR:
+            try:
+                found = root.cssselect(query)
+            except ImportError as error:
+                raise StaticCommandError(
+                    "invalid selector",
+                    "Install `cssselect` package to use CSS selectors.",
+                ) from error
+            return self._exclude_root(found, root)
+        if by == By.TAG_NAME:
+            return self._exclude_root(root.iter(query), root)
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            return [
+                link
+                for link in root.iter("a")
+                if (
+                    query == self._get_text(link)
+                    if by == By.LINK_TEXT
+                    else query in self._get_text(link)
+                )
+            ]
+        raise StaticCommandError(
+            "invalid argument",
+            f"Locator strategy `{by}` isn't supported by static webdriver.",
+        )
+
+    def _exclude_root(self, found: Iterable[Any], root: Any) -> list[Any]:
+        """Exclude root from found elements unless it's document root.
+
+        Browsers look for descendants of element, but lxml includes the
+        element itself.
+
+        """
+        return [
+            element
+            for element in found
+            if element is not root or root is self.document
+        ]
+
+    def _get_element(self, params: dict[str, Any]) -> Any:
+        """Get element by its id from params."""
+        return self._unwrap({_ELEMENT_KEY: params["id"]})
+
+    def _get_editable_element(self, params: dict[str, Any]) -> Any:
+        """Get element which can be typed into."""
+        element = self._get_element(params)
+        if not self._is_displayed(element) or not self._is_editable(element):
+            raise StaticCommandError(
+                "element not interactable",
+                f"Element `{element.tag}` can't be edited.",
+            )
+        return element
+
+    def _get_element_text(self, params: dict[str, Any]) -> str:
+        """Get visible text of element."""
+        return self._get_visible_text(self._get_element(params))
+
+    def _get_element_property(self, params: dict[str, Any]) -> Any:
+        """Get DOM property of element."""
+        element = self._get_element(params)
+        name = params["name"]
+        if name == "value":
+            return self._get_value(element)
+        if name in ("checked", "selected"):
+            return self._is_selected(element)
+        if name in ("textContent", "innerText"):
+            return element.text_content()
+        if name == "outerHTML":
+            return self._get_outer_html(element)
+        return element.get(name)
+
+    def _get_element_css_property(self, params: dict[str, Any]) -> str:
+        """Get CSS property of element from its inline style."""
+        element = self._get_element(params)
+        return self._get_inline_style(element).get(params["propertyName"], "")
+
+    def _click_element(self, params: dict[str, Any]) -> None:
+        """Click element: toggle checkbox or radio, follow link."""
+        element = self._get_element(params)
+        if not self._is_displayed(element):
+            raise StaticCommandError(
+                "element not interactable",
+                f"Element `{element.tag}` isn't displayed.",
+            )
+        if "disabled" in element.attrib:
+            return
+        input_type = element.get("type", "").lower()
+        if element.tag == "input" and input_type == "checkbox":
+            if "checked" in element.attrib:
+                del element.attrib["checked"]
+            else:
+                element.set("checked", "")
+        elif element.tag == "input" and input_type == "radio":
+            for radio in self.document.iter("input"):
+                if radio.get("name") == element.get("name"):
+                    radio.attrib.pop("checked", None)
+            element.set("checked", "")
+        elif element.tag == "a" and element.get("href"):
+            url = urljoin(self.url, element.get("href"))
+            if url in self.pages:
+                self._get({"url": url})
+
+    def _send_keys_to_element(self, params: dict[str, Any]) -> None:
+        """Type text into element.
+
+        Only select all (``Ctrl+A`` or ``Command+A``), ``Keys.BACK_SPACE``
+        and ``Keys.DELETE`` are emulated, other special keys (e.g.
+        ``Keys.ENTER``) are ignored. Like in browser, modifier keys are
+        released at the end of typing or by ``Keys.NULL``.
+
+        """
+        element = self._get_editable_element(params)
+        value = self._get_value(element)
+        is_modifier_pressed = False
+        for char in params["text"]:
+            if char in (Keys.CONTROL, Keys.COMMAND):
+                is_modifier_pressed = True
+            elif char == Keys.NULL:
+                is_modifier_pressed = False
+            elif is_modifier_pressed and char.lower() == "a":
+                self._selected_elements.add(element)
+            elif char in (Keys.BACK_SPACE, Keys.DELETE):
+                value = (
+                    "" if element in self._selected_elements else value[:-1]
+                )
+                self._selected_elements.discard(element)
+            # Selenium encodes special keys with private use area of Unicode
+            elif not "\ue000" <= char <= "\uf8ff":
+                if element in self._selected_elements:
+                    value = ""
+                    self._selected_elements.discard(element)
+                value += char
+        self._set_value(element, value)
+
+    def _execute_script(self, params: dict[str, Any]) -> Any:
+        """Evaluate script by its registered handler."""
+        script = params["script"]
+        args = self._unwrap(params.get("args", []))
+        if script.startswith(_IS_DISPLAYED_MARK):
+            return self._is_displayed(args[0])
+        if script.startswith(_GET_ATTRIBUTE_MARK):
+            return self._get_attribute(*args)
+        if script in self.scripts:
+            return self.scripts[script](*args)
+        return None
+
+    def _get_elements_snapshot(self, by: str, query: str) -> list[Any]:
+        """Evaluate ``scripts.ELEMENTS_SNAPSHOT``."""
+        return [
+            [element, self._is_displayed(element)]
+            for element in self._find_all(by, query)
+        ]
+
+    def _prefetch_elements(
+        self,
+        elements_locators: list[list[str]],
+    ) -> list[list[Any]]:
+        """Evaluate ``scripts.PREFETCH_ELEMENTS``."""
+        result: list[list[Any]] = []
+        for by, query in elements_locators:
+            found = self._find_all(by, query)
+            if not found:
+                result.append([None, False, None])
+                continue
+            is_displayed = self._is_displayed(found[0])
+            text = self._get_text(found[0]) if is_displayed else None
+            result.append([found[0], is_displayed, text])
+        return result
+
+    def _extract_columns(
+        self,
+        by: str,
+        query: str,
+        columns: list[list[str | None]],
+    ) -> list[list[str | None]]:
+        """Evaluate ``scripts.EXTRACT_COLUMNS``."""
+        items = self._find_all(by, query)
+        return [
+            [self._get_column_value(item, column) for item in items]
+            for column in columns
+        ]
+
+    def _get_column_value(
+        self,
+        item: Any,
+        column: list[str | None],
+    ) -> str | None:
+        """Get value of column of ``scripts.EXTRACT_COLUMNS`` for item."""
+        by, query, attribute = column
+        found = self._find_all(by, query, item) if by and query else [item]
+        if not found:
+            return None
+        if attribute:
+            return found[0].get(attribute)
+        return self._get_visible_text(found[0])
+
+    def _fill_form(
+        self,
+        fields_locators: list[list[str]],
+        values: list[Any],
+        only_visible: bool,
+    ) -> list[str]:
+        """Evaluate ``scripts.FILL_FORM``."""
+        statuses = []
+        for (by, query), value in zip(fields_locators, values, strict=True):
+            found = self._find_all(by, query)
+            if not found:
+                statuses.append("not_found")
+            elif only_visible and not self._is_displayed(found[0]):
+                statuses.append("not_visible")
+            elif not self._is_editable(found[0]):
+                statuses.append("not_editable")
+            else:
+                self._set_value(found[0], str(value))
+                statuses.append("filled")
+        return statuses
+
+    def _wait_for_condition(
+        self,
+        condition: str,
+        by: str,
+        query: str,
+        found_element: Any,
+        text: str,
+        timeout: float,
+    ) -> list[Any]:
+        """Evaluate ``scripts.WAIT_FOR_CONDITION``.
+
+        Static document doesn't change by itself, so condition is checked
+        once.
+
+        """
+        element = found_element
+        if element is None:
+            found = self._find_all(by, query)
+            element = found[0] if found else None
+        is_displayed = element is not None and self._is_displayed(element)
+        is_met = {
+            "visible": is_displayed,
+            "invisible": not is_displayed,
+            "clickable": is_displayed and "disabled" not in element.attrib,
+            "text": element is not None and text in self._get_text(element),
+            "absent": element is None,
+        }[condition]
+        if not is_met:
+            return [False, None]
+        return [
+            True,
+            element if condition in ("visible", "clickable") else None,
+        ]
+
+    def _get_dom_excerpt(
+        self,
+        by: str | None,
+        query: str | None,
+        max_length: int,
+    ) -> str:
+        """Evaluate ``scripts.DOM_EXCERPT``."""
+        found = self._find_all(by, query) if by and query else []
+        element = found[0] if found else self.document.body
+        return self._get_outer_html(element)[:max_length]
+
+    def _get_attribute(self, element: Any, name: str) -> str | None:
+        """Get attribute of element as selenium's `get_attribute` does."""
+        if name == "value":
+            return self._get_value(element)
+        if name in ("checked", "selected"):
+            return "true" if self._is_selected(element) else None
+        if name in _BOOLEAN_ATTRIBUTES:
+            return "true" if name in element.attrib else None
+        return element.get(name)
+
+    def _is_displayed(self, element: Any) -> bool:
+        """Check that element and its ancestors aren't hidden by markup."""
+        return not any(
+            self._is_hidden(item)
+            for item in itertools.chain((element,), element.iterancestors())
+        )
+
+    def _is_hidden(self, element: Any) -> bool:
+        """Check whether element itself is hidden by markup."""
+        if element.tag in _HIDDEN_TAGS or "hidden" in element.attrib:
+            return True
+        if element.tag == "input" and element.get("type") == "hidden":
+            return True
+        style = self._get_inline_style(element)
+        return (
+            style.get("display") == "none"
+            or style.get("visibility") == "hidden"
+        )
+
+    def _is_editable(self, element: Any) -> bool:
+        """Check that value of element can be typed."""
+        if "disabled" in element.attrib or "readonly" in element.attrib:
+            return False
+        if element.tag == "textarea":
+            return True
+        return (
+            element.tag == "input"
+            and element.get("type", "").lower()
+            not in _NOT_EDITABLE_INPUT_TYPES
+        )
+
+    def _is_selected(self, element: Any) -> bool:
+        """Check whether checkbox, radio or option is selected."""
+        return "checked" in element.attrib or "selected" in element.attrib
+
+    def _get_value(self, element: Any) -> str:
+        """Get value of form field."""
+        if element.tag == "textarea":
+            return element.text or ""
+        return element.get("value", "")
+
+    def _set_value(self, element: Any, value: str) -> None:
+        """Set value of form field."""
+        if element.tag == "textarea":
+            element.text = value
+        else:
+            element.set("value", value)
+
+    def _get_visible_text(self, element: Any) -> str:
+        """Get text of element as ``WebElement.text`` does.
+
+        Text of hidden element is empty.
+
+        """
+        return self._get_text(element) if self._is_displayed(element) else ""
+
+    def _get_text(self, element: Any) -> str:
+        """Get text of element's displayed nodes.
+
+        Text of block elements and line breaks are placed on separate lines,
+        whitespaces are collapsed in each line and empty lines are dropped.
+
+        """
+        parts: list[str] = []
+        self._collect_text(element, parts)
+        return "\n".join(
+            normalized_line
+            for line in "".join(parts).split("\n")
+            if (normalized_line := " ".join(line.split()))
+        )
+
+    def _collect_text(self, element: Any, parts: list[str]) -> None:
+        """Collect text of element and its displayed descendants."""
+        # Line breaks of markup are rendered as spaces
+        parts.append((element.text or "").replace("\n", " "))
+        for child in element:
+            # Comments and processing instructions have no string tag
+            if isinstance(child.tag, str) and not self._is_hidden(child):
+                separator = self._get_text_separator(child.tag)
+                parts.append(separator)
+                self._collect_text(child, parts)
+                parts.append(separator)
+            parts.append((child.tail or "").replace("\n", " "))
+
+    def _get_text_separator(self, tag: str) -> str:
+        """Get separator of text of element with tag from adjacent text."""
+        if tag in _BLOCK_TAGS or tag == "br":
+            return "\n"
+        if tag in _CELL_TAGS:
+            return " "
+        return ""
+
+    def _get_inline_style(self, element: Any) -> dict[str, str]:
+        """Parse inline style of element."""
+        style = {}
+        for declaration in element.get("style", "").split(";"):
+            name, _, value = declaration.partition(":")
+            if value:
+                style[name.strip().lower()] = value.strip().lower()
+        return style
+
+    def _get_outer_html(self, element: Any) -> str:
+        """Get HTML of element without its tail."""
+        return html.tostring(element, encoding="unicode", with_tail=False)
+
+    def _wrap(self, value: Any) -> Any:
+        """Replace elements with their references of WebDriver protocol."""
+        if isinstance(value, etree._Element):
+            if value not in self._element_ids:
+                element_id = f"{self._document_id}-{len(self._elements)}"
+                self._element_ids[value] = element_id
+                self._elements[element_id] = value
+            return {_ELEMENT_KEY: self._element_ids[value]}
+        if isinstance(value, list | tuple):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        """Replace references of WebDriver protocol with elements."""
+        if isinstance(value, dict) and _ELEMENT_KEY in value:
+            if value[_ELEMENT_KEY] not in self._elements:
+                raise StaticCommandError(
+                    "stale element reference",
+                    "Element isn't attached to the current document.",
+                )
+            return self._elements[value[_ELEMENT_KEY]]
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._unwrap(item) for key, item in value.items()}
+        return value
+
+    def _get_error_response(self, error: str, message: str) -> dict[str, Any]:
+        """Get response which selenium converts to exception."""
+        return {
+            "status": error,
+            "value": {"error": error, "message": message},
+        }
+
+
+class StaticWebDriver(WebDriver):
+    """WebDriver which executes commands against static HTML in-process.
+
+    See module docstring for limitations of static document.
+
+    """
+
+    def __init__(
+        self,
+        page_html: str | None = None,
+        url: str = "about:blank",
+        pages: Mapping[str, str] | None = None,
+    ):
+        """Init webdriver and open the first page.
+
+        Args:
+            page_html: HTML of page to open at `url`.
+            url: URL of the first opened page.
+            pages: HTML of pages by their URL, which can be opened via
+                `get` method or by click on link.
+
+        """
+        self.connection = StaticConnection(pages or {})
+        super().__init__(
+            command_executor=cast(RemoteConnection, self.connection),
+            options=ArgOptions(),
+            # Values of `send_keys` shouldn't be checked as local files
+            file_detector=UselessFileDetector(),
+        )
+        if page_html is not None:
+            self.connection.load(page_html, url)
+        elif url in self.connection.pages:
+            self.get(url)
+
+    def load(self, page_html: str, url: str = "about:blank"):
+        """Register HTML of page by URL and open it."""
+        self.connection.load(page_html, url)
+
+    def register_script(self, script: str, handler: ScriptHandler):
+        """Register handler which evaluates script in static document.
+
+        Args:
+            script: Source of script as it's passed to `execute_script`.
+            handler: Callable which accepts arguments of script (elements are
+                passed as ``lxml`` elements) and returns its result.
+
+        """
+        self.connection.scripts[script] = handler
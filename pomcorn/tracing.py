@@ -0,0 +1,299 @@
+"""Module with tracing of page objects activity.
+
+``Tracer`` records nested spans of page objects activity: opening of pages,
+initialization of pages and components, waits, actions of elements and
+commands sent to the browser (including scripts). Trace is saved in Chrome
+trace event format, so it can be opened in ``chrome://tracing`` or
+`Perfetto <https://ui.perfetto.dev>`_ to see where time of test goes.
+
+Example:
+  with Tracer(webdriver) as tracer:
+      MainPage.open(webdriver).search(query="pomcorn")
+
+  tracer.save("trace.json")
+
+Spans are recorded only while tracer is active, otherwise tracing costs a
+single context variable lookup per traced call.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, Self, TypeVar
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .locators import Locator
+
+if TYPE_CHECKING:
+    from .instrumentation import CommandRecorder
+
+P = ParamSpec("P")
+TResult = TypeVar("TResult")
+
+# Tracer which records spans of the current context
+_active_tracer: ContextVar[Tracer | None] = ContextVar(
+    "pomcorn_active_tracer",
+    default=None,
+)
+
+
+class Tracer:
+    """Recorder of spans of page objects activity.
+
+    Tracer is active inside ``with`` block or between `start` and `stop`
+    calls. If webdriver is passed, commands sent by it are recorded as spans
+    too (via ``CommandRecorder``).
+
+    """
+
+    def __init__(self, webdriver: WebDriver | None = None):
+        """Init tracer.
+
+        Args:
+            webdriver: Instance of a class for managing the browser, whose
+                commands should be traced. By default, commands aren't traced.
+
+        """
+        # Imported here, because instrumentation depends on page objects,
+        # which are traced themselves
+        from .instrumentation import CommandRecorder
+
+        self.events: list[dict[str, Any]] = []
+        self.recorder: CommandRecorder | None = (
+            CommandRecorder(webdriver) if webdriver is not None else None
+        )
+        self._started_at = time.perf_counter()
+        self._thread_id = threading.get_ident()
+        self._token: Token[Tracer | None] | None = None
+
+    def start(self):
+        """Start recording spans in the current context."""
+        if self._token is not None:
+            return
+        self._token = _active_tracer.set(self)
+        self._thread_id = threading.get_ident()
+        if self.recorder is not None:
+            self.recorder.start()
+
+    def stop(self):
+        """Stop recording spans."""
+        if self._token is None:
+            return
+        if self.recorder is not None:
+            self.recorder.stop()
+        _active_tracer.reset(self._token)
+        self._token = None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: str,
+        **args: Any,
+    ) -> Iterator[None]:
+        """Record code inside the block as span.
+
+        Args:
+            name: Name of span.
+            category: Category of span (e.g. ``action`` or ``wait``).
+            **args: Additional info shown for span (values of `None` are
+                skipped).
+
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_event(
+                name,
+                category,
+                started_at=started_at,
+                duration=time.perf_counter() - started_at,
+                **args,
+            )
+
+    def add_event(
+        self,
+        name: str,
+        category: str,
+        started_at: float,
+        duration: float,
+        **args: Any,
+    ) -> None:
+        """Add complete event of current thread to trace.
+
+        Args:
+            name: Name of span.
+            category: Category of span.
+            started_at: Value of ``time.perf_counter`` when span was started.
+            duration: Number of seconds span took.
+            **args: Additional info shown for span (values of `None` are
+                skipped).
+
+        """
+        self.events.append(
+            self._get_event(
+                name,
+                category,
+                started_at=started_at,
+                duration=duration,
+                thread_id=threading.get_ident(),
+                args=args,
+            ),
+        )
+
+    def get_events(self) -> list[dict[str, Any]]:
+        """Get recorded spans and spans of commands sorted by start time."""
+        events = [*self.events, *self._get_command_events()]
+        return sorted(events, key=lambda event: event["ts"])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get trace in Chrome trace event format."""
+        return {"traceEvents": self.get_events(), "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path):
+        """Save trace to JSON file in Chrome trace event format."""
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    def _get_command_events(self) -> list[dict[str, Any]]:
+        """Get spans of commands recorded by ``CommandRecorder``."""
+        if self.recorder is None:
+            return []
+        return [
+            self._get_event(
+                record.command,
+                "script" if record.script is not None else "command",
+                started_at=record.started_at,
+                duration=record.duration,
+                thread_id=self._thread_id,
+                args={
+                    "locator": record.locator,
+                    "script": record.script,
+                    "in_wait": record.in_wait,
+                },
+            )
+            for record in self.recorder.records
+        ]
+
+    def _get_event(
+        self,
+        name: str,
+        category: str,
+        started_at: float,
+        duration: float,
+        thread_id: int,
+        args: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Get complete event in Chrome trace event format."""
+        return {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            # Trace event format uses microseconds since start of tracer
+            "ts": (started_at - self._started_at) * 1_000_000,
+            "dur": duration * 1_000_000,
+            "pid": os.getpid(),
+            "tid": thread_id,
+            "args": {
+                key: value for key, value in args.items() if value is not None
+            },
+        }
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f"Tracer(events={len(self.events)})"
+
+
+def get_active_tracer() -> Tracer | None:
+    """Get tracer which records spans of the current context."""
+    return _active_tracer.get()
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[None]:
+    """Record code inside the block as span if tracer is active.
+
+    Args:
+        name: Name of span.
+        category: Category of span (e.g. ``action`` or ``wait``).
+        **args: Additional info shown for span.
+
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, category, **args):
+        yield
+
+
+def traced(
+    category: str,
+    name: str | None = None,
+) -> Callable[[Callable[P, TResult]], Callable[P, TResult]]:
+    """Record calls of method as spans if tracer is active.
+
+    Span is named after class of instance and method. Its args contain class
+    of page or component and locator: of element, passed to the method or
+    base locator of component.
+
+    Args:
+        category: Category of spans (e.g. ``action`` or ``wait``).
+        name: Name of method in span, by default name of method is used.
+
+    """
+
+    def decorator(method: Callable[P, TResult]) -> Callable[P, TResult]:
+        method_name = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> TResult:
+            tracer = _active_tracer.get()
+            if tracer is None:
+                return method(*args, **kwargs)
+            instance, *method_args = args
+            with tracer.span(
+                f"{instance.__class__.__name__}.{method_name}",
+                category,
+                **_describe(instance, [*method_args, *kwargs.values()]),
+            ):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _describe(instance: Any, args: list[Any]) -> dict[str, str | None]:
+    """Get class of page or component and locator for span of method call.
+
+    Elements are described by their locator and web view, while pages and
+    components by their class and locator passed to the method or base
+    locator.
+
+    """
+    view = getattr(instance, "web_view", instance)
+    locator = getattr(instance, "locator", None) or next(
+        (arg for arg in args if isinstance(arg, Locator)),
+        getattr(instance, "base_locator", None),
+    )
+    return {
+        "view": view.__class__.__qualname__,
+        "locator": str(locator) if locator is not None else None,
+    }
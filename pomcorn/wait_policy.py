@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import dataclasses
+from contextlib import AbstractContextManager, nullcontext
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .deadline import deadline, get_remaining_time
+from .diagnostics import WaitDiagnostics
+from .polling import PollingStrategy, PomcornWait, WaitStats
+
+# Timeout of waits after deadline is passed, so condition is checked once
+MIN_TIMEOUT = 0.001
+
+
+@dataclasses.dataclass(frozen=True)
+class WaitPolicy:
+    """Settings of waits shared by page and all its components.
+
+    Page passes its policy to components, components pass it to their items,
+    so the whole objects tree waits with the same settings and shares the
+    same default `WebDriverWait` instance.
+
+    To tune waits for the whole suite, set policy as attribute of your base
+    page:
+
+    .. code-block:: python
+
+        class BasePage(Page):
+            wait_policy = WaitPolicy(timeout=10, poll_frequency=0.05)
+
+    Attributes:
+        timeout: Number of seconds before timing out.
+        poll_frequency: Time between checks of `wait` condition, lower
+            interval - faster checks. This allows to improve overall tests
+            speed.
+        in_browser: Whether to check element wait conditions inside the
+            browser or not. See ``WebView`` for details.
+        polling: Strategy which defines delays between condition checks. If
+            it's not specified, condition is checked every `poll_frequency`
+            seconds.
+        stats: Storage of statistics of finished waits. It's shared by
+            policies created via `replace` method.
+        budget: Number of seconds all waits of opening a page (via
+            ``Page.open`` or ``Page.open_from_url``) or getting all items of
+            a list (via ``ListComponent.all``) can take in total. By default,
+            each wait can take `timeout` seconds. See ``pomcorn.deadline``
+            for details.
+        diagnostics: Settings of info added to message of timed out wait.
+            It's collected only on timeout.
+
+    """
+
+    timeout: float = 5.0
+    poll_frequency: float = 0.01
+    in_browser: bool = False
+    polling: PollingStrategy | None = None
+    stats: WaitStats = dataclasses.field(
+        default_factory=WaitStats,
+        repr=False,
+        compare=False,
+    )
+    budget: float | None = None
+    diagnostics: WaitDiagnostics = dataclasses.field(
+        default_factory=WaitDiagnostics,
+    )
+
+    _wait: PomcornWait | None = dataclasses.field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def replace(
+        self,
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        in_browser: bool | None = None,
+    ) -> WaitPolicy:
+        """Get policy with overridden settings.
+
+        Arguments which are `None` are not overridden. If nothing changes, the
+        same policy is returned, so its default wait is still shared.
+
+        """
+        policy = dataclasses.replace(
+            self,
+            timeout=self.timeout if timeout is None else timeout,
+            poll_frequency=(
+                self.poll_frequency
+                if poll_frequency is None
+                else poll_frequency
+            ),
+            in_browser=self.in_browser if in_browser is None else in_browser,
+        )
+        return self if policy == self else policy
+
+    def get_wait(
+        self,
+        webdriver: WebDriver,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+    ) -> PomcornWait:
+        """Get `WebDriverWait` instance for webdriver.
+
+        If no optional arguments are passed, the default wait instance is
+        returned. It's created once per webdriver and reused by all views
+        with this policy.
+
+        If wait is requested inside ``pomcorn.deadline.deadline`` block, its
+        timeout is limited by the time remaining until the deadline.
+
+        Args:
+            webdriver: Instance of a class for managing the browser.
+            timeout: Number of seconds before timing out.
+            polling: Strategy to use instead of policy's one, e.g. for a
+                condition which is known to be met slowly.
+
+        """
+        remaining_time = get_remaining_time()
+        if remaining_time is not None and remaining_time < (
+            timeout or self.timeout
+        ):
+            timeout = max(remaining_time, MIN_TIMEOUT)
+
+        if timeout or polling:
+            return self._init_wait(webdriver, timeout, polling)
+
+        if self._wait is None or self._wait._driver is not webdriver:
+            # Policy is frozen, but default wait is only a cache
+            object.__setattr__(self, "_wait", self._init_wait(webdriver))
+        return self._wait  # type: ignore[return-value]
+
+    def budget_deadline(self) -> AbstractContextManager[None]:
+        """Get deadline for the policy budget.
+
+        If the budget isn't specified, context manager doesn't limit waits.
+
+        """
+        if self.budget is None:
+            return nullcontext()
+        return deadline(self.budget)
+
+    def _init_wait(
+        self,
+        webdriver: WebDriver,
+        timeout: float | None = None,
+        polling: PollingStrategy | None = None,
+    ) -> PomcornWait:
+        """Init new wait instance with policy settings."""
+        return PomcornWait(
+            driver=webdriver,
+            timeout=timeout or self.timeout,
+            poll_frequency=self.poll_frequency,
+            polling=polling or self.polling,
+            stats=self.stats,
+        )
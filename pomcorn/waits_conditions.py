@@ -43,7 +43,7 @@ def text_in_element_changes(
         if isinstance(target, PomcornElement):
             return old_text != target.get_text()
 
-        return old_text != driver.find_element(*target).text
+        return old_text != driver.find_element(*target.get_search_args()).text
 
     return check_the_match
 
@@ -61,7 +61,7 @@ def element_not_exists_in_dom(
 
         try:
             # Check if driver can find element.
-            driver.find_element(*target)
+            driver.find_element(*target.get_search_args())
         except (NoSuchElementException, StaleElementReferenceException):
             # In the case of NoSuchElement, returns true because the element is
             # not present in DOM.
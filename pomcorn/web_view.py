@@ -1,48 +1,135 @@
-from contextlib import contextmanager
-
+import time
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from typing import Any, Literal, TypeAlias
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.wait import WebDriverWait
 
 from pomcorn.element import PomcornElement, XPathElement
 
-from . import locators, waits_conditions
+from . import locators, scripts, waits_conditions
+from .deadline import deadline
 from .locators.base_locators import TInitLocator
+from .polling import PollingStrategy, PomcornWait, WaitMessage, waiting
+from .tracing import traced
+from .wait_policy import MIN_TIMEOUT, WaitPolicy
+
+FormField: TypeAlias = locators.Locator | PomcornElement[locators.Locator]
+
+
+@dataclass(frozen=True)
+class FillResult:
+    """Result of filling a single field via ``WebView.fill_form``.
+
+    Attributes:
+        filled_by_script: Whether the value was set by script or field was
+            filled via keystrokes.
+        fallback_reason: Why field wasn't filled by script: it wasn't found,
+            wasn't visible or isn't editable by setting value (e.g. it's
+            ``select`` or ``contenteditable`` element).
+
+    """
+
+    filled_by_script: bool
+    fallback_reason: Literal["not_found", "not_visible", "not_editable"] | None
 
 
 class WebView:
-    """Class for storing basic shortcuts for interacting with the browser."""
+    """Class for storing basic shortcuts for interacting with the browser.
+
+    Waits settings are taken from `wait_policy` attribute, which can be
+    overridden in subclasses or passed on initialization.
+
+    Set `prefetch_elements` attribute to `True` to prefetch elements declared
+    by ``Element`` descriptors after page is loaded or component becomes
+    visible (see ``prefetch``).
+
+    """
+
+    wait_policy: WaitPolicy = WaitPolicy()
+
+    prefetch_elements: bool = False
 
     def __init__(
         self,
         webdriver: WebDriver,
         *,
         app_root: str,
-        wait_timeout: float,
-        poll_frequency: float = 0,
+        wait_timeout: float | None = None,
+        poll_frequency: float | None = None,
+        wait_in_browser: bool | None = None,
+        wait_policy: WaitPolicy | None = None,
     ):
         """Initialize webview.
 
         Args:
             webdriver: Instance of a class for managing the browser.
             app_root: The URL of browser.
-            wait_timeout: Number of seconds before timing out.
+            wait_timeout: Number of seconds before timing out. Overrides
+                timeout of wait policy.
             poll_frequency: Time between checks of `wait` condition, lower
                 interval - faster checks. This allows to improve overall tests
-                speed.
+                speed. Overrides poll frequency of wait policy.
+            wait_in_browser: Whether to check element wait conditions inside
+                the browser or not. If `True`, condition is checked on each
+                DOM change by the script, so the wait takes single request to
+                the browser. Make sure that script timeout of webdriver is
+                greater than `wait_timeout`, otherwise the rest of waiting
+                will be done by polling. Overrides the same setting of wait
+                policy.
+            wait_policy: Settings of waits, by default the value of
+                `wait_policy` attribute is used.
 
         """
         self.webdriver = webdriver
         self.app_root = app_root
-        self.wait_timeout = wait_timeout
-        self.poll_frequency = poll_frequency
-        self.wait = self.get_wait(self.wait_timeout)
+        self.wait_policy = (wait_policy or self.wait_policy).replace(
+            timeout=wait_timeout,
+            poll_frequency=poll_frequency,
+            in_browser=wait_in_browser,
+        )
+        # Number of actions which could change the page, prefetched state of
+        # elements is used only until the next such action
+        self.dom_version = 0
+
+    @property
+    def wait(self) -> PomcornWait:
+        """Get default wait of wait policy.
+
+        Wait is requested on each access instead of being stored, so view
+        created inside ``deadline`` block doesn't keep wait limited by it.
+
+        """
+        return self.get_wait()
+
+    @property
+    def wait_timeout(self) -> float:
+        """Get number of seconds before timing out."""
+        return self.wait_policy.timeout
+
+    @property
+    def poll_frequency(self) -> float:
+        """Get time between checks of `wait` condition."""
+        return self.wait_policy.poll_frequency
+
+    @property
+    def wait_in_browser(self) -> bool:
+        """Get whether element wait conditions are checked in browser."""
+        return self.wait_policy.in_browser
 
     def init_element(
         self,
         locator: TInitLocator,
+        cache: bool = False,
     ) -> PomcornElement[TInitLocator]:
         """Shortcut for initializing Element instances.
 
@@ -52,9 +139,11 @@ class WebView:
 
         Args:
             locator: Instance of a class to locate the element in the browser.
+            cache: Whether element should reuse found WebElement in subsequent
+                actions or not (default `False`).
 
         """
-        return PomcornElement(web_view=self, locator=locator)
+        return PomcornElement(web_view=self, locator=locator, cache=cache)
 
     def init_elements(
         self,
@@ -76,7 +165,7 @@ class WebView:
             locator,
             locators.XPathLocator,
         ), "Only supports Xpath locators!"
-        elements_count = len(self._get_elements(locator=locator))
+        elements_count = self._count_elements(locator=locator)
         return [
             self.init_element(
                 locator=locators.XPathLocator(
@@ -109,9 +198,9 @@ class WebView:
 
         """
         result = []
-        elements_count = len(
-            self._get_elements(locator=locator, only_visible=only_visible),
-        )
+        if only_visible:
+            self.wait_until_locator_visible(locator=locator)
+        elements_count = self._count_elements(locator=locator)
         for index in range(1, elements_count + 1):
             # Need to wrap it into parentheses to iterate by index when locator
             # is complex: https://sqa.stackexchange.com/a/39465
@@ -125,19 +214,45 @@ class WebView:
     def get_wait(
         self,
         timeout: float | None = None,
-    ) -> WebDriverWait[WebDriver]:
+        polling: PollingStrategy | None = None,
+    ) -> PomcornWait:
         """Get `WebDriverWait` instance.
 
-        If no arguments are provided, returns the default wait instance.
+        If no arguments are provided, returns the default wait instance shared
+        by all views with the same wait policy.
+
+        Args:
+            timeout: Number of seconds before timing out. By default, timeout
+                of wait policy is used.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         """
-        if not timeout:
-            return self.wait
+        return self.wait_policy.get_wait(self.webdriver, timeout, polling)
+
+    def deadline(
+        self,
+        timeout: float | None = None,
+    ) -> AbstractContextManager[None]:
+        """Limit total time of all waits inside the block.
 
-        return WebDriverWait(
-            driver=self.webdriver,
-            timeout=timeout,
-            poll_frequency=self.poll_frequency,
+        All nested waits, including waits of components and elements, take no
+        more than the time remaining until the deadline.
+
+        .. code-block:: python
+
+            # Example
+            with page.deadline(10):
+                page.open_cart().checkout()
+
+        Args:
+            timeout: Number of seconds all waits inside the block can take.
+                By default, budget of wait policy is used or `wait_timeout`
+                if budget isn't specified.
+
+        """
+        return deadline(
+            timeout or self.wait_policy.budget or self.wait_timeout,
         )
 
     @property
@@ -162,7 +277,7 @@ class WebView:
         """
         if only_visible:
             self.wait_until_locator_visible(locator=locator)
-        return self.webdriver.find_element(*locator)
+        return self.webdriver.find_element(*locator.get_search_args())
 
     def _get_elements(
         self,
@@ -181,62 +296,213 @@ class WebView:
         """
         if only_visible:
             self.wait_until_locator_visible(locator=locator)
-        return self.webdriver.find_elements(*locator)
+        return self.webdriver.find_elements(*locator.get_search_args())
+
+    def _count_elements(
+        self,
+        locator: locators.Locator,
+        root: WebElement | None = None,
+    ) -> int:
+        """Get number of elements matching locator.
+
+        Elements are counted in the browser by script, so references of
+        found elements aren't transferred. Locators which can't be evaluated
+        by scripts (e.g. search by link text) are counted via
+        ``find_elements``.
+
+        Args:
+            locator: Instance of a class to locate the elements in the
+                browser.
+            root: Element to count elements inside, by default elements are
+                counted in the whole document.
+
+        """
+        return int(
+            self._evaluate_locator(scripts.COUNT_ELEMENTS, locator, root),
+        )
+
+    def _has_elements(
+        self,
+        locator: locators.Locator,
+        root: WebElement | None = None,
+    ) -> bool:
+        """Check whether at least one element matches locator.
+
+        Search stops at the first matching element in the browser and only
+        the flag is transferred (see ``_count_elements``).
+
+        Args:
+            locator: Instance of a class to locate the elements in the
+                browser.
+            root: Element to look for elements inside, by default elements
+                are looked for in the whole document.
+
+        """
+        return bool(
+            self._evaluate_locator(scripts.HAS_ELEMENTS, locator, root),
+        )
+
+    def _evaluate_locator(
+        self,
+        script: str,
+        locator: locators.Locator,
+        root: WebElement | None,
+    ) -> Any:
+        """Evaluate script counting elements matching locator.
+
+        If locator can't be evaluated by scripts, count of found elements is
+        returned.
+
+        """
+        try:
+            by, query = scripts.get_script_locator(locator)
+        except ValueError:
+            finder = root or self.webdriver
+            return len(finder.find_elements(*locator.get_search_args()))
+        return self.webdriver.execute_script(script, by, query, root)
+
+    def mark_dom_changed(self):
+        """Mark that page could be changed, e.g. by action or script.
 
+        Prefetched state of elements (see ``prefetch``) is not used after
+        this. Actions of elements and methods of web view call it themselves,
+        call it if page was changed via webdriver directly.
+
+        """
+        self.dom_version += 1
+
+    def prefetch(self):
+        """Prefetch elements declared by ``Element`` descriptors.
+
+        All elements are looked for via single script call, which returns
+        their WebElements, visibility and text. Elements use them instead of
+        requests to the browser in the subsequent actions until the page is
+        changed (see ``mark_dom_changed``), so the first interactions with
+        just loaded page cost no lookups.
+
+        Elements whose locators can't be evaluated by scripts (e.g. search
+        by link text) are skipped.
+
+        """
+        from pomcorn.descriptors import Element
+
+        elements: list[XPathElement] = []
+        elements_locators: list[tuple[str, str]] = []
+        names: set[str] = set()
+        for view_class in type(self).__mro__:
+            for name, descriptor in vars(view_class).items():
+                if not isinstance(descriptor, Element) or name in names:
+                    continue
+                # Descriptor of subclass overrides the one of base class
+                names.add(name)
+                element = descriptor.prepare_element(self)
+                try:
+                    elements_locators.append(
+                        scripts.get_script_locator(element.locator),
+                    )
+                except ValueError:
+                    continue
+                elements.append(element)
+        if not elements:
+            return
+
+        states = self.webdriver.execute_script(
+            scripts.PREFETCH_ELEMENTS,
+            elements_locators,
+        )
+        for element, (web_element, is_visible, text) in zip(
+            elements,
+            states,
+            strict=True,
+        ):
+            element.prefetch(
+                web_element=web_element,
+                is_displayed=is_visible,
+                text=text,
+            )
+
+    def _get_elements_snapshot(
+        self,
+        locator: locators.Locator,
+    ) -> list[tuple[WebElement, bool]]:
+        """Get WebElements with their visibility via single script call.
+
+        Unlike ``_get_elements`` followed by ``is_displayed`` calls for each
+        element, the browser is requested only once regardless of the number
+        of found elements.
+
+        Args:
+            locator: Instance of a class to locate the elements in the
+                browser.
+
+        Returns:
+            List of pairs of found WebElement and flag whether it's visible.
+
+        """
+        snapshot = self.webdriver.execute_script(
+            scripts.ELEMENTS_SNAPSHOT,
+            *scripts.get_script_locator(locator),
+        )
+        return [
+            (web_element, is_visible) for web_element, is_visible in snapshot
+        ]
+
+    @traced("wait")
     def wait_until_url_contains(
         self,
         url: str,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until browser's url contains input url.
 
         By default, method waits for `self.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
             method=expected_conditions.url_contains(url),
-            message=(
-                f"Url doesn't contain `{url}` in {wait._timeout} "
-                f"seconds! The current URL is `{self.current_url}`."
-            ),
+            message=f"Url doesn't contain `{url}` in {wait._timeout} seconds!",
         )
 
+    @traced("wait")
     def wait_until_url_not_contains(
         self,
         url: str,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until browser's url doesn't not contains input url.
 
         By default, method waits for `self.wait_timeout` seconds.
         If you need to change timeout, you can specify it in `timeout`
-        argument.
+        argument, delays between checks can be changed by `polling` strategy.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
             method=waits_conditions.url_not_matches(url),
-            message=(
-                f"Url does contain `{url}` in {wait._timeout} seconds! "
-                f"The current URL is `{self.current_url}`."
-            ),
+            message=f"Url does contain `{url}` in {wait._timeout} seconds!",
         )
 
+    @traced("wait")
     def wait_until_url_changes(
         self,
         url: str | None = None,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until url changes.
 
@@ -245,6 +511,8 @@ class WebView:
                 input, will be used `self.current_url`.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
@@ -252,19 +520,21 @@ class WebView:
 
         """
         url = url or self.current_url
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
             method=expected_conditions.url_changes(url),
             message=(
-                f"Url didn't changed from {url} in {wait._timeout} "
-                f"seconds! The current URL is `{self.current_url}`."
+                f"Url didn't changed from {url} in {wait._timeout} seconds!"
             ),
         )
 
+    @traced("wait")
     def wait_until_locator_visible(
         self,
         locator: locators.Locator,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until element matching locator becomes visible.
 
@@ -272,26 +542,33 @@ class WebView:
             locator: Instance of a class to locate the element in the browser.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
+            browser_condition="visible",
+            locator=locator,
             method=expected_conditions.visibility_of_element_located(
-                locator=(locator.by, locator.query),
+                locator=locator.get_search_args(),
             ),
             message=(
                 f"Unable to locate {locator} in {wait._timeout} seconds!"
             ),
         )
 
+    @traced("wait")
     def wait_until_locator_invisible(
         self,
         locator: locators.Locator,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until element matching locator becomes invisible.
 
@@ -299,54 +576,77 @@ class WebView:
             locator: Instance of a class to locate the element in the browser.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
+            browser_condition="invisible",
+            locator=locator,
             method=expected_conditions.invisibility_of_element_located(
-                locator=(locator.by, locator.query),
+                locator=locator.get_search_args(),
             ),
             message=(
                 f"{locator} is still visible in {wait._timeout} seconds!"
             ),
         )
 
+    @traced("wait")
     def wait_until_clickable(
         self,
         locator: locators.Locator,
         timeout: float | None = None,
-    ) -> None:
+        web_element: WebElement | None = None,
+        polling: PollingStrategy | None = None,
+    ) -> WebElement:
         """Wait until element matching locator becomes clickable.
 
         Args:
             locator: Instance of a class to locate the element in the browser.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            web_element: Already found WebElement matching locator. If passed,
+                its clickability is checked without looking for element
+                again, locator is used only in failure message.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
+
+        Returns:
+            Clickable WebElement, so it can be clicked without looking for it
+            again.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        return self._wait_until(
+            wait,
+            browser_condition="clickable",
+            locator=locator,
+            web_element=web_element,
             method=expected_conditions.element_to_be_clickable(
-                mark=(locator.by, locator.query),
+                mark=web_element or locator.get_search_args(),
             ),
             message=(
                 f"{locator} isn't clickable after {wait._timeout} seconds!"
             ),
         )
 
+    @traced("wait")
     def wait_until_text_is_in_element(
         self,
         text: str,
         locator: locators.Locator,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ) -> None:
         """Wait until text is present in the specified element by locator.
 
@@ -355,16 +655,22 @@ class WebView:
             text: Text that should be presented in element.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
+            browser_condition="text",
+            locator=locator,
+            text=text,
             method=expected_conditions.text_to_be_present_in_element(
-                locator=(locator.by, locator.query),
+                locator=locator.get_search_args(),
                 text_=text,
             ),
             message=(
@@ -373,10 +679,12 @@ class WebView:
             ),
         )
 
+    @traced("wait")
     def wait_until_not_exists_in_dom(
         self,
         element: PomcornElement[locators.TLocator] | locators.TLocator,
         timeout: float | None = None,
+        polling: PollingStrategy | None = None,
     ):
         """Wait until element ceases to exist in DOM.
 
@@ -385,14 +693,23 @@ class WebView:
                 or instance of element.
             timeout: Number of seconds to wait until timing out. By default,
                 method waits for `self.wait_timeout` seconds.
+            polling: Strategy which defines delays between condition checks.
+                By default, strategy of wait policy is used.
 
         Raises:
             TimeoutException: If after `self.wait._timeout` seconds the wait
                 has not ended.
 
         """
-        wait = self.get_wait(timeout)
-        wait.until(
+        wait = self.get_wait(timeout, polling)
+        self._wait_until(
+            wait,
+            browser_condition="absent",
+            locator=(
+                element.locator
+                if isinstance(element, PomcornElement)
+                else element
+            ),
             method=waits_conditions.element_not_exists_in_dom(element),
             message=(
                 f"{element} is still exists in DOM after {wait._timeout} "
@@ -400,6 +717,177 @@ class WebView:
             ),
         )
 
+    def _wait_until(
+        self,
+        wait: PomcornWait,
+        method: Callable[[WebDriver], Any],
+        message: WaitMessage,
+        browser_condition: str | None = None,
+        locator: locators.Locator | None = None,
+        web_element: WebElement | None = None,
+        text: str = "",
+    ) -> Any:
+        """Wait until condition is met.
+
+        If `self.wait_in_browser` is `True` and `browser_condition` is passed,
+        condition is checked inside the browser by the single script call.
+        Otherwise (or if script fails, e.g. because page was reloaded while
+        waiting) `method` is polled via `wait`.
+
+        Diagnostics configured by `self.wait_policy.diagnostics` are added to
+        the message only if condition isn't met in time, so successful waits
+        don't make extra requests to the browser.
+
+        Args:
+            wait: Instance of `PomcornWait` to wait with.
+            method: Condition to poll on the client side.
+            message: Message of exception if condition isn't met in time or
+                callable which builds it.
+            browser_condition: Name of condition to check inside the browser
+                (see ``scripts.WAIT_FOR_CONDITION``).
+            locator: Locator of element to check condition for in browser.
+            web_element: Already found WebElement to check condition for in
+                browser instead of looking for it by `locator`.
+            text: Text for `text` condition.
+
+        Raises:
+            TimeoutException: If condition isn't met in time.
+
+        """
+        message = self._get_failure_message(message, locator)
+        if not (self.wait_in_browser and browser_condition and locator):
+            return wait.until(method=method, message=message)
+
+        try:
+            script_locator = scripts.get_script_locator(locator)
+        except ValueError:
+            return wait.until(method=method, message=message)
+
+        started_at = time.monotonic()
+        try:
+            with waiting():
+                is_met, result = self.webdriver.execute_async_script(
+                    scripts.WAIT_FOR_CONDITION,
+                    browser_condition,
+                    *script_locator,
+                    web_element,
+                    text,
+                    wait._timeout * 1000,
+                )
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            # Script is interrupted if page is unloaded while waiting or if
+            # script timeout of webdriver is exceeded, so continue waiting
+            # on the client side for the rest of timeout
+            remaining_timeout = wait._timeout - (time.monotonic() - started_at)
+            # Minimal timeout is used because zero timeout means default one
+            return self.get_wait(max(remaining_timeout, MIN_TIMEOUT)).until(
+                method=method,
+                message=message,
+            )
+
+        # Condition is checked inside the browser by the single command
+        wait._report(started_at, polls=1, is_successful=is_met)
+        if not is_met:
+            raise TimeoutException(message())
+        return result
+
+    def _get_failure_message(
+        self,
+        message: WaitMessage,
+        locator: locators.Locator | None = None,
+    ) -> Callable[[], str]:
+        """Get callable which builds message of timed out wait.
+
+        Args:
+            message: Message of timed out wait or callable which builds it.
+            locator: Locator of waited element to collect diagnostics for.
+
+        """
+
+        def get_message() -> str:
+            return self.wait_policy.diagnostics.format_message(
+                message=message() if callable(message) else message,
+                webdriver=self.webdriver,
+                locator=locator,
+            )
+
+        return get_message
+
+    def fill_form(
+        self,
+        fields: Mapping[FormField, Any],
+        only_visible: bool = True,
+    ) -> dict[FormField, FillResult]:
+        """Fill many form fields at once.
+
+        All fields are looked for and filled via single script call: values
+        are set directly and `input` and `change` events are dispatched, like
+        browser does when user types.
+
+        Fields that can't be filled this way (not found or not visible yet,
+        or not editable by setting value, like ``select``) are filled one by
+        one via ``PomcornElement.fill``, which waits for them and simulates
+        keystrokes. They are filled after all other fields.
+
+        .. code-block:: python
+
+            # Example
+            page.fill_form(
+                {
+                    locators.NameLocator("email"): "user@example.com",
+                    page.password_input: "password",
+                },
+            )
+
+        Args:
+            fields: Mapping of locators or elements of fields to their
+                values. Values are converted to strings.
+            only_visible: Flag for filling only visible fields. If this is
+                `True` (default), then not visible fields will be waited for.
+
+        Returns:
+            Mapping of passed fields to results of their filling.
+
+        """
+        targets = list(fields)
+        statuses = self.webdriver.execute_script(
+            scripts.FILL_FORM,
+            [
+                scripts.get_script_locator(
+                    target.locator
+                    if isinstance(target, PomcornElement)
+                    else target,
+                )
+                for target in targets
+            ],
+            [str(fields[target]) for target in targets],
+            only_visible,
+        )
+        self.mark_dom_changed()
+
+        results: dict[FormField, FillResult] = {}
+        for target, status in zip(targets, statuses, strict=True):
+            if status == "filled":
+                results[target] = FillResult(
+                    filled_by_script=True,
+                    fallback_reason=None,
+                )
+                continue
+
+            element = (
+                target
+                if isinstance(target, PomcornElement)
+                else self.init_element(locator=target)
+            )
+            element.fill(fields[target], only_visible=only_visible)
+            results[target] = FillResult(
+                filled_by_script=False,
+                fallback_reason=status,
+            )
+        return results
+
     def drag_and_drop(self, source: WebElement, target: WebElement):
         """Perform drag and drop.
 
@@ -409,6 +897,7 @@ class WebView:
 
         """
         ActionChains(self.webdriver).drag_and_drop(source, target).perform()
+        self.mark_dom_changed()
 
     def scroll_to(self, target: WebElement):
         """Scroll page to target.
@@ -420,27 +909,22 @@ class WebView:
             target: The web element instance to scroll to.
 
         """
-        # behavior="instant" - to scroll without animation
-        # block="center" - vertical scrolling up to center
-        # inline="center"- horizontal scrolling up to center
-        script = (
-            "arguments[0].scrollIntoView("
-            "{behavior: 'instant', block: 'center', inline: 'center'}"
-            ");"
-        )
-        self.webdriver.execute_script(script, target)
+        self.webdriver.execute_script(scripts.SCROLL_TO_CENTER, target)
+        self.mark_dom_changed()
 
     def scroll_to_top(self):
         """Scroll browser to top."""
         self.webdriver.execute_script(
             script="window.scrollBy(0, -document.body.scrollHeight)",
         )
+        self.mark_dom_changed()
 
     def scroll_to_bottom(self):
         """Scroll browser to bottom."""
         self.webdriver.execute_script(
             script="window.scrollBy(0, document.body.scrollHeight)",
         )
+        self.mark_dom_changed()
 
     def get_input_value(self, label: str) -> str:
         """Find input element by label and get it's value."""
@@ -457,10 +941,12 @@ class WebView:
 
         """
         self.webdriver.execute_script(script, *args)
+        self.mark_dom_changed()
 
     def switch_to_default(self):
         """Switch webdriver's focus to default content."""
         self.webdriver.switch_to.default_content()
+        self.mark_dom_changed()
 
     def switch_to_iframe(self, locator: locators.Locator):
         """Switch webdriver's focus to iframe.
@@ -470,6 +956,7 @@ class WebView:
 
         """
         self.webdriver.switch_to.frame(self._get_element(locator))
+        self.mark_dom_changed()
 
     @contextmanager
     def iframe_switcher_manager(self, locator: locators.Locator):
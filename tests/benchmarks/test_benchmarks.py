@@ -0,0 +1,18 @@
+import pytest
+
+from benchmarks.run import OPERATIONS, run_benchmarks
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from benchmarks.drivers import static_webdriver
+
+
+def test_benchmarks_run_with_static_webdriver() -> None:
+    """Check that all operations are measured with static webdriver."""
+    with static_webdriver([10]) as (webdriver, app_root):
+        results = run_benchmarks(webdriver, app_root, sizes=[10], repeats=1)
+
+    assert [result.operation for result in results] == list(OPERATIONS)
+    assert all(result.commands > 0 for result in results)
+    assert all(result.min_time > 0 for result in results)
@@ -0,0 +1,125 @@
+from typing import Any
+
+import pytest
+
+from pomcorn import Component, Element, Page, locators
+from pomcorn.element import ScopedElement
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <body>
+    <a class="title" href="/">Shop</a>
+    <div id="card">
+      <a class="title" href="/product">Product</a>
+      <span class="price">10</span>
+    </div>
+  </body>
+</html>
+"""
+
+
+class Card(Component[Page]):
+    """Card of product which looks for elements inside its body."""
+
+    base_locator = locators.IdLocator("card")
+    scoped_lookups = True
+
+    title = Element(relative_locator=locators.ClassLocator("title"))
+    price = Element(
+        relative_locator=locators.XPathLocator('//span[text()="10"]'),
+    )
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+@pytest.fixture
+def page(webdriver: StaticWebDriver) -> Page:
+    """Prepare page opened in static webdriver."""
+    webdriver.get(APP_ROOT)
+    return Page(webdriver=webdriver, app_root=APP_ROOT)
+
+
+def test_elements_are_looked_for_inside_body(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that scoped elements are looked for from body of component."""
+    card = Card(page)
+
+    assert isinstance(card.title, ScopedElement)
+    assert isinstance(card.price, ScopedElement)
+    assert card.title.search_args == (
+        "css selector",
+        ':scope [class*="title"]',
+    )
+    assert card.price.search_args == ("xpath", './/span[text()="10"]')
+    with CommandRecorder(webdriver) as recorder:
+        assert card.title.get_text() == "Product"
+        assert card.price.get_text() == "10"
+        assert card.title.exists_in_dom
+
+    commands = [record.command for record in recorder.records]
+    # Body of component is found only once
+    assert commands.count("findElement") == 1
+    assert "findElements" not in commands
+
+
+def test_stale_body_is_found_again(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that body is found again if component was rendered again."""
+    card = Card(page)
+    assert card.title.get_text() == "Product"
+
+    webdriver.load(INDEX_HTML.replace("Product", "Another product"))
+
+    assert card.title.get_text() == "Another product"
+
+
+def test_element_stale_before_click_is_found_again(
+    webdriver: StaticWebDriver,
+    page: Page,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that element is found again if it became stale before click."""
+    card = Card(page)
+    wait_until_clickable = page.wait_until_clickable
+    checked_elements: list[Any] = []
+
+    def render_again_and_wait(**kwargs: Any) -> Any:
+        if not checked_elements:
+            webdriver.load(INDEX_HTML, url=APP_ROOT)
+        checked_elements.append(kwargs["web_element"])
+        return wait_until_clickable(**kwargs)
+
+    monkeypatch.setattr(page, "wait_until_clickable", render_again_and_wait)
+
+    card.title.click()
+
+    assert len(checked_elements) == 2
+    assert checked_elements[0] != checked_elements[1]
+
+
+def test_lookups_are_not_scoped_by_default(page: Page) -> None:
+    """Check that components look for elements from document by default."""
+
+    class UnscopedCard(Card):
+        scoped_lookups = False
+
+    card = UnscopedCard(page)
+
+    assert not isinstance(card.title, ScopedElement)
+    assert card.title.get_text() == "Product"
@@ -2,6 +2,8 @@ import pytest
 
 from pomcorn import Page
 
+pytest_plugins = ["pytester"]
+
 
 @pytest.fixture
 def fake_page() -> Page:
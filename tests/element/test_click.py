@@ -0,0 +1,134 @@
+from typing import Any
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from pomcorn import Page, locators
+from pomcorn.element import PomcornElement
+
+LOCATOR = locators.IdLocator("submit")
+
+
+class ClickWebDriver:
+    """Fake webdriver which records commands and can fail clicks."""
+
+    def __init__(self) -> None:
+        self.commands: list[tuple[str, dict[str, Any]]] = []
+        self.found_elements = 0
+        self.stale_clicks = 0
+
+    def execute(
+        self,
+        driver_command: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        self.commands.append((driver_command, params or {}))
+        if driver_command == "clickElement" and self.stale_clicks:
+            self.stale_clicks -= 1
+            raise StaleElementReferenceException
+        return {"value": True}
+
+    def find_element(self, by: str, value: str) -> WebElement:
+        self.execute("findElement", {"using": by, "value": value})
+        self.found_elements += 1
+        return WebElement(parent=self, id_=f"element-{self.found_elements}")  # type: ignore[arg-type]
+
+    def execute_script(self, script: str, *args) -> Any:
+        return self.execute(
+            "w3cExecuteScript",
+            {"script": script, "args": list(args)},
+        )["value"]
+
+    def get_command_names(self) -> list[str]:
+        """Get names of recorded commands."""
+        return [command for command, _ in self.commands]
+
+
+@pytest.fixture
+def webdriver() -> ClickWebDriver:
+    """Prepare fake webdriver."""
+    return ClickWebDriver()
+
+
+@pytest.fixture
+def page(webdriver: ClickWebDriver) -> Page:
+    """Prepare page with fake webdriver."""
+    page = Page(webdriver=webdriver, app_root="None")  # type: ignore[arg-type]
+    webdriver.commands.clear()
+    return page
+
+
+def test_click_looks_for_element_once(
+    webdriver: ClickWebDriver,
+    page: Page,
+) -> None:
+    """Check that clickable element is clicked without looking for it again.
+
+    Clickability is checked by visibility (script) and enabled state.
+
+    """
+    PomcornElement(page, LOCATOR).click(wait_until_clickable=True)
+
+    assert webdriver.get_command_names() == [
+        "findElement",
+        "w3cExecuteScript",
+        "isElementEnabled",
+        "clickElement",
+    ]
+
+
+def test_click_scrolls_to_clicked_element(
+    webdriver: ClickWebDriver,
+    page: Page,
+) -> None:
+    """Check that page is scrolled to the same element which is clicked."""
+    PomcornElement(page, LOCATOR).click(center_element=True)
+
+    (_, scroll_params), (_, click_params) = webdriver.commands[-2:]
+    (scroll_target,) = scroll_params["args"]
+    assert isinstance(scroll_target, WebElement)
+    assert scroll_target.id == click_params["id"] == "element-1"
+    assert webdriver.found_elements == 1
+
+
+def test_click_retries_once_on_stale_element(
+    webdriver: ClickWebDriver,
+    page: Page,
+) -> None:
+    """Check that stale cached element is found again and clicked once."""
+    element = PomcornElement(page, LOCATOR, cache=True)
+    element.click()
+    webdriver.commands.clear()
+    webdriver.stale_clicks = 1
+
+    element.click()
+
+    assert webdriver.get_command_names() == [
+        # Cached element is checked for clickability without lookup
+        "w3cExecuteScript",
+        "isElementEnabled",
+        "clickElement",
+        # Retry with element found again
+        "findElement",
+        "w3cExecuteScript",
+        "isElementEnabled",
+        "clickElement",
+    ]
+    assert webdriver.commands[-1][1]["id"] == "element-2"
+
+
+def test_click_fails_if_element_is_stale_after_retry(
+    webdriver: ClickWebDriver,
+    page: Page,
+) -> None:
+    """Check that element isn't clicked more than twice if it stays stale."""
+    element = PomcornElement(page, LOCATOR, cache=True)
+    element.click()
+    webdriver.commands.clear()
+    webdriver.stale_clicks = 2
+
+    with pytest.raises(StaleElementReferenceException):
+        element.click()
+
+    assert webdriver.get_command_names().count("clickElement") == 2
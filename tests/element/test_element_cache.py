@@ -0,0 +1,135 @@
+from typing import Any
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from pomcorn import locators
+from pomcorn.element import PomcornElement
+
+
+class FakeWebElement:
+    """Fake WebElement which can become stale."""
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self.is_stale = False
+
+    @property
+    def text(self) -> str:
+        if self.is_stale:
+            raise StaleElementReferenceException
+        return self._text
+
+
+class FakeWebView:
+    """Fake web view which returns new WebElement on each lookup."""
+
+    def __init__(self) -> None:
+        self.found_elements: list[FakeWebElement] = []
+        self.return_stale = False
+
+    def _get_element(self, locator: Any, only_visible: bool) -> FakeWebElement:
+        element = FakeWebElement(text=f"text {len(self.found_elements)}")
+        element.is_stale = self.return_stale
+        self.found_elements.append(element)
+        return element
+
+    def drag_and_drop(
+        self,
+        source: FakeWebElement,
+        target: FakeWebElement,
+    ) -> None:
+        if source.is_stale or target.is_stale:
+            raise StaleElementReferenceException
+        self.dragged = (source.text, target.text)
+
+
+@pytest.fixture
+def web_view() -> FakeWebView:
+    """Prepare fake web view."""
+    return FakeWebView()
+
+
+def test_element_without_cache_looks_for_itself_each_time(
+    web_view: FakeWebView,
+) -> None:
+    """Check that not cached element finds WebElement for each action."""
+    element = PomcornElement(web_view, locators.XPathLocator("//a"))  # type: ignore
+    element.get_text()
+    element.get_text()
+    assert len(web_view.found_elements) == 2
+
+
+def test_cached_element_reuses_web_element(web_view: FakeWebView) -> None:
+    """Check that cached element finds WebElement only once."""
+    element = PomcornElement(
+        web_view,  # type: ignore
+        locators.XPathLocator("//a"),
+        cache=True,
+    )
+    assert element.get_text() == "text 0"
+    assert element.get_text() == "text 0"
+    assert len(web_view.found_elements) == 1
+
+
+def test_cached_element_recovers_from_stale_reference(
+    web_view: FakeWebView,
+) -> None:
+    """Check that stale cached WebElement is found again."""
+    element = PomcornElement(
+        web_view,  # type: ignore
+        locators.XPathLocator("//a"),
+        cache=True,
+    )
+    element.get_text()
+    web_view.found_elements[0].is_stale = True
+
+    assert element.get_text() == "text 1"
+    assert len(web_view.found_elements) == 2
+
+
+def test_bound_element_recovers_from_stale_reference(
+    web_view: FakeWebView,
+) -> None:
+    """Check that stale bound WebElement is found again by locator."""
+    element = PomcornElement(web_view, locators.XPathLocator("//a"))  # type: ignore
+    bound_element = FakeWebElement(text="bound")
+    element.bind(bound_element)  # type: ignore
+    assert element.get_text() == "bound"
+
+    bound_element.is_stale = True
+    assert element.get_text() == "text 0"
+
+
+def test_not_cached_element_raises_stale_reference(
+    web_view: FakeWebView,
+) -> None:
+    """Check that stale reference of just found WebElement isn't hidden."""
+    web_view.return_stale = True
+    element = PomcornElement(web_view, locators.XPathLocator("//a"))  # type: ignore
+    with pytest.raises(StaleElementReferenceException):
+        element.get_text()
+
+
+def test_drag_and_drop_recovers_from_stale_references(
+    web_view: FakeWebView,
+) -> None:
+    """Check that stale cached WebElements are found again to drag them."""
+    source = PomcornElement(
+        web_view,  # type: ignore
+        locators.XPathLocator("//a"),
+        cache=True,
+    )
+    target = PomcornElement(
+        web_view,  # type: ignore
+        locators.XPathLocator("//div"),
+        cache=True,
+    )
+    source.get_text()
+    target.get_text()
+    for found_element in web_view.found_elements:
+        found_element.is_stale = True
+
+    source.drag_and_drop(target)  # type: ignore[arg-type]
+
+    assert web_view.dragged == ("text 3", "text 2")
@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from pomcorn import Component, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+
+
+class CommandsWebDriver:
+    """Fake webdriver which sends all commands via `execute` method."""
+
+    def execute(
+        self,
+        driver_command: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return {"value": True}
+
+    def find_element(self, by: str, value: str) -> WebElement:
+        self.execute("findElement", {"using": by, "value": value})
+        return WebElement(parent=self, id_="element")  # type: ignore
+
+    def execute_script(self, script: str, *args) -> Any:
+        return self.execute("executeScript", {"script": script})["value"]
+
+
+class Header(Component[Page]):
+    """Component to check attribution of commands."""
+
+    base_locator = locators.IdLocator("header")
+
+    def wait_until_menu_clickable(self) -> None:
+        """Wait until menu of header is clickable."""
+        self.body.wait_until_clickable()
+
+
+@pytest.fixture
+def webdriver() -> CommandsWebDriver:
+    """Prepare fake webdriver."""
+    return CommandsWebDriver()
+
+
+@pytest.fixture
+def page(webdriver: CommandsWebDriver) -> Page:
+    """Prepare page with fake webdriver."""
+    return Page(webdriver=webdriver, app_root="None")  # type: ignore
+
+
+def test_recorder_records_commands(
+    webdriver: CommandsWebDriver,
+    page: Page,
+) -> None:
+    """Check that commands are recorded with locator, caller and wait."""
+    with CommandRecorder(webdriver) as recorder:  # type: ignore
+        page.init_element(locators.IdLocator("logo")).get_element()
+        page.execute_javascript("return 1;")
+
+    # Element is looked for twice: to check visibility and to return it
+    assert [record.command for record in recorder.records] == [
+        "findElement",
+        "executeScript",
+        "findElement",
+        "executeScript",
+    ]
+    assert recorder.records[0].locator == locators.IdLocator("logo").css
+    assert recorder.records[0].caller == "Page"
+    assert [record.in_wait for record in recorder.records] == [
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert recorder.records[3].locator is None
+
+    # Commands aren't recorded after exit
+    page.execute_javascript("return 1;")
+    assert recorder.count == 4
+
+
+def test_recorder_marks_commands_of_waits(
+    webdriver: CommandsWebDriver,
+    page: Page,
+) -> None:
+    """Check that commands checking wait conditions are marked."""
+    with CommandRecorder(webdriver) as recorder:  # type: ignore
+        Header(page, wait_until_visible=False).wait_until_menu_clickable()
+
+    assert recorder.count > 0
+    assert all(record.in_wait for record in recorder.records)
+    assert recorder.get_stats_by_caller()["Header"].count == recorder.count
+
+
+def test_recorder_exports_stats(
+    webdriver: CommandsWebDriver,
+    page: Page,
+    tmp_path: Path,
+) -> None:
+    """Check that recorded commands are aggregated and exported."""
+    with CommandRecorder(webdriver) as recorder:  # type: ignore
+        for _ in range(3):
+            page.execute_javascript("return 1;")
+
+    path = tmp_path / "commands.json"
+    recorder.export_json(path)
+
+    exported = json.loads(path.read_text())
+    assert exported["count"] == 3
+    assert exported["by_command"]["executeScript"]["count"] == 3
+    assert len(exported["records"]) == 3
+
+
+def test_recorders_are_stopped_in_any_order(
+    webdriver: CommandsWebDriver,
+    page: Page,
+) -> None:
+    """Check that recorder keeps recording when other one is stopped."""
+    outer = CommandRecorder(webdriver)  # type: ignore
+    inner = CommandRecorder(webdriver)  # type: ignore
+    outer.start()
+    inner.start()
+    page.execute_javascript("return 1;")
+
+    outer.stop()
+    page.execute_javascript("return 1;")
+    inner.stop()
+    page.execute_javascript("return 1;")
+
+    assert outer.count == 1
+    assert inner.count == 2
+    assert "execute" not in vars(webdriver)
+
+
+def test_recorder_records_names_and_locators_of_scripts() -> None:
+    """Check that pomcorn scripts are recorded by name with locators."""
+    pytest.importorskip("lxml")
+    pytest.importorskip("cssselect")
+    from pomcorn.static_driver import StaticWebDriver
+
+    webdriver = StaticWebDriver(
+        pages={"https://shop.test/": '<ul id="menu"><li>Home</li></ul>'},
+    )
+    page = Page.open(webdriver, app_root="https://shop.test/")
+    menu = page.init_element(locators.IdLocator("menu"))
+
+    with CommandRecorder(webdriver) as recorder:
+        assert menu.exists_in_dom
+        assert page._count_elements(locators.TagNameLocator("li")) == 1
+        page.execute_javascript("return 1;")
+
+    assert [
+        (record.script, record.locator) for record in recorder.records
+    ] == [
+        ("scripts.HAS_ELEMENTS", '[id="menu"]'),
+        ("scripts.COUNT_ELEMENTS", "li"),
+        ("return 1;", None),
+    ]
@@ -0,0 +1,183 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pomcorn import Component, ListComponent, Page, locators
+from pomcorn.extraction import Column, Schema
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://pypi.test/"
+
+ROWS_HTML = "".join(
+    f'<li><a class="snippet" href="/project/package-{index}">'
+    f'<span class="name">package-{index}</span>'
+    f'<span class="version">1.{index}</span></a></li>'
+    for index in range(100)
+)
+
+INDEX_HTML = f"""
+<html>
+  <body>
+    <ul id="results">
+      {ROWS_HTML}
+      <li><a class="snippet"><span class="name">broken</span></a></li>
+    </ul>
+  </body>
+</html>
+"""
+
+
+@dataclass(frozen=True)
+class PackageRow:
+    """Extracted package."""
+
+    name: str | None
+    version: str | None
+    url: str | None
+
+
+class PackageList(ListComponent[Component[Page], Page]):
+    """List of packages with declared extraction schema."""
+
+    base_locator = locators.IdLocator("results")
+    relative_item_locator = locators.ClassLocator("snippet")
+    extraction_schema: ClassVar[Schema] = {
+        "name": locators.ClassLocator("name"),
+        "version": locators.ClassLocator("version"),
+        "url": Column(attribute="href"),
+    }
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+@pytest.fixture
+def packages(webdriver: StaticWebDriver) -> PackageList:
+    """Prepare list of packages."""
+    webdriver.get(APP_ROOT)
+    return PackageList(Page(webdriver=webdriver, app_root=APP_ROOT))
+
+
+def test_columns_are_extracted_via_single_script(
+    webdriver: StaticWebDriver,
+    packages: PackageList,
+) -> None:
+    """Check that all cells are extracted by one call."""
+    with CommandRecorder(webdriver) as recorder:
+        columns = packages.extract_columns()
+
+    assert recorder.count == 1
+    assert list(columns) == ["name", "version", "url"]
+    assert columns["name"][:2] == ["package-0", "package-1"]
+    assert columns["version"][-2:] == ["1.99", None]
+    assert columns["url"][0] == "/project/package-0"
+    assert len(columns["url"]) == 101
+
+
+def test_text_of_cells_is_extracted_as_element_text(
+    webdriver: StaticWebDriver,
+    packages: PackageList,
+) -> None:
+    """Check that text of cells is the same as `WebElement.text`.
+
+    Lines of block elements are kept and text of hidden elements is empty.
+
+    """
+    webdriver.load(
+        """
+        <ul id="results">
+          <li><a class="snippet">
+            <div class="name">pomcorn
+              <p>Page   Object <b>Model</b></p></div>
+            <span class="version" hidden>1.0</span>
+          </a></li>
+        </ul>
+        """,
+        APP_ROOT,
+    )
+    columns = packages.extract_columns()
+    names = webdriver.find_elements(By.CSS_SELECTOR, ".name")
+    versions = webdriver.find_elements(By.CSS_SELECTOR, ".version")
+
+    assert columns["name"] == [names[0].text] == ["pomcorn\nPage Object Model"]
+    assert columns["version"] == [versions[0].text] == [""]
+
+
+def test_rows_are_materialized_into_class(packages: PackageList) -> None:
+    """Check that rows are created by passed callable."""
+    rows = packages.extract(into=PackageRow)
+
+    assert rows[3] == PackageRow(
+        name="package-3",
+        version="1.3",
+        url="/project/package-3",
+    )
+    assert rows[-1] == PackageRow(name="broken", version=None, url=None)
+
+
+def test_rows_are_tuples_by_default(packages: PackageList) -> None:
+    """Check that rows are tuples of fields in order of schema."""
+    rows = packages.filter(text="package-4")[:2].extract(
+        {
+            "version": locators.ClassLocator("version"),
+            "name": Column(locators.ClassLocator("name")),
+        },
+    )
+
+    assert rows == [("1.4", "package-4"), ("1.40", "package-40")]
+
+
+def test_schema_is_required(packages: PackageList) -> None:
+    """Check that extraction requires schema."""
+
+    class PlainList(ListComponent[Component[Page], Page]):
+        base_locator = PackageList.base_locator
+        relative_item_locator = PackageList.relative_item_locator
+
+    with pytest.raises(ValueError, match="extraction_schema"):
+        PlainList(packages.page).extract_columns()
+
+
+def test_grouped_column_locator_is_not_supported(
+    packages: PackageList,
+) -> None:
+    """Check that columns should be evaluated relative to item."""
+    with pytest.raises(ValueError, match="relative to list item"):
+        packages.extract({"name": locators.XPathLocator("(//span)[1]")})
+
+
+@pytest.mark.parametrize(
+    argnames=["column", "value", "expected_condition"],
+    argvalues=[
+        [Column(attribute="href"), "/a", '@href="/a"'],
+        [
+            Column(),
+            "It's",
+            """normalize-space(.)=concat("It", "'", "s")""",
+        ],
+        [
+            Column(locator=locators.ClassLocator("name")),
+            "package-1",
+            './/*[contains(@class, "name")][normalize-space(.)="package-1"]',
+        ],
+        [Column(), "multi\nline", None],
+        [Column(locator=locators.XPathLocator("(//span)[1]")), "x", None],
+    ],
+)
+def test_item_condition_of_column(
+    column: Column,
+    value: str,
+    expected_condition: str | None,
+) -> None:
+    """Check that items can be looked for by value of column."""
+    assert column.get_item_condition(value) == expected_condition
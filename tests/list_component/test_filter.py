@@ -0,0 +1,163 @@
+from typing import Any
+
+import pytest
+
+from pomcorn import Component, ListComponent, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <body>
+    <ul id="results">
+      <li data-status="active">
+        <span class="name">django</span> <b class="badge">new</b>
+      </li>
+      <li data-status="archived"><span class="name">flask</span></li>
+      <li><span class="name">django-filter</span></li>
+      <li style="display: none"><span class="name">django-hidden</span></li>
+      <li>  pomcorn <span class="name">selenium</span></li>
+    </ul>
+  </body>
+</html>
+"""
+
+
+class Item(Component[Page]):
+    """Item of search results."""
+
+    @property
+    def name(self) -> str:
+        """Get name of item."""
+        return self.init_element(
+            relative_locator=locators.ClassLocator("name"),
+        ).get_text(only_visible=False)
+
+
+class Results(ListComponent[Item, Page]):
+    """Search results."""
+
+    base_locator = locators.IdLocator("results")
+    relative_item_locator = locators.TagNameLocator("li")
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+@pytest.fixture
+def results(webdriver: StaticWebDriver) -> Results:
+    """Prepare list of search results."""
+    webdriver.get(APP_ROOT)
+    return Results(Page(webdriver=webdriver, app_root=APP_ROOT))
+
+
+def get_names(results: Results, **conditions) -> list[str]:
+    """Get names of visible items matching conditions."""
+    items = results.filter(**conditions)
+    return [item.name for item in items.filter(visible=True)]
+
+
+@pytest.mark.parametrize(
+    ["conditions", "names"],
+    [
+        [{"text": "django"}, ["django", "django-filter"]],
+        [{"text": "pomcorn"}, ["selenium"]],
+        [{"text": "  pomcorn ", "exact": True}, ["selenium"]],
+        [{"text_starts_with": "pomcorn"}, ["selenium"]],
+        [{"attributes": {"data-status": "active"}}, ["django"]],
+        [{"attributes": {"data-status": True}}, ["django", "flask"]],
+        [
+            {"attributes": {"data-status": False}},
+            ["django-filter", "selenium"],
+        ],
+        [{"has": locators.ClassLocator("badge")}, ["django"]],
+        [
+            {"has": locators.ClassLocator("name").contains("fla")},
+            ["flask"],
+        ],
+    ],
+)
+def test_filter(
+    results: Results,
+    conditions: dict[str, Any],
+    names: list[str],
+) -> None:
+    """Check that items are filtered by conditions."""
+    assert get_names(results, **conditions) == names
+
+
+def test_filter_by_visibility(results: Results) -> None:
+    """Check that items are filtered by visibility in markup."""
+    assert len(results.filter(visible=True)) == 4
+    assert len(results.filter(visible=False)) == 1
+    assert len(results.filter(visible=False, text="django-hidden")) == 1
+
+
+def test_where(results: Results) -> None:
+    """Check that items are filtered by XPath conditions."""
+    items = results.where(
+        '@data-status="active" or @data-status="archived"',
+        locators.ClassLocator("name"),
+    )
+
+    assert [item.name for item in items] == ["django", "flask"]
+
+
+def test_where_wraps_each_condition(results: Results) -> None:
+    """Check that `or` of single condition isn't mixed with other ones."""
+    items = results.where(
+        '@data-status="archived"\nor @data-status="active"',
+        "@data-missing",
+    )
+
+    assert len(items) == 0
+    # Redundant parentheses don't prevent compilation to CSS selector
+    assert results.where('@data-status="active"').locator.css is not None
+
+
+@pytest.mark.parametrize(
+    argnames="locator",
+    argvalues=[
+        locators.ClassLocator("name") | locators.ClassLocator("badge"),
+        locators.ClassLocator("name")[0],
+    ],
+)
+def test_grouped_child_locator_is_not_supported(
+    results: Results,
+    locator: locators.XPathLocator,
+) -> None:
+    """Check that child locators should be evaluated relative to item."""
+    with pytest.raises(ValueError, match="relative to list item"):
+        results.filter(has=locator)
+
+
+def test_filtered_items_are_counted_in_browser(
+    webdriver: StaticWebDriver,
+    results: Results,
+) -> None:
+    """Check that only matching items are returned from browser."""
+    with CommandRecorder(webdriver) as recorder:
+        count = len(results.filter(text="django", visible=True))
+
+    assert count == 2
+    assert len(recorder.records) == 1
+
+
+def test_filter_of_slice(results: Results) -> None:
+    """Check that filters and slices can be combined."""
+    items = results.items[1:].filter(text="django")
+
+    assert len(items) == 2
+    assert items[0].name == "django-filter"
+    assert results.filter(text="django", visible=True)[-1].name == (
+        "django-filter"
+    )
@@ -0,0 +1,98 @@
+from typing import Any, ClassVar
+
+from pomcorn import Component, ListComponent, Page, locators, scripts
+
+
+class SnapshotWebDriver:
+    """Fake webdriver which returns prepared elements snapshot."""
+
+    def __init__(self, *snapshots: list[list[Any]]) -> None:
+        self.snapshots = list(snapshots)
+        self.executed_scripts: list[tuple[str, tuple[Any, ...]]] = []
+
+    def execute_script(self, script: str, *args) -> list[list[Any]]:
+        self.executed_scripts.append((script, args))
+        if len(self.snapshots) > 1:
+            return self.snapshots.pop(0)
+        return self.snapshots[0]
+
+
+class SnapshotPage(Page):
+    """Test page which remembers locator visibility waits."""
+
+    waited_locators: ClassVar[list[locators.Locator]] = []
+
+    def wait_until_locator_visible(
+        self,
+        locator: locators.Locator,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> None:
+        self.waited_locators.append(locator)
+
+
+class Item(Component[Page]):
+    """Test item which remembers visibility waits instead of waiting."""
+
+    waited_items: ClassVar[list["Item"]] = []
+
+    def wait_until_visible(self, timeout: float | None = None, **kwargs):
+        self.waited_items.append(self)
+
+
+class List(ListComponent[Item, Page]):
+    """Test list which gets items via snapshot."""
+
+    base_locator = locators.XPathLocator("//ul")
+    relative_item_locator = locators.XPathLocator("//li")
+    use_items_snapshot = True
+
+    def wait_until_visible(self, timeout: float | None = None, **kwargs):
+        """To not wait anything."""
+
+
+def test_all_items_found_via_single_script() -> None:
+    """Check that items are bound to elements from single snapshot."""
+    first, second = object(), object()
+    webdriver = SnapshotWebDriver([[first, True], [second, False]])
+    page = Page(webdriver=webdriver, app_root="None")  # type: ignore
+    Item.waited_items = []
+
+    items = List(page).all
+
+    assert len(webdriver.executed_scripts) == 1
+    script, args = webdriver.executed_scripts[0]
+    assert script == scripts.ELEMENTS_SNAPSHOT
+    assert args == ("css selector", "ul li")
+
+    assert [item.body.get_element() for item in items] == [first, second]
+    assert [item.base_locator.query for item in items] == [
+        "(//ul//li)[1]",
+        "(//ul//li)[2]",
+    ]
+    # Only item which was not visible in snapshot should wait
+    assert Item.waited_items == [items[1]]
+
+
+def test_snapshot_is_taken_again_once_items_are_visible() -> None:
+    """Check that items which appear while waiting for visibility are got."""
+    first, second = object(), object()
+    webdriver = SnapshotWebDriver(
+        [[first, False]],
+        [[first, True], [second, True]],
+    )
+    page = SnapshotPage(webdriver=webdriver, app_root="None")  # type: ignore
+    SnapshotPage.waited_locators = []
+    Item.waited_items = []
+
+    items = List(page).all
+
+    assert [query for _, (_, query) in webdriver.executed_scripts] == [
+        "ul li",
+        "ul li",
+    ]
+    assert [locator.query for locator in SnapshotPage.waited_locators] == [
+        "//ul//li",
+    ]
+    assert [item.body.get_element() for item in items] == [first, second]
+    assert Item.waited_items == []
@@ -0,0 +1,116 @@
+import pytest
+
+from pomcorn import Component, ListComponent, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = f"""
+<html>
+  <body>
+    <ul id="results">
+      {"".join(f"<li>Product {index}</li>" for index in range(30))}
+    </ul>
+  </body>
+</html>
+"""
+
+
+class Item(Component[Page]):
+    """Item of search results."""
+
+    @property
+    def title(self) -> str:
+        """Get title of item."""
+        return self.body.get_text()
+
+
+class Results(ListComponent[Item, Page]):
+    """Search results."""
+
+    base_locator = locators.IdLocator("results")
+    relative_item_locator = locators.TagNameLocator("li")
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+@pytest.fixture
+def results(webdriver: StaticWebDriver) -> Results:
+    """Prepare list of search results."""
+    webdriver.get(APP_ROOT)
+    return Results(Page(webdriver=webdriver, app_root=APP_ROOT))
+
+
+def get_titles(items: list[Item]) -> list[str]:
+    """Get titles of items."""
+    return [item.title for item in items]
+
+
+def test_items_are_indexed_by_xpath(results: Results) -> None:
+    """Check that items are accessed by XPath positions."""
+    assert len(results.items) == 30
+    assert results.items[0].title == "Product 0"
+    assert results.items[3].title == "Product 3"
+    assert results.items[-1].title == "Product 29"
+    assert results.items[-2].title == "Product 28"
+    assert results.items[-1].base_locator.query.endswith("[last()]")
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(10, 20),
+        slice(None, 3),
+        slice(-5, None),
+        slice(-5, -2),
+        slice(25, 100),
+        slice(None, None, 7),
+        slice(3, 20, 4),
+        slice(-10, None, 3),
+    ],
+)
+def test_items_are_sliced_by_xpath(results: Results, index: slice) -> None:
+    """Check that slices of items match slices of list."""
+    titles = [f"Product {number}" for number in range(30)]
+    items = results.items[index]
+
+    assert len(items) == len(titles[index])
+    assert get_titles(list(items)) == titles[index]
+
+
+def test_slice_of_slice(results: Results) -> None:
+    """Check that slice of slice is counted from the first slice."""
+    items = results.items[10:20][2:4]
+
+    assert get_titles(list(items)) == ["Product 12", "Product 13"]
+    assert items[-1].title == "Product 13"
+
+
+def test_item_access_does_not_depend_on_list_length(
+    webdriver: StaticWebDriver,
+    results: Results,
+) -> None:
+    """Check that only accessed item is initialized."""
+    with CommandRecorder(webdriver) as recorder:
+        item = results.items[3]
+
+    assert item.base_locator.query == '(//*[@id="results"]//li)[4]'
+    # Item only waits for its visibility, other items aren't looked for
+    assert [
+        record.locator for record in recorder.records if record.locator
+    ] == [item.base_locator.query]
+
+
+def test_not_positive_step_is_not_supported(results: Results) -> None:
+    """Check that slices with not positive step raise error."""
+    with pytest.raises(ValueError, match="Only positive step"):
+        results.items[::-1]
@@ -0,0 +1,199 @@
+import itertools
+import time
+from typing import Any
+
+import pytest
+
+from pomcorn import Component, Element, ListComponent, Page, locators, scripts
+from pomcorn.extraction import Column
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://feed.test/"
+
+POSTS_COUNT = 50
+WINDOW_SIZE = 10
+
+
+def get_feed_html(start: int) -> str:
+    """Get HTML of virtualized feed with rendered window of posts."""
+    posts = "".join(
+        f'<article data-id="{index}"><p class="title">Post {index}</p>'
+        "</article>"
+        for index in range(start, min(start + WINDOW_SIZE, POSTS_COUNT))
+    )
+    return f"""
+    <html>
+      <body>
+        <div id="feed">{posts}<article class="placeholder"></article></div>
+      </body>
+    </html>
+    """
+
+
+class Post(Component[Page]):
+    """Post of feed."""
+
+    title = Element(relative_locator=locators.ClassLocator("title"))
+
+
+class Feed(ListComponent[Post, Page]):
+    """Feed with virtual scrolling."""
+
+    base_locator = locators.IdLocator("feed")
+    relative_item_locator = locators.TagNameLocator("article")
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver which renders next posts on scroll.
+
+    Scroll to the end of feed renders the next window of posts, which starts
+    two posts before the end of current one, like virtualized lists do.
+
+    """
+    webdriver = StaticWebDriver(pages={APP_ROOT: get_feed_html(start=0)})
+    window_starts = [0]
+
+    def scroll_to(element: Any) -> None:
+        start = window_starts[-1] + WINDOW_SIZE - 2
+        window_starts.append(start)
+        webdriver.load(get_feed_html(start=start), APP_ROOT)
+
+    webdriver.register_script(scripts.SCROLL_TO_CENTER, scroll_to)
+    webdriver.get(APP_ROOT)
+    return webdriver
+
+
+@pytest.fixture
+def feed(webdriver: StaticWebDriver) -> Feed:
+    """Prepare feed."""
+    return Feed(Page(webdriver=webdriver, app_root=APP_ROOT))
+
+
+def test_stream_yields_unique_items_while_scrolling(feed: Feed) -> None:
+    """Check that all posts are yielded once in order."""
+    texts = [
+        post.body.get_text()
+        for post in feed.stream(
+            key=Column(attribute="data-id"),
+            quiet_period=0.05,
+        )
+    ]
+
+    assert texts == [f"Post {index}" for index in range(POSTS_COUNT)]
+
+
+def test_stream_skips_items_without_key(feed: Feed) -> None:
+    """Check that items without key aren't yielded."""
+    posts = list(feed.stream(key=Column(attribute="data-id"), quiet_period=0))
+
+    assert len(posts) == WINDOW_SIZE
+
+
+def test_stream_uses_text_as_key_by_default(feed: Feed) -> None:
+    """Check that posts are deduplicated by text by default."""
+    posts = list(feed.stream(quiet_period=0.05))
+
+    # Placeholder has empty text, which is the key too
+    assert len(posts) == POSTS_COUNT + 1
+
+
+def test_stream_key_can_be_locator(feed: Feed) -> None:
+    """Check that text of element found by locator can be used as key."""
+    posts = list(
+        feed.stream(
+            key=locators.XPathLocator("//self::article[@data-id]"),
+            quiet_period=0,
+        ),
+    )
+
+    assert len(posts) == WINDOW_SIZE
+
+
+def test_stream_remembers_limited_number_of_keys(feed: Feed) -> None:
+    """Check that item is yielded again if its key was forgotten."""
+    stream = feed.stream(
+        key=Column(attribute="data-id"),
+        quiet_period=0.05,
+        max_keys=1,
+    )
+    posts_count = 0
+    for _ in stream:
+        posts_count += 1
+        if posts_count > POSTS_COUNT:
+            break
+
+    assert posts_count > POSTS_COUNT
+
+
+def test_stream_items_are_found_by_key(feed: Feed) -> None:
+    """Check that streamed items aren't mixed up when list is scrolled.
+
+    After scroll the rendered window starts from another post, so positions
+    of items change.
+
+    """
+    stream = feed.stream(key=Column(attribute="data-id"), quiet_period=0)
+    posts = list(itertools.islice(stream, WINDOW_SIZE + 1))
+
+    assert posts[9].base_locator == feed.base_item_locator['@data-id="9"']
+    assert posts[9].body.get_text() == "Post 9"
+    assert posts[9].title.get_text() == "Post 9"
+
+
+def test_stream_items_look_for_elements_inside_body(
+    feed: Feed,
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that elements of streamed item are looked for inside it."""
+    post = next(feed.stream(quiet_period=0))
+
+    with CommandRecorder(webdriver) as recorder:
+        assert post.title.get_text() == "Post 0"
+
+    commands = [record.command for record in recorder.records]
+    assert "findChildElement" in commands
+    assert "findElement" not in commands
+
+
+def test_stream_items_cache_body_found_again(
+    feed: Feed,
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that body of streamed item found again is reused."""
+    post = next(feed.stream(quiet_period=0))
+    webdriver.load(get_feed_html(start=0), APP_ROOT)
+
+    with CommandRecorder(webdriver) as recorder:
+        assert post.title.get_text() == "Post 0"
+        assert post.title.get_text() == "Post 0"
+
+    commands = [record.command for record in recorder.records]
+    # Stale body is found again only once
+    assert commands.count("findElement") == 1
+
+
+def test_stream_checks_list_more_rarely_without_new_items(
+    feed: Feed,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that delays between checks grow while there are no new items."""
+    delays: list[float] = []
+    sleep = time.sleep
+
+    def record_sleep(delay: float) -> None:
+        delays.append(delay)
+        sleep(delay)
+
+    monkeypatch.setattr(time, "sleep", record_sleep)
+    posts = list(
+        feed.stream(key=Column(attribute="data-id"), quiet_period=0.2),
+    )
+
+    assert len(posts) == POSTS_COUNT
+    assert max(delays) > 2 * feed.poll_frequency
@@ -0,0 +1,59 @@
+import copy
+import pickle
+
+import pytest
+
+from pomcorn import locators
+
+
+def test_locators_are_immutable() -> None:
+    """Check that attributes of locators can't be changed or added."""
+    locator = locators.IdLocator("menu")
+    with pytest.raises(AttributeError, match="immutable"):
+        locator.query = "//div"  # type: ignore[misc]
+    with pytest.raises(AttributeError, match="immutable"):
+        del locator.css
+    with pytest.raises(AttributeError, match="immutable"):
+        locator.extra = True  # type: ignore[attr-defined]
+    assert not hasattr(locator, "__dict__")
+
+
+def test_locators_equality() -> None:
+    """Check that locators with the same query are equal and hashable."""
+    locator: locators.XPathLocator = locators.IdLocator("menu")
+    same_locator = locators.XPathLocator('//*[@id="menu"]')
+
+    assert locator == same_locator
+    assert hash(locator) == hash(same_locator)
+    assert locator != locators.IdLocator("header")
+    assert locator != locators.Locator(by="css selector", query="#menu")
+    assert locator != locator.query
+    assert {locator: 1}[same_locator] == 1
+
+
+def test_composition_is_interned() -> None:
+    """Check that the same composition returns the same locator."""
+    base = locators.ClassLocator("products")
+    item = locators.ClassLocator("product")
+
+    assert base // item is locators.ClassLocator("products") // item
+    assert base / item is base / item
+    assert (base | item) is (base | item)
+    assert base[0] is base[0]
+    assert base["@hidden"] is base["@hidden"]
+    assert base.contains("Apple") is base.contains("Apple")
+    assert base[0] is not base[1]
+    assert (base // item).query == (
+        '//*[contains(@class, "products")]//*[contains(@class, "product")]'
+    )
+
+
+def test_locators_can_be_copied() -> None:
+    """Check that locators can be copied and pickled."""
+    locator = locators.DataTestIdLocator("save") // locators.TagNameLocator(
+        "button",
+    )
+    assert copy.deepcopy(locator) == locator
+    restored = pickle.loads(pickle.dumps(locator))  # noqa: S301
+    assert restored == locator
+    assert restored.css == locator.css
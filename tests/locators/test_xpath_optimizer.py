@@ -0,0 +1,102 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pomcorn import locators
+from pomcorn.locators.xpath_optimizer import optimize_xpath
+
+
+@pytest.mark.parametrize(
+    argnames=["query", "expected_query"],
+    argvalues=[
+        ["((//ul//li))//.//a", "//ul//li//a"],
+        ["(//div)/a", "//div/a"],
+        ['(//div)[@id="x"]', '//div[@id="x"]'],
+        ["(//div)[contains(., 'x')]", '//div[contains(., "x")]'],
+        ["(//div)[@x][count(a)>1]", "//div[@x][count(a)>1]"],
+        ["//a/./b", "//a/b"],
+        ["//a/.//b", "//a//b"],
+        ["//a/descendant-or-self::node()/b", "//a//b"],
+        ['//*[self::button][@type="submit"]', '//button[@type="submit"]'],
+        ['//*[contains(@class, "")]', "//*"],
+        ["( //a|//b )[@x = 'y']", '(//a | //b)[@x="y"]'],
+        ["((//a | //b))", "(//a | //b)"],
+        ["//a[@x and @y or @z]", "//a[@x and @y or @z]"],
+        ["//and/or", "//and/or"],
+        ["//a[@x - 1 = 2]", "//a[@x - 1=2]"],
+        ['//a[(@x="y")]', '//a[@x="y"]'],
+        ["//a[(@x or @y)]", "//a[@x or @y]"],
+        ["//a[(@x or @y) and (.//b)]", "//a[(@x or @y) and .//b]"],
+        ["//a[not(@x) and (@y)]", "//a[not(@x) and @y]"],
+    ],
+)
+def test_optimize_xpath(query: str, expected_query: str) -> None:
+    """Check simplification of XPath queries."""
+    assert optimize_xpath(query) == expected_query
+
+
+@pytest.mark.parametrize(
+    argnames="query",
+    argvalues=[
+        "(//li)[1]",
+        "(//li)[last()]",
+        "(//li)[@x][1]",
+        "(//li)[position() < 3]",
+        "(//li)[@x + 1]",
+        "(//a | //b)//c",
+        "(//a | //b)[@x]",
+        "//a[.//label][contains(., 'x')]/following-sibling::input",
+        "//*[1][self::div]",
+        'id("x")//a',
+        "(//a",
+        "//a[@x = `y`]",
+        "//a[(@x)=1]",
+        "//a[(.//b)[1]]",
+        "//a[@x or (@y) and @z]",
+    ],
+)
+def test_optimize_xpath_keeps_query(query: str) -> None:
+    """Check that queries which can't be simplified are kept."""
+    assert optimize_xpath(query).replace(" ", "") == query.replace(
+        " ",
+        "",
+    ).replace("'", '"')
+
+
+def test_locators_use_canonical_query() -> None:
+    """Check that locators are compared and looked for by canonical query."""
+    nested = (
+        locators.XPathLocator("(//ul)") // locators.ClassLocator("item")
+    ).contains("Apple")
+    assert nested.canonical_query == (
+        '//ul//*[contains(@class, "item")][contains(., "Apple")]'
+    )
+    assert nested.get_search_args() == (By.XPATH, nested.canonical_query)
+    assert nested == locators.XPathLocator(nested.canonical_query)
+    assert locators.XPathLocator("( //div )//a") == locators.XPathLocator(
+        "//div//a",
+    )
+    assert locators.XPathLocator("(//div)[@id='menu']").css == (
+        'div[id="menu"]'
+    )
+
+
+def test_canonical_query_is_computed_lazily(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Check that canonical query is computed once on first search."""
+    calls: list[str] = []
+
+    def fake_optimize_xpath(query: str) -> str:
+        calls.append(query)
+        return optimize_xpath(query)
+
+    monkeypatch.setattr(
+        "pomcorn.locators.base_locators.optimize_xpath",
+        fake_optimize_xpath,
+    )
+    locator = locators.XPathLocator("(//ul)") // locators.ClassLocator("lazy")
+    assert not calls
+
+    assert locator.get_search_args() == locator.get_search_args()
+    assert locator.canonical_query == '//ul//*[contains(@class, "lazy")]'
+    assert calls == [locator.query]
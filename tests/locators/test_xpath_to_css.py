@@ -0,0 +1,102 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pomcorn import locators
+from pomcorn.locators.xpath_to_css import xpath_to_css
+
+
+@pytest.mark.parametrize(
+    argnames=["query", "expected_css"],
+    argvalues=[
+        ["//div", "div"],
+        ["//*", "*"],
+        ["//ul/li", "ul > li"],
+        ["//ul//li", "ul li"],
+        ['//*[@id="menu"]', '[id="menu"]'],
+        ["//input[@disabled]", "input[disabled]"],
+        ["//a[@x='1' and @y]", 'a[x="1"][y]'],
+        ['//*[contains(@class, "item")]', '[class*="item"]'],
+        ['//*[contains(@class, "")]', "*"],
+        ['//a[starts-with(@href, "") and @x]', "a[x]"],
+        ['//a[starts-with(@href, "/help")]', 'a[href^="/help"]'],
+        ["//a[@title='say \"hi\"']", 'a[title="say \\"hi\\""]'],
+        ["(//a | //b)//img", "a img, b img"],
+        ["(//a | //b)[@x]", "a[x], b[x]"],
+        ["(//li)[2]", None],
+        ["//li[last()]", None],
+        ['//*[contains(., "text")]', None],
+        ['//button[./text()="Save"]', None],
+        ["//label/following-sibling::input", None],
+        ["//a/text()", None],
+        ["/html/body", None],
+        ["//a[@x!='1']", None],
+        ["//a | //b | ", None],
+    ],
+)
+def test_xpath_to_css(query: str, expected_css: str | None) -> None:
+    """Check compilation of XPath queries to CSS selectors."""
+    assert xpath_to_css(query) == expected_css
+
+
+def test_built_in_locators_carry_css() -> None:
+    """Check that built-in locators and their compositions have CSS."""
+    assert locators.IdLocator("menu").css == '[id="menu"]'
+    assert locators.ClassLocator("item", exact=True).css == '[class="item"]'
+    assert locators.DataTestIdLocator("save").css == '[data-testid="save"]'
+    assert locators.TagNameLocator("li").css == "li"
+    assert locators.NameLocator("q", container="input").css == (
+        'input[name="q"]'
+    )
+    composed = (
+        locators.IdLocator("menu") // locators.TagNameLocator("ul")
+    ) / locators.ClassLocator("item")
+    assert composed.css == '[id="menu"] ul > [class*="item"]'
+    assert composed.get_search_args() == (By.CSS_SELECTOR, composed.css)
+
+
+def test_text_locators_fall_back_to_xpath() -> None:
+    """Check that locators with text conditions or indexes use XPath."""
+    for locator in (
+        locators.ButtonWithTextLocator("Save"),
+        locators.IdLocator("menu") // locators.ElementWithTextLocator("Help"),
+        locators.TagNameLocator("li")[0],
+        locators.TagNameLocator("li").contains("Apple"),
+    ):
+        assert locator.css is None
+        assert locator.get_search_args() == (By.XPATH, locator.canonical_query)
+
+
+def test_css_matches_same_elements() -> None:
+    """Check that CSS selectors find the same elements as XPath queries."""
+    pytest.importorskip("lxml")
+    pytest.importorskip("cssselect")
+    from pomcorn.static_driver import StaticWebDriver
+
+    webdriver = StaticWebDriver(
+        """
+        <div id="menu">
+          <ul class="items">
+            <li class="item first" data-testid="apple">Apple</li>
+            <li class="item"><span class="item-name">Cherry</span></li>
+          </ul>
+          <a href="/help" title='say "hi"'>Help</a>
+          <input name="q" disabled>
+        </div>
+        """,
+    )
+    for locator in (
+        locators.ClassLocator("item"),
+        locators.IdLocator("menu") // locators.ClassLocator("item"),
+        locators.ClassLocator("items") / locators.TagNameLocator("li"),
+        locators.DataTestIdLocator("apple") | locators.NameLocator("q"),
+        (locators.TagNameLocator("li") | locators.TagNameLocator("a"))
+        // locators.TagNameLocator("span"),
+        locators.XPathLocator("//a[@title='say \"hi\"']"),
+        locators.XPathLocator('//*[contains(@class, "")]'),
+    ):
+        by, query = locator.get_search_args()
+        assert by == By.CSS_SELECTOR
+        assert webdriver.find_elements(by, query) == (
+            webdriver.find_elements(By.XPATH, locator.query)
+        )
+        assert webdriver.find_elements(by, query)
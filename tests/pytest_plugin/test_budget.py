@@ -0,0 +1,70 @@
+import pytest
+
+TESTS = '''
+import pytest
+
+from pomcorn import Page
+
+
+class CommandsWebDriver:
+    """Fake webdriver which sends all commands via `execute` method."""
+
+    def execute(self, driver_command, params=None):
+        return {"value": True}
+
+    def execute_script(self, script, *args):
+        return self.execute("executeScript", {"script": script})["value"]
+
+
+class CatalogPage(Page):
+    """Page which sends a command on each check of loading."""
+
+    def check_page_is_loaded(self):
+        return self.webdriver.execute_script("return true;")
+
+
+@pytest.fixture
+def webdriver():
+    return CommandsWebDriver()
+
+
+@pytest.fixture
+def page(webdriver):
+    return CatalogPage(webdriver, app_root="None")
+
+
+@pytest.mark.pomcorn_budget(commands=3)
+def test_within_budget(page):
+    page.execute_javascript("return 1;")
+
+
+@pytest.mark.pomcorn_budget(commands=3)
+def test_over_budget(page):
+    for _ in range(3):
+        page.execute_javascript("return 1;")
+
+
+@pytest.mark.pomcorn_budget(wait_seconds=0)
+def test_over_wait_budget(page):
+    pass
+
+
+def test_commands_fixture(pomcorn_commands, page):
+    assert pomcorn_commands.count == 1
+'''
+
+
+def test_budget_marker(pytester: pytest.Pytester) -> None:
+    """Check that tests exceeding their budget fail."""
+    pytester.makepyfile(TESTS)
+
+    result = pytester.runpytest("-p", "pomcorn.pytest_plugin")
+
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*Test sent 4 WebDriver commands, budget is 3. "
+            "Commands by callers: CatalogPage (4).",
+            "*Test spent * seconds in 1 waits, budget is 0 seconds.",
+        ],
+    )
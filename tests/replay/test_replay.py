@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from pomcorn import Component, ListComponent, Page, locators
+from pomcorn.deadline import deadline
+from pomcorn.replay import CommandsRecording, ReplayError, ReplayWebDriver
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <body>
+    <ul class="products">
+      <li class="product">Apple</li>
+      <li class="product">Cherry</li>
+    </ul>
+  </body>
+</html>
+"""
+
+
+class Product(Component[Page]):
+    """Product from list."""
+
+
+class ProductList(ListComponent[Product, Page]):
+    """List of products."""
+
+    base_locator = locators.ClassLocator("products")
+    relative_item_locator = locators.ClassLocator("product")
+
+
+def open_products(webdriver: StaticWebDriver | ReplayWebDriver) -> list[str]:
+    """Open page and get text of all products."""
+    page = Page.open_from_url(webdriver, path="", app_root=APP_ROOT)
+    return [product.body.get_text() for product in ProductList(page).all]
+
+
+@pytest.fixture
+def recording() -> CommandsRecording:
+    """Record scenario run against static webdriver."""
+    webdriver = StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+    with CommandsRecording(webdriver) as recording:
+        assert open_products(webdriver) == ["Apple", "Cherry"]
+    return recording
+
+
+@pytest.mark.parametrize("file_name", ["recording.json", "recording.json.gz"])
+def test_saved_recording_is_replayed(
+    recording: CommandsRecording,
+    tmp_path: Path,
+    file_name: str,
+) -> None:
+    """Check that scenario is replayed from saved recording many times."""
+    path = tmp_path / file_name
+    recording.save(path)
+    webdriver = ReplayWebDriver(path)
+
+    for _ in range(3):
+        assert open_products(webdriver) == ["Apple", "Cherry"]
+        assert webdriver.connection.position == len(recording.commands)
+        webdriver.rewind()
+
+
+def test_changed_command_isnt_replayed(recording: CommandsRecording) -> None:
+    """Check that commands which differ from recorded ones are rejected."""
+    webdriver = ReplayWebDriver(recording)
+
+    with pytest.raises(ReplayError, match="differs from recorded"):
+        webdriver.get(f"{APP_ROOT}help")
+
+
+def wait_for_products(
+    webdriver: StaticWebDriver | ReplayWebDriver,
+    timeout: float,
+) -> None:
+    """Open page and wait for products inside the browser under deadline."""
+    page = Page.open_from_url(
+        webdriver,
+        path="",
+        app_root=APP_ROOT,
+        wait_in_browser=True,
+    )
+    with deadline(timeout):
+        page.wait_until_locator_visible(ProductList.base_locator)
+
+
+def test_recording_under_deadline_is_replayed() -> None:
+    """Check that timeouts limited by deadline aren't compared on replay."""
+    webdriver = StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+    with CommandsRecording(webdriver) as recording:
+        wait_for_products(webdriver, timeout=10)
+    replay_webdriver = ReplayWebDriver(recording)
+
+    wait_for_products(replay_webdriver, timeout=5)
+
+    assert replay_webdriver.connection.position == len(recording.commands)
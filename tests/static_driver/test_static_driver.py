@@ -0,0 +1,156 @@
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+
+from pomcorn import Component, ListComponent, Page, locators
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <head><title>Shop</title></head>
+  <body>
+    <nav id="navbar">
+      <a href="/help">Help</a>
+      <a href="/admin" hidden>Admin</a>
+    </nav>
+    <ul class="products">
+      <li class="product">Apple <b>sale</b></li>
+      <li class="product">Cherry</li>
+    </ul>
+    <p id="banner" style="display: none">Sale!</p>
+    <form>
+      <input id="search" name="q">
+      <input id="agree" type="checkbox">
+    </form>
+  </body>
+</html>
+"""
+
+HELP_HTML = "<html><body><h1>Help</h1></body></html>"
+
+
+class Navbar(Component[Page]):
+    """Navigation bar of shop."""
+
+    base_locator = locators.IdLocator("navbar")
+
+    @property
+    def help_link(self) -> locators.XPathLocator:
+        """Get locator of link to help page."""
+        return self.base_locator // locators.ElementWithTextLocator("Help")
+
+
+class Product(Component[Page]):
+    """Product from list."""
+
+
+class ProductList(ListComponent[Product, Page]):
+    """List of products."""
+
+    base_locator = locators.ClassLocator("products")
+    relative_item_locator = locators.ClassLocator("product")
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page opened."""
+    return StaticWebDriver(
+        url=APP_ROOT,
+        pages={APP_ROOT: INDEX_HTML, f"{APP_ROOT}help": HELP_HTML},
+    )
+
+
+@pytest.fixture
+def page(webdriver: StaticWebDriver) -> Page:
+    """Prepare page with static webdriver."""
+    return Page(webdriver, app_root=APP_ROOT)
+
+
+def test_elements_are_found_in_static_html(page: Page) -> None:
+    """Check that components and elements work against static HTML."""
+    navbar = Navbar(page)
+
+    assert page.webdriver.title == "Shop"
+    assert navbar.init_element(locator=navbar.help_link).is_displayed
+    assert not navbar.init_element(
+        relative_locator=locators.ElementWithTextLocator("Admin"),
+    ).is_displayed
+
+
+def test_list_component_items_are_found(page: Page) -> None:
+    """Check that items and their text are taken from markup."""
+    products = ProductList(page)
+
+    assert products.count == 2
+    assert [product.body.get_text() for product in products.all] == [
+        "Apple sale",
+        "Cherry",
+    ]
+
+
+def test_hidden_element_wait_times_out(page: Page) -> None:
+    """Check that waits check visibility by markup."""
+    banner = locators.IdLocator("banner")
+    page.wait_until_locator_invisible(banner)
+    with pytest.raises(TimeoutException):
+        page.wait_until_locator_visible(banner, timeout=0.01)
+
+
+def test_form_fields_are_filled(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that typing, clicks and form filling change document."""
+    search = page.init_element(locators.IdLocator("search"))
+    search.fill("pears")
+    page.init_element(locators.IdLocator("agree")).click()
+
+    assert search.get_value() == "pears"
+    assert webdriver.find_element(By.ID, "agree").is_selected()
+
+    page.fill_form({locators.IdLocator("search"): "plums"})
+    assert search.get_value() == "plums"
+
+
+def test_link_click_opens_registered_page(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check navigation and staleness of elements of previous page."""
+    link = webdriver.find_element(By.LINK_TEXT, "Help")
+    link.click()
+
+    assert webdriver.current_url == f"{APP_ROOT}help"
+    assert webdriver.find_element(By.TAG_NAME, "h1").text == "Help"
+    with pytest.raises(StaleElementReferenceException):
+        link.click()
+    with pytest.raises(NoSuchElementException):
+        webdriver.find_element(By.ID, "navbar")
+
+
+def test_text_of_elements_is_visible_text(webdriver: StaticWebDriver) -> None:
+    """Check that text is split into lines like in browsers."""
+    webdriver.load(
+        """
+        <div id="card">
+          <h2>Apple</h2>Fresh <b>red</b>
+          apples<br>From
+          <span hidden>secret</span> farm
+          <table><tr><td>Price</td><td>10</td></tr></table>
+        </div>
+        """,
+    )
+
+    assert webdriver.find_element(By.ID, "card").text == (
+        "Apple\nFresh red apples\nFrom farm\nPrice 10"
+    )
@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pomcorn import Component, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+from pomcorn.tracing import Tracer, get_active_tracer, span
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <body>
+    <nav id="navbar"><a href="/help">Help</a></nav>
+    <input id="search" name="q">
+  </body>
+</html>
+"""
+
+
+class Navbar(Component[Page]):
+    """Navigation bar of shop."""
+
+    base_locator = locators.IdLocator("navbar")
+
+
+class IndexPage(Page):
+    """Index page of shop."""
+
+    APP_ROOT = APP_ROOT
+
+    def check_page_is_loaded(self) -> bool:
+        """Check that navbar is present."""
+        return self.init_element(locators.IdLocator("navbar")).exists_in_dom
+
+    @property
+    def navbar(self) -> Navbar:
+        """Get navigation bar."""
+        return Navbar(self)
+
+    def search(self, query: str):
+        """Fill search input."""
+        self.init_element(locators.IdLocator("search")).fill(query)
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+def get_events(tracer: Tracer, name: str) -> list[dict[str, Any]]:
+    """Get recorded events with the name."""
+    return [event for event in tracer.get_events() if event["name"] == name]
+
+
+def contains(outer: dict[str, Any], inner: dict[str, Any]) -> bool:
+    """Check that span of `inner` event is inside span of `outer` one."""
+    return (
+        outer["ts"] <= inner["ts"]
+        and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    )
+
+
+def test_nested_spans(webdriver: StaticWebDriver):
+    """Check that page object activity is recorded as nested spans."""
+    with Tracer(webdriver) as tracer:
+        page = IndexPage.open(webdriver)
+        page.navbar  # noqa: B018
+        page.search("pomcorn")
+
+    (open_event,) = get_events(tracer, "IndexPage.open")
+    assert open_event["cat"] == "page"
+    assert open_event["args"] == {"url": APP_ROOT}
+    (init_event,) = get_events(tracer, "IndexPage.init")
+    (loaded_event,) = get_events(tracer, "IndexPage.wait_until_loaded")
+    assert contains(open_event, init_event)
+    assert contains(init_event, loaded_event)
+
+    (component_event,) = get_events(tracer, "Navbar.init")
+    assert component_event["cat"] == "component"
+    assert component_event["args"] == {
+        "view": "Navbar",
+        "locator": str(locators.IdLocator("navbar")),
+    }
+    (visible_event,) = get_events(
+        tracer,
+        "Navbar.wait_until_visible",
+    )
+    assert visible_event["cat"] == "wait"
+    assert contains(component_event, visible_event)
+
+    (fill_event,) = get_events(tracer, "PomcornElement.fill")
+    assert fill_event["cat"] == "action"
+    assert fill_event["args"] == {
+        "view": "IndexPage",
+        "locator": str(locators.IdLocator("search")),
+    }
+    (clear_event,) = get_events(tracer, "PomcornElement.clear")
+    assert contains(fill_event, clear_event)
+    commands = [
+        event["name"]
+        for event in tracer.get_events()
+        if event["cat"] == "command" and contains(fill_event, event)
+    ]
+    assert "sendKeysToElement" in commands
+
+
+def test_script_spans(webdriver: StaticWebDriver):
+    """Check that scripts are recorded with their beginning."""
+    with Tracer(webdriver) as tracer:
+        webdriver.execute_script("return   document.title;")
+
+    (event,) = get_events(tracer, "w3cExecuteScript")
+    assert event["cat"] == "script"
+    assert event["args"]["script"] == "return document.title;"
+
+
+def test_save(webdriver: StaticWebDriver, tmp_path: Path):
+    """Check that trace is saved in Chrome trace event format."""
+    with Tracer(webdriver) as tracer:
+        IndexPage.open(webdriver)
+    path = tmp_path / "trace.json"
+    tracer.save(path)
+
+    trace = json.loads(path.read_text())
+    assert trace["traceEvents"]
+    for event in trace["traceEvents"]:
+        assert event["ph"] == "X"
+        assert event["ts"] >= 0
+        assert event["dur"] >= 0
+        assert {"name", "cat", "pid", "tid", "args"} <= event.keys()
+
+
+def test_inactive_tracer(webdriver: StaticWebDriver):
+    """Check that nothing is recorded outside of tracer block."""
+    tracer = Tracer(webdriver)
+    with span("manual", "test"):
+        IndexPage.open(webdriver)
+    assert get_active_tracer() is None
+    assert tracer.get_events() == []
+
+
+def test_tracer_with_command_recorder(webdriver: StaticWebDriver):
+    """Check that tracer and command recorder can be used together."""
+    with CommandRecorder(webdriver) as recorder:
+        with Tracer(webdriver) as tracer:
+            IndexPage.open(webdriver)
+        count = recorder.count
+        webdriver.title  # noqa: B018
+
+    assert recorder.count == count + 1
+    assert len(get_events(tracer, "getTitle")) == 0
+    assert "execute" not in vars(webdriver)
@@ -0,0 +1,82 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pomcorn import Page, WaitPolicy
+from pomcorn.deadline import deadline, get_remaining_time
+
+
+def test_no_deadline() -> None:
+    """Check that there is no remaining time outside of deadline."""
+    assert get_remaining_time() is None
+
+
+def test_nested_deadline_cant_extend_outer_one() -> None:
+    """Check that nested deadline inherits the nearest deadline."""
+    with deadline(1):
+        with deadline(100):
+            remaining_time = get_remaining_time()
+            assert remaining_time is not None
+            assert remaining_time <= 1
+
+        with deadline(0.5):
+            remaining_time = get_remaining_time()
+            assert remaining_time is not None
+            assert remaining_time <= 0.5
+
+    assert get_remaining_time() is None
+
+
+def test_wait_timeout_is_limited_by_deadline(fake_page: Page) -> None:
+    """Check that waits inside deadline take no more than remaining time."""
+    assert fake_page.get_wait()._timeout == fake_page.wait_timeout
+    with fake_page.deadline(1):
+        assert fake_page.get_wait()._timeout <= 1
+        assert fake_page.get_wait(timeout=10)._timeout <= 1
+        # Wait with smaller timeout isn't changed
+        assert fake_page.get_wait(timeout=0.5)._timeout == 0.5
+
+
+def test_policy_budget_deadline() -> None:
+    """Check that policy budget limits waits of block."""
+    policy = WaitPolicy(timeout=10, budget=2)
+    with policy.budget_deadline():
+        assert policy.get_wait(None)._timeout <= 2  # type: ignore
+    assert policy.get_wait(None)._timeout == 10  # type: ignore
+
+
+def test_passed_deadline_checks_condition_once(fake_page: Page) -> None:
+    """Check that wait after passed deadline still checks condition."""
+    with fake_page.deadline(0.001):
+        wait = fake_page.get_wait()
+        assert wait.until(lambda _: True)
+        with pytest.raises(TimeoutException, match="Not met"):
+            wait.until(lambda _: False, message="Not met")
+
+
+class BudgetPage(Page):
+    """Page whose initialization is limited by budget."""
+
+    wait_policy = WaitPolicy(timeout=5, budget=0.5)
+
+
+class FakeWebDriver:
+    """Fake webdriver which opens any URL."""
+
+    def get(self, url: str) -> None:
+        """Open URL."""
+
+
+def test_page_opened_under_budget_keeps_full_wait() -> None:
+    """Check that wait of page isn't limited by budget of its opening."""
+    page = BudgetPage.open(FakeWebDriver(), app_root="None")  # type: ignore
+
+    assert page.wait._timeout == 5
+
+
+def test_view_created_inside_deadline_keeps_full_wait() -> None:
+    """Check that deadline limits wait of view only inside the block."""
+    with deadline(0.2):
+        page = Page(webdriver=None, app_root="None")  # type: ignore
+        assert page.wait._timeout <= 0.2
+
+    assert page.wait._timeout == page.wait_timeout
@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+)
+
+from pomcorn import Page, WaitPolicy, locators, scripts
+from pomcorn.diagnostics import WaitDiagnostics
+
+
+class DiagnosticsWebDriver:
+    """Fake webdriver which counts requests of current URL."""
+
+    def __init__(self, url: str = "https://example.com/") -> None:
+        self.url = url
+        self.url_requests = 0
+        self.executed_scripts: list[tuple[str, tuple[Any, ...]]] = []
+        self.screenshots: list[str] = []
+
+    @property
+    def current_url(self) -> str:
+        self.url_requests += 1
+        return self.url
+
+    def execute_script(self, script: str, *args) -> str:
+        self.executed_scripts.append((script, args))
+        return "<div id='submit'>"
+
+    def save_screenshot(self, filename: str) -> bool:
+        self.screenshots.append(filename)
+        return True
+
+    def find_element(self, *args) -> Any:
+        raise NoSuchElementException
+
+
+def init_page(
+    webdriver: DiagnosticsWebDriver,
+    diagnostics: WaitDiagnostics | None = None,
+) -> Page:
+    """Prepare page with diagnostics and short timeout."""
+    page = Page(webdriver=webdriver, app_root="None")  # type: ignore
+    page.wait_policy = WaitPolicy(
+        timeout=0.05,
+        diagnostics=diagnostics or WaitDiagnostics(),
+    )
+    return page
+
+
+def test_successful_wait_does_not_collect_diagnostics() -> None:
+    """Check that successful wait doesn't request current URL for message."""
+    webdriver = DiagnosticsWebDriver()
+    page = init_page(webdriver)
+
+    page.wait_until_url_contains("example")
+
+    # The only request is made by the wait condition itself
+    assert webdriver.url_requests == 1
+
+
+def test_timed_out_wait_collects_diagnostics(tmp_path: Path) -> None:
+    """Check that diagnostics are added to message of timed out wait."""
+    webdriver = DiagnosticsWebDriver()
+    page = init_page(
+        webdriver,
+        WaitDiagnostics(dom_excerpt_length=100, screenshots_dir=tmp_path),
+    )
+
+    locator = locators.IdLocator("submit")
+    with pytest.raises(TimeoutException) as error:
+        page.wait_until_locator_visible(locator)
+
+    assert "Unable to locate" in str(error.value)
+    assert "Current URL: `https://example.com/`" in str(error.value)
+    assert "DOM excerpt: `<div id='submit'>`" in str(error.value)
+    assert f"Screenshot: `{tmp_path}" in str(error.value)
+    assert webdriver.executed_scripts == [
+        (scripts.DOM_EXCERPT, (*locator.get_search_args(), 100)),
+    ]
+    assert len(webdriver.screenshots) == 1
+
+
+def test_diagnostics_can_be_disabled() -> None:
+    """Check that URL isn't requested if it's disabled in diagnostics."""
+    webdriver = DiagnosticsWebDriver()
+    page = init_page(webdriver, WaitDiagnostics(include_url=False))
+
+    with pytest.raises(TimeoutException) as error:
+        page.wait_until_url_contains("pypi")
+
+    assert "Current URL" not in str(error.value)
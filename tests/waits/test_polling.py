@@ -0,0 +1,161 @@
+import time
+from collections.abc import Iterator
+from itertools import islice
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pomcorn import Page
+from pomcorn.polling import (
+    ExponentialPolling,
+    FixedPolling,
+    PomcornWait,
+    WaitStats,
+)
+
+
+def test_exponential_polling_delays() -> None:
+    """Check that delays grow exponentially up to max delay."""
+    polling = ExponentialPolling(
+        first_delay=0.01,
+        factor=3,
+        max_delay=0.2,
+        jitter=0,
+    )
+    delays = list(islice(polling.get_delays(), 5))
+    assert delays == pytest.approx([0.01, 0.03, 0.09, 0.2, 0.2])
+
+
+def test_exponential_polling_jitter() -> None:
+    """Check that delays are changed by no more than jitter share."""
+    polling = ExponentialPolling(first_delay=0.1, max_delay=0.1, jitter=0.2)
+    for delay in islice(polling.get_delays(), 100):
+        assert 0.08 <= delay <= 0.12
+
+
+def test_wait_counts_polls() -> None:
+    """Check that wait counts condition checks and reports them to stats."""
+    stats = WaitStats()
+    wait = PomcornWait(
+        driver=None,  # type: ignore
+        timeout=1,
+        polling=FixedPolling(0.001),
+        stats=stats,
+    )
+    checks = iter([False, False, "value"])
+
+    assert wait.until(lambda _: next(checks)) == "value"
+    assert stats.waits == 1
+    assert stats.polls == 3
+    assert stats.records[0].is_successful
+
+
+def test_wait_timeout_is_recorded() -> None:
+    """Check that timed out wait is reported to stats too."""
+    stats = WaitStats()
+    wait = PomcornWait(
+        driver=None,  # type: ignore
+        timeout=0.05,
+        polling=FixedPolling(0.01),
+        stats=stats,
+    )
+    with pytest.raises(TimeoutException, match="Not met"):
+        wait.until(lambda _: False, message="Not met")
+
+    assert stats.waits == 1
+    assert stats.polls > 1
+    assert not stats.records[0].is_successful
+
+
+def test_wait_until_not() -> None:
+    """Check that `until_not` waits until value becomes falsy."""
+    stats = WaitStats()
+    wait = PomcornWait(
+        driver=None,  # type: ignore
+        timeout=1,
+        polling=FixedPolling(0.001),
+        stats=stats,
+    )
+    checks = iter([True, 0])
+
+    assert wait.until_not(lambda _: next(checks)) == 0
+    assert stats.records[0].polls == 2
+
+
+def test_nested_waits_count_own_polls() -> None:
+    """Check that nested wait doesn't change polls of outer shared wait."""
+    stats = WaitStats()
+    wait = PomcornWait(
+        driver=None,  # type: ignore
+        timeout=1,
+        polling=FixedPolling(0.001),
+        stats=stats,
+    )
+    outer_checks = iter([False, False, False, True])
+
+    def outer_condition(_: object) -> bool:
+        # Inner wait uses the same instance and succeeds on the first check
+        wait.until(lambda _: True)
+        return next(outer_checks)
+
+    assert wait.until(outer_condition)
+    assert [record.polls for record in stats.records] == [1, 1, 1, 1, 4]
+
+
+def test_nested_waits_duration_is_counted_once() -> None:
+    """Check that duration of nested waits isn't added to total duration."""
+    stats = WaitStats()
+    wait = PomcornWait(
+        driver=None,  # type: ignore
+        timeout=1,
+        polling=FixedPolling(0.001),
+        stats=stats,
+    )
+
+    def slow_condition(_: object) -> bool:
+        time.sleep(0.05)
+        return True
+
+    def outer_condition(_: object) -> bool:
+        return wait.until(slow_condition)
+
+    assert wait.until(outer_condition)
+    inner_record, outer_record = stats.records
+    assert inner_record.is_nested
+    assert not outer_record.is_nested
+    assert stats.duration == outer_record.duration
+    assert stats.waits == 2
+
+
+class RecordingPolling(FixedPolling):
+    """Fixed polling which remembers delays it provided."""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(interval)
+        self.delays: list[float] = []
+
+    def get_delays(self) -> Iterator[float]:
+        for delay in super().get_delays():
+            self.delays.append(delay)
+            yield delay
+
+
+class UrlWebDriver:
+    """Fake webdriver whose URL changes after a few checks."""
+
+    def __init__(self) -> None:
+        self.urls = iter(["/", "/", "/done"])
+
+    @property
+    def current_url(self) -> str:
+        return next(self.urls)
+
+
+def test_wait_helper_uses_passed_polling() -> None:
+    """Check that polling strategy can be passed to wait helpers."""
+    page = Page(webdriver=UrlWebDriver(), app_root="None")  # type: ignore
+    polling = RecordingPolling(0.001)
+
+    page.wait_until_url_contains("done", polling=polling)
+
+    assert polling.delays == [0.001, 0.001]
@@ -0,0 +1,40 @@
+from pomcorn import Component, Page, WaitPolicy, locators
+
+
+class SlowPage(Page):
+    """Page with overridden wait policy."""
+
+    wait_policy = WaitPolicy(timeout=10, poll_frequency=0.05)
+
+
+def test_component_shares_wait_with_page(fake_page: Page) -> None:
+    """Check that component uses policy and default wait of its page."""
+    component = Component(
+        fake_page,
+        base_locator=locators.XPathLocator("//div"),
+        wait_until_visible=False,
+    )
+    assert component.wait_policy is fake_page.wait_policy
+    assert component.wait is fake_page.wait
+    assert component.poll_frequency == fake_page.poll_frequency == 0.01
+
+
+def test_pages_with_same_policy_share_wait() -> None:
+    """Check that policy set as attribute is applied to all pages."""
+    first_page = SlowPage(webdriver=None, app_root="None")  # type: ignore
+    second_page = SlowPage(webdriver=None, app_root="None")  # type: ignore
+
+    assert first_page.wait is second_page.wait
+    assert first_page.wait._timeout == 10
+    assert first_page.wait._poll == 0.05
+
+
+def test_init_arguments_override_policy() -> None:
+    """Check that page init arguments override only specified settings."""
+    page = SlowPage(
+        webdriver=None,  # type: ignore
+        app_root="None",
+        wait_timeout=3,
+    )
+    assert page.wait_policy == WaitPolicy(timeout=3, poll_frequency=0.05)
+    assert page.wait is not SlowPage.wait_policy.get_wait(None)  # type: ignore
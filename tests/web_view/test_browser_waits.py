@@ -0,0 +1,110 @@
+import pkgutil
+from typing import Any
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from pomcorn import Page, locators, scripts
+
+
+class VisibleWebElement:
+    """Fake WebElement which is always visible."""
+
+    def is_displayed(self) -> bool:
+        return True
+
+
+class BrowserWaitWebDriver:
+    """Fake webdriver which returns prepared result of script."""
+
+    current_url = "https://example.com/"
+
+    def __init__(self, result: Any) -> None:
+        self.result = result
+        self.executed_scripts: list[tuple[str, tuple[Any, ...]]] = []
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        self.executed_scripts.append((script, args))
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    def find_element(self, *args) -> VisibleWebElement:
+        return VisibleWebElement()
+
+
+def init_page(webdriver: BrowserWaitWebDriver) -> Page:
+    """Prepare page which waits inside the browser."""
+    return Page(
+        webdriver=webdriver,  # type: ignore
+        app_root="None",
+        wait_timeout=2,
+        wait_in_browser=True,
+    )
+
+
+def test_wait_is_done_via_single_script() -> None:
+    """Check that condition is checked inside the browser."""
+    webdriver = BrowserWaitWebDriver(result=[True, "element"])
+    page = init_page(webdriver)
+
+    web_element = page.wait_until_clickable(locators.IdLocator("submit"))
+
+    assert web_element == "element"
+    assert webdriver.executed_scripts == [
+        (
+            scripts.WAIT_FOR_CONDITION,
+            (
+                "clickable",
+                "css selector",
+                '[id="submit"]',
+                None,
+                "",
+                2000,
+            ),
+        ),
+    ]
+
+
+def test_browser_wait_timeout() -> None:
+    """Check that timeout of script is raised as `TimeoutException`."""
+    page = init_page(BrowserWaitWebDriver(result=[False, None]))
+    with pytest.raises(TimeoutException, match="Unable to locate"):
+        page.wait_until_locator_visible(locators.IdLocator("submit"))
+
+
+def test_failed_browser_wait_continues_on_client() -> None:
+    """Check that wait continues on the client side if script fails."""
+    webdriver = BrowserWaitWebDriver(
+        result=JavascriptException("document unloaded"),
+    )
+    page = init_page(webdriver)
+
+    page.wait_until_locator_visible(locators.IdLocator("submit"))
+
+    assert len(webdriver.executed_scripts) == 1
+
+
+@pytest.mark.parametrize(
+    "script",
+    [
+        scripts.WAIT_FOR_CONDITION,
+        scripts.ELEMENTS_SNAPSHOT,
+        scripts.EXTRACT_COLUMNS,
+        scripts.PREFETCH_ELEMENTS,
+    ],
+)
+def test_browser_visibility_matches_is_displayed(script: str) -> None:
+    """Check that scripts check visibility by Selenium's `isDisplayed` atom.
+
+    So zero-size element with visible children is visible in the browser as
+    well as in the wait through `WebElement.is_displayed`.
+
+    """
+    is_displayed = pkgutil.get_data(
+        "selenium.webdriver.remote",
+        "isDisplayed.js",
+    )
+    assert is_displayed
+    assert f"const isDisplayed = {is_displayed.decode()};" in script
+    assert "const isVisible = (element) => isDisplayed(element);" in script
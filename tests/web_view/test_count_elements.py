@@ -0,0 +1,102 @@
+import pytest
+
+from pomcorn import Component, ListComponent, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = f"""
+<html>
+  <body>
+    <table id="products">
+      {"".join(f"<tr><td>Product {index}</td></tr>" for index in range(50))}
+    </table>
+    <a href="/help">Help</a>
+  </body>
+</html>
+"""
+
+
+class Products(ListComponent[Component[Page], Page]):
+    """Table of products."""
+
+    base_locator = locators.IdLocator("products")
+    relative_item_locator = locators.TagNameLocator("tr")
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+@pytest.fixture
+def page(webdriver: StaticWebDriver) -> Page:
+    """Prepare page opened in static webdriver."""
+    webdriver.get(APP_ROOT)
+    return Page(webdriver=webdriver, app_root=APP_ROOT)
+
+
+def get_commands(recorder: CommandRecorder) -> list[str]:
+    """Get names of recorded commands."""
+    return [record.command for record in recorder.records]
+
+
+def test_list_is_counted_in_browser(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that list items are counted by single script call."""
+    products = Products(page)
+
+    with CommandRecorder(webdriver) as recorder:
+        assert products.count == 50
+        assert len(products.filter(text="Product 4")) == 11
+
+    assert get_commands(recorder) == ["w3cExecuteScript"] * 2
+
+
+def test_existence_is_checked_in_browser(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that existence of element is checked by single script call."""
+    with CommandRecorder(webdriver) as recorder:
+        assert page.init_element(locators.TagNameLocator("td")).exists_in_dom
+        assert not page.init_element(locators.IdLocator("cart")).exists_in_dom
+
+    assert get_commands(recorder) == ["w3cExecuteScript"] * 2
+
+
+def test_locators_are_prepared_by_count(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check that elements aren't looked for to prepare their locators."""
+    locator = locators.TagNameLocator("td")
+
+    with CommandRecorder(webdriver) as recorder:
+        elements = page.init_elements(locator)
+        items_locators = page.iter_locators(locator)
+
+    assert get_commands(recorder) == ["w3cExecuteScript"] * 2
+    assert len(elements) == len(items_locators) == 50
+    assert items_locators[-1].query == "(//td)[50]"
+
+
+def test_not_script_locators_are_counted_by_find_elements(
+    webdriver: StaticWebDriver,
+    page: Page,
+) -> None:
+    """Check fallback for locators which can't be evaluated by scripts."""
+    locator = locators.Locator("link text", "Help")
+
+    with CommandRecorder(webdriver) as recorder:
+        assert page._count_elements(locator) == 1
+
+    assert get_commands(recorder) == ["findElements"]
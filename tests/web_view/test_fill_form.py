@@ -0,0 +1,56 @@
+from typing import Any
+
+from pomcorn import Page, locators, scripts
+from pomcorn.element import PomcornElement
+from pomcorn.web_view import FillResult
+
+
+class FormWebDriver:
+    """Fake webdriver which returns prepared statuses of fields filling."""
+
+    def __init__(self, statuses: list[str]) -> None:
+        self.statuses = statuses
+        self.executed_scripts: list[tuple[str, tuple[Any, ...]]] = []
+
+    def execute_script(self, script: str, *args) -> list[str]:
+        self.executed_scripts.append((script, args))
+        return self.statuses
+
+
+class FakeElement(PomcornElement[locators.XPathLocator]):
+    """Element which remembers filled text instead of sending keys."""
+
+    filled_text: str | None = None
+
+    def fill(self, text: str, only_visible: bool = True, clear: bool = True):
+        self.filled_text = text
+
+
+def test_fill_form_via_single_script() -> None:
+    """Check that fields are filled by script with fallback to keystrokes."""
+    webdriver = FormWebDriver(statuses=["filled", "not_editable"])
+    page = Page(webdriver=webdriver, app_root="None")  # type: ignore
+    email_locator = locators.NameLocator("email")
+    country_element = FakeElement(page, locators.NameLocator("country"))
+
+    results = page.fill_form({email_locator: "email", country_element: 1})
+
+    assert len(webdriver.executed_scripts) == 1
+    script, args = webdriver.executed_scripts[0]
+    assert script == scripts.FILL_FORM
+    assert args == (
+        [
+            ("css selector", '[name="email"]'),
+            ("css selector", '[name="country"]'),
+        ],
+        ["email", "1"],
+        True,
+    )
+    assert results == {
+        email_locator: FillResult(filled_by_script=True, fallback_reason=None),
+        country_element: FillResult(
+            filled_by_script=False,
+            fallback_reason="not_editable",
+        ),
+    }
+    assert country_element.filled_text == 1
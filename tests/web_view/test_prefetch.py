@@ -0,0 +1,187 @@
+from collections.abc import Callable
+
+import pytest
+
+from pomcorn import Component, Element, Page, locators
+from pomcorn.instrumentation import CommandRecorder
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+from pomcorn.static_driver import StaticWebDriver
+
+APP_ROOT = "https://shop.test/"
+
+INDEX_HTML = """
+<html>
+  <body>
+    <h1 id="title">Shop</h1>
+    <div id="cart">
+      <span class="total">10</span>
+      <button class="checkout">Checkout</button>
+    </div>
+    <div id="popup" style="display: none">Sale</div>
+  </body>
+</html>
+"""
+
+
+class Cart(Component[Page]):
+    """Cart which prefetches its elements."""
+
+    base_locator = locators.IdLocator("cart")
+    prefetch_elements = True
+
+    total = Element(relative_locator=locators.ClassLocator("total"))
+    checkout_button = Element(
+        relative_locator=locators.ClassLocator("checkout"),
+    )
+
+
+class IndexPage(Page):
+    """Index page which prefetches its elements."""
+
+    APP_ROOT = APP_ROOT
+    prefetch_elements = True
+
+    title = Element(locators.IdLocator("title"))
+    popup = Element(locators.IdLocator("popup"))
+    banner = Element(locators.IdLocator("banner"))
+
+
+@pytest.fixture
+def webdriver() -> StaticWebDriver:
+    """Prepare static webdriver with index page."""
+    return StaticWebDriver(pages={APP_ROOT: INDEX_HTML})
+
+
+def get_find_commands(recorder: CommandRecorder) -> list[str]:
+    """Get commands which look for elements."""
+    return [
+        record.command
+        for record in recorder.records
+        if record.command.startswith("find")
+    ]
+
+
+def test_page_elements_are_prefetched_via_single_script(
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that declared elements are fetched via single script call."""
+    with CommandRecorder(webdriver) as recorder:
+        page = IndexPage.open(webdriver)
+
+    scripts_calls = [
+        record for record in recorder.records if record.script is not None
+    ]
+    assert len(scripts_calls) == 1
+
+    with CommandRecorder(webdriver) as recorder:
+        assert page.title.get_text() == "Shop"
+        assert page.title.is_displayed
+        assert page.popup.exists_in_dom
+        assert not page.popup.is_displayed
+        assert not page.banner.exists_in_dom
+
+    assert recorder.records == []
+
+
+def test_prefetched_state_is_outdated_after_action(
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that elements are looked for again after page is changed."""
+    page = IndexPage.open(webdriver)
+
+    with CommandRecorder(webdriver) as recorder:
+        page.title.click()
+
+    # Prefetched WebElement is clicked without looking for it
+    assert get_find_commands(recorder) == []
+
+    with CommandRecorder(webdriver) as recorder:
+        assert page.title.get_text() == "Shop"
+
+    assert get_find_commands(recorder)
+
+
+def test_component_elements_are_prefetched(webdriver: StaticWebDriver) -> None:
+    """Check that component prefetches elements after it becomes visible."""
+    page = IndexPage.open(webdriver)
+
+    with CommandRecorder(webdriver) as recorder:
+        cart = Cart(page)
+
+    # Only body of component is looked for
+    assert len(get_find_commands(recorder)) == 1
+
+    with CommandRecorder(webdriver) as recorder:
+        assert cart.total.get_text() == "10"
+        assert cart.checkout_button.is_displayed
+
+    assert recorder.records == []
+
+
+def test_elements_are_not_prefetched_by_default(
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that prefetching is disabled by default."""
+
+    class NotPrefetchedPage(IndexPage):
+        prefetch_elements = False
+
+    page = NotPrefetchedPage.open(webdriver)
+
+    with CommandRecorder(webdriver) as recorder:
+        assert page.title.get_text() == "Shop"
+
+    assert get_find_commands(recorder)
+
+
+@pytest.mark.parametrize(
+    argnames="change_page",
+    argvalues=[
+        lambda page: page.navigate(APP_ROOT),
+        lambda page: page.navigate_relative("/"),
+        lambda page: page.click_on_page(),
+    ],
+    ids=["navigate", "navigate_relative", "click_on_page"],
+)
+def test_prefetched_state_is_outdated_after_page_change(
+    webdriver: StaticWebDriver,
+    change_page: Callable[[IndexPage], None],
+) -> None:
+    """Check that page methods which change document outdate prefetching."""
+    page = IndexPage.open(webdriver)
+    change_page(page)
+
+    with CommandRecorder(webdriver) as recorder:
+        assert page.title.get_text() == "Shop"
+
+    assert get_find_commands(recorder)
+
+
+def test_elements_are_prefetched_again_after_refresh(
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that page prefetches elements of reloaded document."""
+    page = IndexPage.open(webdriver)
+    page.refresh()
+
+    with CommandRecorder(webdriver) as recorder:
+        # WebElements of the document before refresh are stale, so element
+        # would be looked for again if it wasn't prefetched after refresh
+        page.title.click()
+
+    assert get_find_commands(recorder) == []
+
+
+def test_prefetched_state_is_not_used_by_waits(
+    webdriver: StaticWebDriver,
+) -> None:
+    """Check that wait conditions look for elements in the browser."""
+    page = IndexPage.open(webdriver)
+
+    with CommandRecorder(webdriver) as recorder:
+        page.get_wait().until(lambda _: page.title.is_displayed)
+
+    assert get_find_commands(recorder)